@@ -24,21 +24,44 @@ logger.info("Initializing pysui")
 if sys.version_info < (3, 10):
     raise EnvironmentError("Python 3.10 or above is required")
 
-# Convenience imports
-
-from pysui.sui.sui_types.address import SuiAddress
-from pysui.sui.sui_types.scalars import ObjectID
-from pysui.sui.sui_config import SuiConfig
-from pysui.sui.sui_clients.common import (
-    PreExecutionResult,
-    SuiRpcResult,
-    handle_result,
+# Convenience imports, loaded on first use
+
+from typing import TYPE_CHECKING
+from pysui._lazy import lazy_attributes
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    globals(),
+    {
+        "SuiAddress": ("pysui.sui.sui_types.address", "SuiAddress"),
+        "ObjectID": ("pysui.sui.sui_types.scalars", "ObjectID"),
+        "SuiConfig": ("pysui.sui.sui_config", "SuiConfig"),
+        "PreExecutionResult": ("pysui.sui.sui_clients.common", "PreExecutionResult"),
+        "SuiRpcResult": ("pysui.sui.sui_clients.common", "SuiRpcResult"),
+        "handle_result": ("pysui.sui.sui_clients.common", "handle_result"),
+        "SyncClient": ("pysui.sui.sui_clients.sync_client", "SuiClient"),
+        "AsyncClient": ("pysui.sui.sui_clients.async_client", "SuiClient"),
+        "Subscribe": ("pysui.sui.sui_clients.subscribe", "SuiClient"),
+        "PysuiConfiguration": ("pysui.sui.sui_pgql.config", "PysuiConfiguration"),
+        "SyncGqlClient": ("pysui.sui.sui_pgql.pgql_clients", "SuiGQLClient"),
+        "AsyncGqlClient": ("pysui.sui.sui_pgql.pgql_clients", "AsyncSuiGQLClient"),
+    },
 )
 
-from pysui.sui.sui_clients.sync_client import SuiClient as SyncClient
-from pysui.sui.sui_clients.async_client import SuiClient as AsyncClient
-from pysui.sui.sui_clients.subscribe import SuiClient as Subscribe
-from pysui.sui.sui_pgql.config import PysuiConfiguration
+if TYPE_CHECKING:
+    from pysui.sui.sui_types.address import SuiAddress
+    from pysui.sui.sui_types.scalars import ObjectID
+    from pysui.sui.sui_config import SuiConfig
+    from pysui.sui.sui_clients.common import (
+        PreExecutionResult,
+        SuiRpcResult,
+        handle_result,
+    )
+
+    from pysui.sui.sui_clients.sync_client import SuiClient as SyncClient
+    from pysui.sui.sui_clients.async_client import SuiClient as AsyncClient
+    from pysui.sui.sui_clients.subscribe import SuiClient as Subscribe
+    from pysui.sui.sui_pgql.config import PysuiConfiguration
 
-from pysui.sui.sui_pgql.pgql_clients import SuiGQLClient as SyncGqlClient
-from pysui.sui.sui_pgql.pgql_clients import AsyncSuiGQLClient as AsyncGqlClient
+    from pysui.sui.sui_pgql.pgql_clients import SuiGQLClient as SyncGqlClient
+    from pysui.sui.sui_pgql.pgql_clients import AsyncSuiGQLClient as AsyncGqlClient
@@ -0,0 +1,54 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""On demand package attribute loading (PEP 562)."""
+
+import importlib
+import types
+from typing import Any, Callable
+
+
+def lazy_attributes(
+    package: str, package_globals: dict, attributes: dict[str, tuple[str, str]]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Build a package's module __getattr__ and __dir__.
+
+    Each attribute is imported from its module on first access and then cached
+    in the package namespace, later accesses are plain attribute lookups. The
+    package __all__ is set to its current public names and the attributes so star
+    imports keep exporting them.
+
+    :param package: The package __name__
+    :type package: str
+    :param package_globals: The package globals()
+    :type package_globals: dict
+    :param attributes: Attribute name to (module name, name in module)
+    :type attributes: dict[str, tuple[str, str]]
+    :return: The __getattr__ and __dir__ functions
+    :rtype: tuple[Callable[[str], Any], Callable[[], list[str]]]
+    """
+    package_globals["__all__"] = [
+        name
+        for name, value in package_globals.items()
+        if not name.startswith("_")
+        and not isinstance(value, types.ModuleType)
+        and name not in ("TYPE_CHECKING", "lazy_attributes")
+    ] + list(attributes)
+
+    def __getattr__(name: str) -> Any:
+        try:
+            module_name, attr_name = attributes[name]
+        except KeyError:
+            raise AttributeError(
+                f"module {package!r} has no attribute {name!r}"
+            ) from None
+        value = getattr(importlib.import_module(module_name), attr_name)
+        package_globals[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(package_globals) | set(attributes))
+
+    return __getattr__, __dir__
@@ -11,8 +11,10 @@
 # -*- coding: utf-8 -*-
 
 """Client Configuration Abstraction."""
+import threading
 from abc import ABC, abstractmethod
-from typing import Union, Optional, Any
+from concurrent.futures import Future
+from typing import Callable, Union, Optional, Any
 from enum import IntEnum
 from base64 import b64encode
 from deprecated.sphinx import versionadded, versionchanged
@@ -50,20 +52,83 @@ class ClientConfiguration(ABC):
         self._current_alias_file = alias_file
         self._configuration_path = config_path
         self._cref_matrix: list[list[dict]] = []
+        self._cref_index: list[dict[str, int]] = []
+        self._cref_shape: tuple[int, int] = (0, 0)
+
+    @property
+    def _cref_matrix(self) -> list[list[dict]]:
+        """_cref_matrix Return the cross reference matrix, waiting on a background load.
+
+        :return: Cross reference matrix [{alias:publickeystring},{keystring:KeyPair},{publickeystring:keystring},{str:SuiAddress}]
+        :rtype: list[list[dict]]
+        """
+        pending: Optional[tuple[threading.Thread, Future]] = self.__dict__.get(
+            "_cref_pending"
+        )
+        if pending and threading.current_thread() is not pending[0]:
+            pending[1].result()
+        return self.__dict__["_cref_rows"]
+
+    @_cref_matrix.setter
+    def _cref_matrix(self, matrix: list[list[dict]]) -> None:
+        """_cref_matrix Set the cross reference matrix."""
+        self.__dict__["_cref_rows"] = matrix
+
+    @versionadded(version="0.71.0", reason="Lazy keystore loading")
+    def _cref_load_background(self, loader: Callable[[], None]) -> None:
+        """_cref_load_background Populate the cross reference matrix on a background thread.
+
+        Any access to the matrix from other threads blocks until loader completes,
+        loader exceptions are raised to those callers.
+
+        :param loader: Callable that sets the matrix (and aliases)
+        :type loader: Callable[[], None]
+        """
+        future: Future = Future()
+
+        def _load():
+            try:
+                loader()
+                future.set_result(None)
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                future.set_exception(exc)
+
+        thread = threading.Thread(target=_load, name="pysui-keystore", daemon=True)
+        self.__dict__["_cref_pending"] = (thread, future)
+        thread.start()
+
+    def _cref_reindex(self) -> None:
+        """_cref_reindex Force the cross reference indexes to be rebuilt on next lookup."""
+        self._cref_shape = (0, 0)
+
+    def _cref_indexes(self) -> list[dict[str, int]]:
+        """_cref_indexes Return the per CrefType value to row indexes.
+
+        The indexes are rebuilt when the matrix is replaced or rows are added or removed.
+
+        :return: A value to row index dict for ALIAS, KPAIR, PKEY and ADDY
+        :rtype: list[dict[str, int]]
+        """
+        shape = (id(self._cref_matrix), len(self._cref_matrix))
+        if getattr(self, "_cref_shape", None) != shape:
+            indexes: list[dict[str, int]] = [{}, {}, {}, {}]
+            # Reversed so the first row holding a value wins, as with a scan
+            for index in range(len(self._cref_matrix) - 1, -1, -1):
+                for ctype, entry in enumerate(self._cref_matrix[index]):
+                    for value in entry:
+                        indexes[ctype][value] = index
+            self._cref_index = indexes
+            self._cref_shape = shape
+        return self._cref_index
 
     def _cref_result_for(
         self, value: str, vin: CrefType, vout: CrefType
     ) -> Union[int, Any]:
         """."""
-        result = None
-        for index, mrow in enumerate(self._cref_matrix):
-            if value in mrow[vin]:
-                if vout == CrefType.INDEX:
-                    result = index
-                else:
-                    result = list(mrow[vout].values())[0]
-                break
-        return result
+        index = self._cref_indexes()[vin].get(value)
+        if index is None or vout == CrefType.INDEX:
+            return index
+        return next(iter(self._cref_matrix[index][vout].values()))
 
     def _get_cref_value(
         self, value: str, vin: CrefType, vout: CrefType
@@ -146,6 +211,7 @@ class ClientConfiguration(ABC):
                 raise ValueError(
                     f"Aliases count {len(aliases)} does not match address/key count {len(self._cref_matrix)}"
                 )
+            self._cref_reindex()
         # otherwise if we have keys we can gen aliases (scales to any size)
         elif self._cref_matrix:
             crlen = len(self._cref_matrix)
@@ -159,6 +225,7 @@ class ClientConfiguration(ABC):
                 at_row[CrefType.ALIAS] = {
                     accumer[index]: next(iter(at_row[CrefType.PKEY]))
                 }
+            self._cref_reindex()
 
     def _replace_alias_key(self, row_index: int, new_key: str) -> str:
         """_replace_alias_key Replaces the alias key (rename) at cref row index.
@@ -173,7 +240,11 @@ class ClientConfiguration(ABC):
         cref_row = self._cref_matrix[row_index]
         old_alias = cref_row[CrefType.ALIAS]
         cref_row[CrefType.ALIAS] = {new_key: list(old_alias.values())[0]}
-        return next(iter(old_alias))
+        old_key = next(iter(old_alias))
+        alias_index = self._cref_indexes()[CrefType.ALIAS]
+        alias_index.pop(old_key, None)
+        alias_index[new_key] = row_index
+        return old_key
 
     @property
     def _has_aliases(self) -> bool:
@@ -3,10 +3,15 @@
 """Sui / BFC address conversion."""
 
 import re, hashlib
+from functools import lru_cache
 
+_BFC_ADDRESS_PATTERN: re.Pattern = re.compile(r"^BFC[a-fA-F0-9]{64}[a-fA-F0-9]{4}$")
+_SUI_ADDRESS_PATTERN: re.Pattern = re.compile(r"^0[xX][a-fA-F0-9]{1,64}$")
 
+
+@lru_cache(maxsize=4096)
 def valid_bfc_address(bfc_addr: str) -> bool:
-    if re.match(r"^BFC[a-fA-F0-9]{64}[a-fA-F0-9]{4}$", bfc_addr):
+    if bfc_addr[:3] == "BFC" and _BFC_ADDRESS_PATTERN.match(bfc_addr):
         payload = bfc_addr[3:67].lower()
         h = hashlib.sha256()
         h.update(payload.encode("utf-8"))
@@ -15,20 +20,21 @@ def valid_bfc_address(bfc_addr: str) -> bool:
 
 
 def address_bfc_to_sui(bfc_addr: str) -> str:
-    if re.match(r"^BFC[a-fA-F0-9]{64}[a-fA-F0-9]{4}$", bfc_addr):
+    if _BFC_ADDRESS_PATTERN.match(bfc_addr):
         return "0x" + bfc_addr[3:67]
     raise ValueError(f"invalid bfc address: {bfc_addr}")
 
 
 def try_convert_to_sui_address(addr: str) -> str:
     """Try to convert address to bfc address. Return original address if not valid."""
-    if valid_bfc_address(addr):
+    if addr[:3] == "BFC" and valid_bfc_address(addr):
         return "0x" + addr[3:67]
     return addr
 
 
+@lru_cache(maxsize=4096)
 def try_convert_to_bfc_address(sui_addr: str) -> str:
-    if re.match(r"^0[xX][a-fA-F0-9]{1,64}$", sui_addr):
+    if _SUI_ADDRESS_PATTERN.match(sui_addr):
         without0x = sui_addr[2:]
         padding = 64 - len(without0x)
         if padding > 0:
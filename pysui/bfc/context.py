@@ -1,9 +1,16 @@
 # -*- coding: utf-8 -*-
 
-""" activate_bfc() to use BFC if connected to BFC network."""
+""" activate_bfc() to use BFC if connected to BFC network.
+
+The activation is the default for clients constructed without an explicit `bfc` argument,
+each client resolves its mode once at construction.
+"""
 
 __use_bfc = False
 
+# Sui coin types and their BFC equivalent
+BFC_COIN_TYPES: dict[str, str] = {"0x2::sui::SUI": "0x2::bfc::BFC"}
+
 
 def activate_bfc(active=True):
     global __use_bfc
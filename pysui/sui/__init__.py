@@ -15,9 +15,24 @@
 """Main pysui package. Contains imports of various module types."""
 
 
+from typing import TYPE_CHECKING
+from pysui._lazy import lazy_attributes
 from pysui.sui.sui_constants import *
 from pysui.sui.sui_excepts import SuiInvalidAddress
-from pysui.sui.sui_apidesc import SuiApi, build_api_descriptors
-from pysui.sui.sui_config import SuiConfig
 
-from pysui.sui.sui_txn_validator import validate_api
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    globals(),
+    {
+        "SuiApi": ("pysui.sui.sui_apidesc", "SuiApi"),
+        "build_api_descriptors": ("pysui.sui.sui_apidesc", "build_api_descriptors"),
+        "SuiConfig": ("pysui.sui.sui_config", "SuiConfig"),
+        "validate_api": ("pysui.sui.sui_txn_validator", "validate_api"),
+    },
+)
+
+if TYPE_CHECKING:
+    from pysui.sui.sui_apidesc import SuiApi, build_api_descriptors
+    from pysui.sui.sui_config import SuiConfig
+
+    from pysui.sui.sui_txn_validator import validate_api
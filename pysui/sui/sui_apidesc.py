@@ -242,15 +242,18 @@ def build_api_descriptors(indata: dict) -> tuple[str, dict, dict]:
 
         mdict: dict = {}
         schema_dict: dict = indata["result"]["components"]["schemas"]
+        apis: list[SuiApi] = []
         for rpc_api in indata["result"]["methods"]:
+            api_def = SuiApi.from_dict(rpc_api)
+            apis.append(api_def)
             ### BEGIN_BFC_PATCH
+            # Sui method name resolves to the BFC descriptor, whose name is sent
             rpc_name = rpc_api["name"]
-            print(f"--> {rpc_name}")
             if rpc_name.startswith("bfc_") or rpc_name.startswith("bfcx_"):
-                mdict[to_sui_rpc_method(rpc_name)] = SuiApi.from_dict(rpc_api)
+                mdict[to_sui_rpc_method(rpc_name)] = api_def
             ### END_BFC_PATCH
-            mdict[rpc_api["name"]] = SuiApi.from_dict(rpc_api)
-        for _api_name, api_def in mdict.items():
+            mdict[rpc_name] = api_def
+        for api_def in apis:
             for inparams in api_def.params:
                 tpath: list = []
                 inparams.schema = _resolve_param_type(
@@ -13,4 +13,14 @@
 
 """Sui Client package."""
 
-from pysui.sui.sui_clients.common import SuiRpcResult
+from typing import TYPE_CHECKING
+from pysui._lazy import lazy_attributes
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    globals(),
+    {"SuiRpcResult": ("pysui.sui.sui_clients.common", "SuiRpcResult")},
+)
+
+if TYPE_CHECKING:
+    from pysui.sui.sui_clients.common import SuiRpcResult
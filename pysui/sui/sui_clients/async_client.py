@@ -74,13 +74,18 @@ class SuiClient(ClientMixin):
     """Sui Asyncrhonous Client."""
 
     @versionchanged(version="0.28.0", reason="Added logging")
+    @versionchanged(version="0.71.0", reason="Added per client BFC mode")
     def __init__(
         self,
         config: SuiConfig,
         request_type: SuiRequestType = SuiRequestType.WAITFORLOCALEXECUTION,
+        bfc: Optional[bool] = None,
     ) -> None:
-        """Client initializer."""
-        super().__init__(config, request_type)
+        """Client initializer.
+
+        :param bfc: Connect in BFC mode, defaults to bfc.context activation
+        """
+        super().__init__(config, request_type, bfc)
         self._client = httpx.AsyncClient(
             http2=True,
             timeout=120.0,
@@ -289,6 +294,9 @@ class SuiClient(ClientMixin):
         :return: If successful, result contains an array of coins objects of coin_type found
         :rtype: SuiRpcResult
         """
+        ### BEGIN_BFC_PATCH
+        coin_type = self._coin_types.get(str(coin_type), coin_type)
+        ### END_BFC_PATCH
         result = await self.execute(
             GetCoinTypeBalance(owner=address, coin_type=coin_type)
         )
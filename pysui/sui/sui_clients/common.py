@@ -15,6 +15,7 @@
 
 import os
 import sys
+import base64
 import json
 from dataclasses import dataclass
 from abc import abstractmethod
@@ -46,10 +47,10 @@ from pysui.sui.sui_txresults.complex_tx import TransactionBytes
 from pysui.sui.sui_txresults.single_tx import ProtocolConfig
 from pysui.sui.sui_types.address import SuiAddress
 from pysui.sui.sui_types.collections import SuiArray
-from pysui.sui.sui_types.scalars import SuiTxBytes
+from pysui.sui.sui_types.scalars import SuiString, SuiTxBytes
 
 
-from pysui.bfc.context import is_bfc_activated
+from pysui.bfc.context import BFC_COIN_TYPES, is_bfc_activated
 from pysui.bfc.rpc_patch import to_bfc_rpc_method
 
 
@@ -161,13 +162,24 @@ class ClientMixin(Provider):
         version="0.28.0",
         reason="Added ProtcolConfig pre-fetch.",
     )
+    @versionchanged(
+        version="0.71.0",
+        reason="BFC mode is per client, defaults to bfc.context activation",
+    )
     def __init__(
         self,
         config: SuiConfig,
         request_type: SuiRequestType = SuiRequestType.WAITFORLOCALEXECUTION,
+        bfc: Optional[bool] = None,
     ) -> None:
         """Client initializer."""
         super().__init__(config)
+        ### BEGIN_BFC_PATCH
+        self._bfc: bool = is_bfc_activated() if bfc is None else bfc
+        self._coin_types: dict[str, SuiString] = (
+            {k: SuiString(v) for k, v in BFC_COIN_TYPES.items()} if self._bfc else {}
+        )
+        ### END_BFC_PATCH
         self._transport_open: bool = True
         self._client = None
         self._gas_price: int = None
@@ -187,10 +199,9 @@ class ClientMixin(Provider):
         builder_gas_price = GetReferenceGasPrice()
         builder_protocol = GetProtocolConfig()
         ### BEGIN_BFC_PATCH
-        if is_bfc_activated():
+        if self._bfc:
             builder_gas_price._method = to_bfc_rpc_method(builder_gas_price.method)
             builder_protocol._method = to_bfc_rpc_method(builder_protocol.method)
-            print(builder_gas_price._method)
         ### END_BFC_PATCH
 
         with httpx.Client(http2=True) as client:
@@ -224,12 +235,6 @@ class ClientMixin(Provider):
             self._protocol = ProtocolConfig.loader(rpc_protocol_result.json()["result"])
             self._gas_price = rpc_gas_result.json()["result"]
 
-        ### BEGIN_BFC_PATCH
-        if is_bfc_activated():
-            api_desc = json.loads(rpc_api_result.text.replace('"number"', '"integer"'))
-        else:
-            api_desc = json.loads(rpc_api_result.text)
-        ### END_BFC_PATCH
         (
             self._rpc_version,
             self._rpc_api,
@@ -251,11 +256,11 @@ class ClientMixin(Provider):
         """Validate SUI RPC API field alignment."""
         if not builder.method in self._rpc_api:
             raise SuiRpcApiNotAvailable(builder.method)
-        parm_results = validate_api(self._rpc_api[builder.method], builder)
+        api = self._rpc_api[builder.method]
+        parm_results = validate_api(api, builder)
         # parm_results = [y for x, y in validate_api(self._rpc_api[builder.method], builder)]
-        jblock = self._generate_data_block(
-            builder.data_dict, builder.method, parm_results
-        )
+        # The descriptor name is the node's method name (e.g. bfc_ on BFC nodes)
+        jblock = self._generate_data_block(builder.data_dict, api.name, parm_results)
         # print(f"{json.dumps(jblock, indent=2)}")
 
         return jblock
@@ -269,6 +274,12 @@ class ClientMixin(Provider):
         """Returns true/false on state of transport."""
         return self._transport_open
 
+    @versionadded(version="0.71.0", reason="BFC mode is per client")
+    @property
+    def is_bfc(self) -> bool:
+        """Returns true if client is in BFC mode."""
+        return self._bfc
+
     @property
     @abstractmethod
     def is_synchronous(self) -> bool:
@@ -345,6 +356,7 @@ class ClientMixin(Provider):
             return True
         return False
 
+    @versionchanged(version="0.71.0", reason="Signs decoded transaction bytes")
     def sign_for_execution(
         self,
         tx_bytes: SuiTxBytes,
@@ -372,9 +384,10 @@ class ClientMixin(Provider):
         if signers:
             for other_address in signers.array:
                 signers_list.append(self.config.keypair_for_address(other_address))
-        # Iterate and return signatures list
+        # Decode once and sign the bytes for each signer
+        raw_bytes = base64.b64decode(tx_bytes.tx_bytes)
         total_signed = SuiArray(
-            [kpair.new_sign_secure(tx_bytes.tx_bytes) for kpair in signers_list]
+            [kpair.new_sign_secure(raw_bytes) for kpair in signers_list]
         )
         return ExecuteTransaction(
             tx_bytes=tx_bytes,
@@ -14,11 +14,19 @@
 """Sui Asynchronous subscription module."""
 
 import asyncio
+import collections
+import dataclasses
 import logging
+import os
 import ssl
 import json
 import inspect
-from typing import Any, Callable, Optional, Union
+import tempfile
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from abc import ABC, abstractmethod
+from enum import IntEnum
+from typing import Any, Callable, Coroutine, Optional, Union
 import warnings
 from deprecated.sphinx import versionadded, versionchanged, deprecated
 from websockets.client import connect as ws_connect
@@ -46,22 +54,137 @@ if not logging.getLogger().handlers:
     logger.propagate = False
 
 
+@versionadded(version="0.71.0", reason="Pluggable subscription result retention.")
+class EventSink(ABC):
+    """Receives the data entries returned from a subscription handler."""
+
+    @abstractmethod
+    def add_entry(self, event_index: int, data: Any) -> None:
+        """Add a data entry."""
+
+    @property
+    def collected(self) -> dict[int, Any]:
+        """Get the retained entries, by default none are retained."""
+        return {}
+
+    def close(self) -> None:
+        """Release resources, called when the subscription ends."""
+
+
+@versionadded(version="0.71.0", reason="Pluggable subscription result retention.")
+class CollectAllSink(EventSink):
+    """Retains every entry, the default sink."""
+
+    def __init__(self):
+        """Initialize sink."""
+        self._collected: dict[int, Any] = {}
+
+    def add_entry(self, event_index: int, data: Any) -> None:
+        """Add a data entry."""
+        self._collected[event_index] = data
+
+    @property
+    def collected(self) -> dict[int, Any]:
+        """Get all entries."""
+        return self._collected
+
+
+@versionadded(version="0.71.0", reason="Pluggable subscription result retention.")
+class RingBufferSink(EventSink):
+    """Retains the most recent max_entries entries."""
+
+    def __init__(self, max_entries: int):
+        """Initialize sink.
+
+        :param max_entries: The count of most recent entries retained
+        :type max_entries: int
+        """
+        self._entries: collections.deque = collections.deque(maxlen=max_entries)
+
+    def add_entry(self, event_index: int, data: Any) -> None:
+        """Add a data entry, evicting the oldest if full."""
+        self._entries.append((event_index, data))
+
+    @property
+    def collected(self) -> dict[int, Any]:
+        """Get the most recent entries."""
+        return dict(self._entries)
+
+
+@versionadded(version="0.71.0", reason="Pluggable subscription result retention.")
+class CallbackSink(EventSink):
+    """Passes each entry to a callback and retains nothing."""
+
+    def __init__(self, callback: Callable[[int, Any], None]):
+        """Initialize sink.
+
+        :param callback: Called with the event index and data of each entry
+        :type callback: Callable[[int, Any], None]
+        """
+        self._callback = callback
+
+    def add_entry(self, event_index: int, data: Any) -> None:
+        """Pass a data entry to the callback."""
+        self._callback(event_index, data)
+
+
+@versionadded(version="0.71.0", reason="Pluggable subscription result retention.")
+class JsonlSink(EventSink):
+    """Appends each entry to a file as a JSON line and retains nothing.
+
+    Lines are {"index": event_index, "data": data}, data with a to_dict method
+    (e.g. pysui results) is written as its dict, otherwise unknown types as strings.
+    """
+
+    def __init__(self, file_path: str):
+        """Initialize sink.
+
+        :param file_path: The file appended to, created if needed
+        :type file_path: str
+        """
+        self._file = open(file_path, "a", encoding="utf8", buffering=1)
+
+    def add_entry(self, event_index: int, data: Any) -> None:
+        """Append a data entry."""
+        if hasattr(data, "to_dict"):
+            data = data.to_dict()
+        self._file.write(
+            json.dumps({"index": event_index, "data": data}, default=str) + "\n"
+        )
+
+    def close(self) -> None:
+        """Close the file."""
+        self._file.close()
+
+
 class EventData:
     """Container for subscription data returned from subscription handler."""
 
-    def __init__(self, tx_name: str):
-        """Initialie container."""
+    @versionchanged(version="0.71.0", reason="Entries are held by an EventSink.")
+    def __init__(self, tx_name: str, sink: Optional[EventSink] = None):
+        """Initialie container.
+
+        :param tx_name: The subscription task name
+        :type tx_name: str
+        :param sink: Where data entries go, defaults to None (CollectAllSink)
+        :type sink: Optional[EventSink], optional
+        """
         self._name = tx_name
-        self._collected: dict[int, Any] = {}
+        self._sink = sink or CollectAllSink()
 
     def add_entry(self, event_index: int, data: Any) -> None:
         """Add a data entry to container."""
-        self._collected[event_index] = data
+        self._sink.add_entry(event_index, data)
 
     @property
     def collected(self) -> dict[int, Any]:
         """Get the data collection dictionary."""
-        return self._collected
+        return self._sink.collected
+
+    @property
+    def sink(self) -> EventSink:
+        """Get the sink holding the data."""
+        return self._sink
 
     @property
     def name(self) -> str:
@@ -69,6 +192,444 @@ class EventData:
         return self._name
 
 
+class OverflowPolicy(IntEnum):
+    """Handling of events received when a HandlerPool queue is full."""
+
+    DROP = 0
+    BLOCK = 1
+    SPILL = 2
+
+
+def _notification_subscription(the_event: dict, subscription_id: int) -> int:
+    """The subscription id a notification was sent to, current after a resubscribe."""
+    params = the_event.get("params")
+    if isinstance(params, dict):
+        return params.get("subscription", subscription_id)
+    return subscription_id
+
+
+@dataclasses.dataclass
+class HandlerMetrics:
+    """Live HandlerPool counters, lag is seconds from receipt to handler call."""
+
+    received: int = 0
+    handled: int = 0
+    dropped: int = 0
+    spilled: int = 0
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+    lag: float = 0.0
+    max_lag: float = 0.0
+
+
+@versionadded(version="0.71.0", reason="Backpressured subscription handlers.")
+class HandlerPool:
+    """Decouples a subscription's websocket reads from its handler calls.
+
+    Received events go into a bounded queue drained by a pool of workers, async
+    handlers run as tasks and synchronous handlers on threads. Events are decoded
+    by the workers. With more than one worker handler calls may complete out of
+    order, the handler's counter argument is the event's receipt sequence.
+
+    A HandlerPool instance serves one subscription at a time, it may be driven
+    again once the previous drive ended (e.g. after a reconnect).
+    """
+
+    def __init__(
+        self,
+        *,
+        workers: Optional[int] = 1,
+        max_queue: Optional[int] = 1024,
+        policy: Optional[OverflowPolicy] = OverflowPolicy.BLOCK,
+        spill_path: Optional[str] = None,
+        executor: Optional[Executor] = None,
+    ):
+        """__init__ HandlerPool initializer.
+
+        :param workers: Count of concurrent handler calls, defaults to 1
+        :type workers: Optional[int], optional
+        :param max_queue: Maximum events queued for the workers, defaults to 1024
+        :type max_queue: Optional[int], optional
+        :param policy: What to do with events when the queue is full, defaults to OverflowPolicy.BLOCK
+            which stops reading from the websocket until there is room
+        :type policy: Optional[OverflowPolicy], optional
+        :param spill_path: File to spill to with OverflowPolicy.SPILL, defaults to a temporary file
+        :type spill_path: Optional[str], optional
+        :param executor: Executor for synchronous handlers, defaults to a thread pool of workers
+        :type executor: Optional[Executor], optional
+        """
+        self._workers = max(1, workers)
+        self._max_queue = max(1, max_queue)
+        self._policy = policy
+        self._spill_path = spill_path
+        self._executor = executor
+        self._metrics = HandlerMetrics()
+        self._queue: asyncio.Queue = None
+        self._spill_file = None
+        self._spill_pending: int = 0
+        self._spill_read: int = 0
+        self._spill_ready: asyncio.Event = None
+        self._driving: bool = False
+
+    @property
+    def metrics(self) -> HandlerMetrics:
+        """Return the live metrics."""
+        return self._metrics
+
+    def _depth(self) -> None:
+        """Update queue depth metrics."""
+        depth = self._queue.qsize() + self._spill_pending
+        self._metrics.queue_depth = depth
+        self._metrics.max_queue_depth = max(self._metrics.max_queue_depth, depth)
+
+    def _spill(self, item: tuple) -> None:
+        """Append an event to the spill file."""
+        if not self._spill_file:
+            self._spill_file = (
+                open(self._spill_path, "w+", encoding="utf8")
+                if self._spill_path
+                else tempfile.TemporaryFile("w+", encoding="utf8")
+            )
+        self._spill_file.seek(0, os.SEEK_END)
+        self._spill_file.write(json.dumps(item) + "\n")
+        self._spill_pending += 1
+        self._metrics.spilled += 1
+        self._spill_ready.set()
+
+    async def _unspill(self) -> None:
+        """Move spilled events, in order, into the queue as it drains."""
+        while True:
+            await self._spill_ready.wait()
+            self._spill_file.seek(self._spill_read)
+            line = self._spill_file.readline()
+            self._spill_read = self._spill_file.tell()
+            await self._queue.put(tuple(json.loads(line)))
+            self._spill_pending -= 1
+            if not self._spill_pending:
+                self._spill_ready.clear()
+                self._spill_file.seek(0)
+                self._spill_file.truncate()
+                self._spill_read = 0
+
+    async def _enqueue(self, item: tuple) -> None:
+        """Queue an event according to the overflow policy."""
+        self._metrics.received += 1
+        if self._spill_pending:
+            self._spill(item)
+        elif not self._queue.full():
+            self._queue.put_nowait(item)
+        elif self._policy == OverflowPolicy.DROP:
+            self._metrics.dropped += 1
+        elif self._policy == OverflowPolicy.SPILL:
+            self._spill(item)
+        else:
+            await self._queue.put(item)
+        self._depth()
+
+    async def _read(self, receiver: Callable[[], Any]) -> None:
+        """Receive events into the queue."""
+        sequence = 0
+        while True:
+            the_event = await receiver()
+            await self._enqueue((time.monotonic(), sequence, the_event))
+            sequence += 1
+
+    async def _work(
+        self,
+        builder: Union[SubscribeEvent, SubscribeTransaction],
+        subscription_id: int,
+        handler: Callable,
+        executor: Executor,
+        result_data: "EventData",
+        stop: asyncio.Future,
+    ) -> None:
+        """Worker, handles events until a handler stops the subscription."""
+
+        def _decode(the_event: Any) -> tuple[Any, int]:
+            if not isinstance(the_event, dict):
+                the_event = json.loads(the_event)
+            return builder.handle_return(the_event), _notification_subscription(
+                the_event, subscription_id
+            )
+
+        def _call(the_event: Any, sequence: int) -> Any:
+            return handler(*_decode(the_event), sequence)
+
+        _is_asynch_handler = inspect.iscoroutinefunction(handler)
+        loop = asyncio.get_running_loop()
+        while not stop.done():
+            received, sequence, the_event = await self._queue.get()
+            self._depth()
+            lag = time.monotonic() - received
+            self._metrics.lag = lag
+            self._metrics.max_lag = max(self._metrics.max_lag, lag)
+            try:
+                if _is_asynch_handler:
+                    keep_running = await handler(*_decode(the_event), sequence)
+                else:
+                    keep_running = await loop.run_in_executor(
+                        executor, _call, the_event, sequence
+                    )
+            except Exception as axc:
+                if not stop.done():
+                    stop.set_exception(axc)
+                return
+            finally:
+                self._queue.task_done()
+            self._metrics.handled += 1
+            if keep_running:
+                if not isinstance(keep_running, bool):
+                    result_data.add_entry(sequence, keep_running)
+            elif not stop.done():
+                stop.set_result(None)
+
+    async def _drained(self) -> None:
+        """Return when every queued and spilled event has been handled."""
+        while True:
+            await self._queue.join()
+            if not self._spill_pending:
+                return
+            await asyncio.sleep(0.001)
+
+    async def drive(
+        self,
+        builder: Union[SubscribeEvent, SubscribeTransaction],
+        subscription_id: int,
+        receiver: Callable[[], Any],
+        handler: Callable,
+        result_data: "EventData",
+    ) -> None:
+        """drive Run the reader and workers until a handler stops, fails or the receiver raises.
+
+        When the receiver raises, events already received (queued or spilled) are
+        handled before its exception is raised.
+
+        :raises ValueError: If the pool is driving another subscription
+        :raises Exception: The handler or receiver exception
+        """
+        if self._driving:
+            raise ValueError("HandlerPool is already driving a subscription")
+        loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue(self._max_queue)
+        self._spill_ready = asyncio.Event()
+        executor = self._executor
+        if not executor and not inspect.iscoroutinefunction(handler):
+            executor = ThreadPoolExecutor(self._workers)
+        stop: asyncio.Future = loop.create_future()
+        tasks = [asyncio.create_task(self._read(receiver))]
+        tasks.extend(
+            asyncio.create_task(
+                self._work(
+                    builder, subscription_id, handler, executor, result_data, stop
+                )
+            )
+            for _ in range(self._workers)
+        )
+        if self._policy == OverflowPolicy.SPILL:
+            tasks.append(asyncio.create_task(self._unspill()))
+        self._driving = True
+        try:
+            await asyncio.wait([stop, tasks[0]], return_when=asyncio.FIRST_COMPLETED)
+            if not stop.done():
+                # Receiver raised, handle what it already received first
+                tasks.append(asyncio.create_task(self._drained()))
+                await asyncio.wait(
+                    [stop, tasks[-1]], return_when=asyncio.FIRST_COMPLETED
+                )
+            if stop.done():
+                stop.result()
+            else:
+                tasks[0].result()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            if executor is not self._executor:
+                executor.shutdown(wait=False)
+            if self._spill_file:
+                self._spill_file.close()
+                self._spill_file = None
+                self._spill_pending = self._spill_read = 0
+            self._metrics.queue_depth = 0
+            self._driving = False
+
+
+class _MuxConnection:
+    """One websocket connection carrying many subscriptions.
+
+    Notifications are routed to each subscription's queue by subscription id. After
+    a reconnect all continuing subscriptions are resubscribed in one burst.
+    """
+
+    def __init__(self, client: "SuiClient"):
+        """Initialize connection, it is opened with the first subscription."""
+        self._client = client
+        # Subscription queue -> [payload, subscription id, continue_on_close]
+        self._entries: dict[asyncio.Queue, list] = {}
+        # Subscription id -> subscription queue
+        self._routes: dict[int, asyncio.Queue] = {}
+        # Request id -> (subscription queue, response future)
+        self._pending: dict[int, tuple[asyncio.Queue, asyncio.Future]] = {}
+        self._request_id: int = 0
+        self._websock: WebSocketClientProtocol = None
+        self._connected: asyncio.Event = asyncio.Event()
+        self._error: Exception = None
+        self._task: asyncio.Task = None
+
+    @property
+    def load(self) -> int:
+        """Return the count of subscriptions on the connection."""
+        return len(self._entries)
+
+    async def _send_subscribe(self, queue: asyncio.Queue) -> asyncio.Future:
+        """Send the subscription request of queue, the future resolves to the response."""
+        self._request_id += 1
+        future = asyncio.get_running_loop().create_future()
+        self._pending[self._request_id] = (queue, future)
+        payload = self._entries[queue][0]
+        await self._websock.send(json.dumps(dict(payload, id=self._request_id)))
+        return future
+
+    async def subscribe(
+        self, payload: dict, continue_on_close: bool
+    ) -> tuple[asyncio.Queue, dict]:
+        """subscribe Add a subscription to the connection, connecting if needed.
+
+        :param payload: The subscription RPC call
+        :type payload: dict
+        :param continue_on_close: Resubscribe if the connection is closed
+        :type continue_on_close: bool
+        :return: The queue receiving notifications and the subscription response
+        :rtype: tuple[asyncio.Queue, dict]
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        self._entries[queue] = [payload, None, continue_on_close]
+        if not self._task or self._task.done():
+            self._connected.clear()
+            self._error = None
+            self._task = asyncio.create_task(self._run())
+        await self._connected.wait()
+        if self._error:
+            self._entries.pop(queue, None)
+            raise self._error
+        try:
+            response = await (await self._send_subscribe(queue))
+        except Exception:
+            self._entries.pop(queue, None)
+            if not self._entries:
+                await self.close()
+            raise
+        if "error" in response:
+            self._entries.pop(queue, None)
+        return queue, response
+
+    async def unsubscribe(
+        self, queue: asyncio.Queue, builder: Union[SubscribeEvent, SubscribeTransaction]
+    ) -> None:
+        """Remove a subscription, closing the connection if it was the last one."""
+        # A refused subscription was already removed
+        entry = self._entries.pop(queue, None)
+        try:
+            if entry and entry[1] is not None and self._connected.is_set():
+                self._routes.pop(entry[1], None)
+                self._request_id += 1
+                await self._websock.send(
+                    json.dumps(
+                        dict(
+                            entry[0],
+                            id=self._request_id,
+                            method=builder.method.replace("_subscribe", "_unsubscribe"),
+                            params=[entry[1]],
+                        )
+                    )
+                )
+        except (ConnectionClosed, ConnectionClosedError):
+            pass
+        if not self._entries:
+            # Also when reconnecting, the connection would idle forever
+            await self.close()
+
+    async def close(self) -> None:
+        """Stop the connection driver, closing the websocket."""
+        # A subscribe while stopping starts a new driver
+        task, self._task = self._task, None
+        self._connected.clear()
+        if task and not task.done():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    def _dispatch(self, message: dict) -> None:
+        """Route a subscription response or notification."""
+        if "id" in message and message["id"] in self._pending:
+            queue, future = self._pending.pop(message["id"])
+            entry = self._entries.get(queue)
+            if entry is None:
+                pass
+            elif "error" not in message:
+                entry[1] = message["result"]
+                self._routes[message["result"]] = queue
+            elif entry[1] is not None:
+                # Resubscribe refused, end the subscription
+                del self._entries[queue]
+                queue.put_nowait(
+                    ValueError(f"Resubscribe failed {message['error']}")
+                )
+            if not future.done():
+                future.set_result(message)
+        elif params := message.get("params"):
+            queue = self._routes.get(params.get("subscription"))
+            if queue:
+                queue.put_nowait(message)
+
+    def _closed(self, ws_cc: Exception) -> bool:
+        """Drop subscriptions not continuing on close, return True to reconnect."""
+        self._connected.clear()
+        self._routes.clear()
+        for _queue, future in self._pending.values():
+            if not future.done():
+                future.set_exception(ws_cc)
+        self._pending.clear()
+        for queue, entry in list(self._entries.items()):
+            if not entry[2] or self._client._in_shutdown:
+                queue.put_nowait(ws_cc)
+                del self._entries[queue]
+        return bool(self._entries)
+
+    async def _run(self) -> None:
+        """Connection driver, reconnects while subscriptions continue on close."""
+        websock: WebSocketClientProtocol = None
+        try:
+            async for websock in self._client._ws_connect():
+                self._websock = websock
+                if not self._entries:
+                    # Every subscription ended while reconnecting
+                    return
+                try:
+                    # Resubscribe everything in one burst after a reconnect, entries
+                    # may be added or removed while sending
+                    for queue, entry in list(self._entries.items()):
+                        if entry[1] is not None and queue in self._entries:
+                            await self._send_subscribe(queue)
+                    self._connected.set()
+                    while True:
+                        self._dispatch(json.loads(await websock.recv()))
+                except (ConnectionClosed, ConnectionClosedError) as ws_cc:
+                    if self._closed(ws_cc):
+                        logger.warning(
+                            f"Subscription connection {type(ws_cc).__name__}... reconnecting"
+                        )
+                        continue
+                    return
+        except Exception as exc:
+            logger.error(f"Subscription connection {type(exc).__name__} {exc.args}")
+            self._error = exc
+            self._closed(exc)
+            self._connected.set()
+        finally:
+            if websock:
+                await websock.close()
+
+
 @deprecated(version="0.65.0", reason="Sui dropping JSON RPC subscriptions.")
 class SuiClient(Provider):
     """A provider for managing subscriptions of Events or Transactions."""
@@ -85,16 +646,54 @@ class SuiClient(Provider):
     @versionchanged(
         version="0.20.0", reason="Added transaction subscription management."
     )
-    def __init__(self, config: SuiConfig):
+    @versionchanged(
+        version="0.71.0", reason="Subscriptions may share websocket connections."
+    )
+    def __init__(self, config: SuiConfig, multiplex: Optional[int] = 0):
         """__init__ Client initializer.
 
         :param config: An instance of SuiConfig
         :type config: SuiConfig
+        :param multiplex: Carry subscriptions over a pool of this many shared websocket
+            connections, defaults to 0 (a connection per subscription)
+        :type multiplex: Optional[int], optional
         """
         super().__init__(config)
         self._event_subscriptions: dict[str, asyncio.Task] = {}
         self._txn_subscriptions: dict[str, asyncio.Task] = {}
         self._in_shutdown = False
+        self._connections: list[_MuxConnection] = [
+            _MuxConnection(self) for _ in range(multiplex or 0)
+        ]
+
+    def _ws_connect(self) -> ws_connect:
+        """Return the websocket connector, SSL configured by socket protocol."""
+        if self.config.socket_url.startswith("wss:"):
+            logger.info("Subscription listener Connecting with SSLContext")
+            warnings.simplefilter("ignore")
+            return ws_connect(
+                self.config.socket_url,
+                extra_headers=self._ADDITIONL_HEADER,
+                ssl=ssl.SSLContext(ssl.PROTOCOL_SSLv23),
+            )
+        logger.info("Subscription listener Connecting without SSLContext")
+        return ws_connect(self.config.socket_url, extra_headers=self._ADDITIONL_HEADER)
+
+    def _subscription_payload(
+        self,
+        payload_msg: dict,
+        builder: Union[SubscribeEvent, SubscribeTransaction],
+    ) -> Union[dict, SuiRpcResult]:
+        """Complete the subscription RPC call from builder."""
+        payload_msg["method"] = builder.method
+        parm_arg = builder.filter
+        if isinstance(parm_arg, SuiString):
+            payload_msg["params"] = [parm_arg.value]
+        elif isinstance(parm_arg, SuiMap):
+            payload_msg["params"] = [parm_arg.filter]
+        else:
+            return SuiRpcResult(False, f"{parm_arg} not an accepted type")
+        return payload_msg
 
     @versionchanged(
         version="0.20.0", reason="Added transaction subscription management."
@@ -112,6 +711,8 @@ class SuiClient(Provider):
             Callable[[SubscribedEvent, int, int], Any],
             Callable[[SubscribedTransaction, int, int], Any],
         ],
+        handler_pool: Optional[HandlerPool] = None,
+        result_sink: Optional[EventSink] = None,
     ) -> SuiRpcResult:
         """_subscription_drive Iterate receiving events and calling handler function.
 
@@ -126,44 +727,91 @@ class SuiClient(Provider):
         :return: _description_
         :rtype: SuiRpcResult
         """
-        payload_msg["method"] = builder.method
-        parm_arg = builder.params["filter"]
-        if isinstance(parm_arg, SuiString):
-            payload_msg["params"] = [parm_arg.value]
-        elif isinstance(parm_arg, SuiMap):
-            payload_msg["params"] = [parm_arg.filter]
-        else:
-            return SuiRpcResult(False, f"{parm_arg} not an accepted type")
-
-        _is_asynch_handler = inspect.iscoroutinefunction(handler)
-        logger.info(f"Handler is async -> {_is_asynch_handler}")
+        payload_msg = self._subscription_payload(payload_msg, builder)
+        if isinstance(payload_msg, SuiRpcResult):
+            return payload_msg
         logger.info("Starting listening event driver")
         await websock.send(json.dumps(payload_msg))
         # First we get a subscription ID
         response = json.loads(await websock.recv())
         if "error" in response:
             return SuiRpcResult(False, response["error"], response)
-        subscription_id: int = response["result"]
+        return await self._subscription_events(
+            builder,
+            response["result"],
+            websock.recv,
+            handler,
+            handler_pool,
+            result_sink,
+        )
+
+    @versionadded(
+        version="0.71.0", reason="Event loop independent of the websocket source."
+    )
+    async def _subscription_events(
+        self,
+        builder: Union[SubscribeEvent, SubscribeTransaction],
+        subscription_id: int,
+        receiver: Callable[[], Any],
+        handler: Union[
+            Callable[[SubscribedEvent, int, int], Any],
+            Callable[[SubscribedTransaction, int, int], Any],
+        ],
+        handler_pool: Optional[HandlerPool] = None,
+        result_sink: Optional[EventSink] = None,
+    ) -> SuiRpcResult:
+        """_subscription_events Iterate receiving events and calling handler function.
+
+        :param builder: The subscription builder submitted for creating subscription filters.
+        :type builder: Union[SubscribeEvent, SubscribeTransaction]
+        :param subscription_id: The subscription id
+        :type subscription_id: int
+        :param receiver: Coroutine function returning the next notification, raw or decoded
+        :type receiver: Callable[[], Any]
+        :param handler: The function called for each received event.
+        :type handler: Union[Callable[[SubscribedEvent, int, int], Any], Callable[[SubscribedTransaction, int, int], Any]]
+        :param handler_pool: Run handler on a HandlerPool instead of inline, defaults to None
+        :type handler_pool: Optional[HandlerPool], optional
+        :param result_sink: Where handler data entries go, defaults to None
+        :type result_sink: Optional[EventSink], optional
+        :return: Result of subscription event handling.
+        :rtype: SuiRpcResult
+        """
+        if handler_pool:
+            return await self._pooled_events(
+                builder,
+                subscription_id,
+                receiver,
+                handler,
+                handler_pool,
+                result_sink,
+            )
+        _is_asynch_handler = inspect.iscoroutinefunction(handler)
+        logger.info(f"Handler is async -> {_is_asynch_handler}")
         keep_running = True
         event_counter = 0
-        result_data: EventData = EventData(asyncio.current_task().get_name())
+        result_data: EventData = EventData(
+            asyncio.current_task().get_name(), result_sink
+        )
         try:
             while keep_running:
                 # Get an event
-                the_event = await websock.recv()
+                the_event = await receiver()
                 logger.debug("Subscription driver RECEIVED event")
 
                 try:
+                    if not isinstance(the_event, dict):
+                        the_event = json.loads(the_event)
                     if _is_asynch_handler:
                         keep_running = await handler(
-                            builder.handle_return(json.loads(the_event)),
-                            subscription_id,
+                            builder.handle_return(the_event),
+                            _notification_subscription(the_event, subscription_id),
                             event_counter,
                         )
                     else:
                         keep_running = handler(
-                            builder.handle_return(json.loads(the_event)),
-                            subscription_id,
+                            builder.handle_return(the_event),
+                            _notification_subscription(the_event, subscription_id),
                             event_counter,
                         )
                 # Indicative of deserialization error
@@ -198,6 +846,52 @@ class SuiClient(Provider):
             return SuiRpcResult(True, "Cancelled", result_data)
         return SuiRpcResult(True, None, result_data)
 
+    @versionadded(version="0.71.0", reason="Backpressured subscription handlers.")
+    async def _pooled_events(
+        self,
+        builder: Union[SubscribeEvent, SubscribeTransaction],
+        subscription_id: int,
+        receiver: Callable[[], Any],
+        handler: Union[
+            Callable[[SubscribedEvent, int, int], Any],
+            Callable[[SubscribedTransaction, int, int], Any],
+        ],
+        handler_pool: HandlerPool,
+        result_sink: Optional[EventSink] = None,
+    ) -> SuiRpcResult:
+        """_pooled_events Receive events into handler_pool until a handler stops the subscription."""
+        result_data: EventData = EventData(
+            asyncio.current_task().get_name(), result_sink
+        )
+        try:
+            await handler_pool.drive(
+                builder, subscription_id, receiver, handler, result_data
+            )
+            logger.warning(
+                "Subscription driver Handler rquested exit from subscription events."
+            )
+        except asyncio.CancelledError:
+            if self._in_shutdown:
+                logger.warning("Subscription cancelled by application")
+            else:
+                logger.warning(
+                    f"asyncio.CancelledError occured for shutdown -> {self._in_shutdown}"
+                )
+            return SuiRpcResult(True, "Cancelled", result_data)
+        except (ConnectionClosed, ConnectionClosedError):
+            raise
+        except KeyError as kex:
+            logger.warning(
+                f"Subscription driver KeyError occured for shutdown -> {self._in_shutdown}"
+            )
+            return SuiRpcResult(False, f"KeyError on {kex}", result_data)
+        except Exception as axc:
+            logger.warning(
+                f"Subscription driver Exception occured for shutdown -> {self._in_shutdown} {axc.args}"
+            )
+            return SuiRpcResult(False, f"Exception on {axc}", result_data)
+        return SuiRpcResult(True, None, result_data)
+
     @versionchanged(
         version="0.20.0", reason="Added transaction subscription management."
     )
@@ -208,6 +902,9 @@ class SuiClient(Provider):
         version="0.29.0",
         reason="Refactored and handle connection close continuation option.",
     )
+    @versionchanged(
+        version="0.71.0", reason="Uses shared connections when multiplexing."
+    )
     async def _subscription_listener(
         self,
         builder: Union[SubscribeEvent, SubscribeTransaction],
@@ -216,6 +913,8 @@ class SuiClient(Provider):
             Callable[[SubscribedTransaction, int, int], Any],
         ],
         continue_on_close: Optional[bool] = False,
+        handler_pool: Optional[HandlerPool] = None,
+        result_sink: Optional[EventSink] = None,
     ) -> SuiRpcResult:
         """_subscription_listener Sets up websocket subscription and calls _subscription_drive.
 
@@ -226,85 +925,126 @@ class SuiClient(Provider):
         :return: Result of subscription event handling.
         :rtype: SuiRpcResult
         """
-        if self.config.socket_url.startswith("wss:"):
-            logger.info("Subscription listener Connecting with SSLContext")
-            warnings.simplefilter("ignore")
-            async for websock in ws_connect(
-                self.config.socket_url,
-                extra_headers=self._ADDITIONL_HEADER,
-                ssl=ssl.SSLContext(ssl.PROTOCOL_SSLv23),
-            ):
-                try:
-                    res = await self._subscription_drive(
-                        self._PAYLOAD_TEMPLATE.copy(),
-                        builder,
-                        websock,
-                        handler,
-                    )
-                    logger.info(
-                        f"Subscription listener returning in shutdown: {self._in_shutdown}"
-                    )
-                    await websock.close()
-                    return res
-                except (ConnectionClosed, ConnectionClosedError) as ws_cc:
-                    ws_e_name = type(ws_cc).__name__
-                    if continue_on_close and not self._in_shutdown:
-                        logger.warning(
-                            f"Subscription listener {ws_e_name}... reconnecting"
-                        )
-                        continue
-                    else:
-                        logger.error(
-                            f"Subscription listener {ws_e_name} occured for shutdown -> {self._in_shutdown} {ws_cc.args}"
-                        )
-                        return SuiRpcResult(False, "ConnectionClosed", ws_cc)
-                except Exception as exc:
-                    e_name = type(exc).__name__
-                    logger.error(
-                        f"Subscription listener {e_name} occured in shutdown -> {self._in_shutdown} {exc.args}"
-                    )
-                    return SuiRpcResult(False, e_name, exc)
-        else:
-            logger.info("Subscription listener Connecting without SSLContext")
-            async for websock in ws_connect(
-                self.config.socket_url, extra_headers=self._ADDITIONL_HEADER
-            ):
-                try:
-                    res = await self._subscription_drive(
-                        self._PAYLOAD_TEMPLATE.copy(),
-                        builder,
-                        websock,
-                        handler,
-                    )
-                    logger.info(
-                        f"Subscription listener returning in shutdown: {self._in_shutdown}"
-                    )
-                    await websock.close()
-                    return res
-                except (ConnectionClosed, ConnectionClosedError) as ws_cc:
-                    if continue_on_close and not self._in_shutdown:
-                        logger.warning(
-                            "Subscription listener ConnectionClosed... reconnecting"
-                        )
-                        continue
-                    else:
-                        logger.error(
-                            f"Subscription listener ConnectionClosed occured for shutdown -> {self._in_shutdown} {ws_cc.args}"
-                        )
-                        return SuiRpcResult(False, "ConnectionClosed", ws_cc)
-                except Exception as exc:
-                    e_name = type(exc).__name__
+        if self._connections:
+            return await self._mux_subscription_listener(
+                builder, handler, continue_on_close, handler_pool, result_sink
+            )
+        async for websock in self._ws_connect():
+            try:
+                res = await self._subscription_drive(
+                    self._PAYLOAD_TEMPLATE.copy(),
+                    builder,
+                    websock,
+                    handler,
+                    handler_pool,
+                    result_sink,
+                )
+                logger.info(
+                    f"Subscription listener returning in shutdown: {self._in_shutdown}"
+                )
+                await websock.close()
+                return res
+            except (ConnectionClosed, ConnectionClosedError) as ws_cc:
+                ws_e_name = type(ws_cc).__name__
+                if continue_on_close and not self._in_shutdown:
+                    logger.warning(f"Subscription listener {ws_e_name}... reconnecting")
+                    continue
+                else:
                     logger.error(
-                        f"Subscription listener {e_name} occured in shutdown -> {self._in_shutdown} {exc.args}"
+                        f"Subscription listener {ws_e_name} occured for shutdown -> {self._in_shutdown} {ws_cc.args}"
                     )
-                    return SuiRpcResult(False, e_name, exc)
+                    return SuiRpcResult(False, "ConnectionClosed", ws_cc)
+            except Exception as exc:
+                e_name = type(exc).__name__
+                logger.error(
+                    f"Subscription listener {e_name} occured in shutdown -> {self._in_shutdown} {exc.args}"
+                )
+                return SuiRpcResult(False, e_name, exc)
+
+    @versionadded(version="0.71.0", reason="Subscriptions over shared connections.")
+    async def _mux_subscription_listener(
+        self,
+        builder: Union[SubscribeEvent, SubscribeTransaction],
+        handler: Union[
+            Callable[[SubscribedEvent, int, int], Any],
+            Callable[[SubscribedTransaction, int, int], Any],
+        ],
+        continue_on_close: Optional[bool] = False,
+        handler_pool: Optional[HandlerPool] = None,
+        result_sink: Optional[EventSink] = None,
+    ) -> SuiRpcResult:
+        """_mux_subscription_listener Subscribes on the least loaded shared connection.
+
+        :param builder: The subscription builder submitted for creating subscription filters.
+        :type builder: Union[SubscribeEvent, SubscribeTransaction]
+        :param handler: The function called for each received event.
+        :type handler: Union[Callable[[SubscribedEvent, int, int], Any], Callable[[SubscribedTransaction, int, int], Any]]
+        :return: Result of subscription event handling.
+        :rtype: SuiRpcResult
+        """
+        payload_msg = self._subscription_payload(self._PAYLOAD_TEMPLATE.copy(), builder)
+        if isinstance(payload_msg, SuiRpcResult):
+            return payload_msg
+        connection = min(self._connections, key=lambda x: x.load)
+        queue: asyncio.Queue = None
+        try:
+            queue, response = await connection.subscribe(payload_msg, continue_on_close)
+            if "error" in response:
+                return SuiRpcResult(False, response["error"], response)
+
+            async def _receiver() -> dict:
+                message = await queue.get()
+                if isinstance(message, Exception):
+                    raise message
+                return message
+
+            res = await self._subscription_events(
+                builder,
+                response["result"],
+                _receiver,
+                handler,
+                handler_pool,
+                result_sink,
+            )
+            logger.info(
+                f"Subscription listener returning in shutdown: {self._in_shutdown}"
+            )
+            return res
+        except (ConnectionClosed, ConnectionClosedError) as ws_cc:
+            logger.error(
+                f"Subscription listener {type(ws_cc).__name__} occured for shutdown -> {self._in_shutdown} {ws_cc.args}"
+            )
+            return SuiRpcResult(False, "ConnectionClosed", ws_cc)
+        except Exception as exc:
+            e_name = type(exc).__name__
+            logger.error(
+                f"Subscription listener {e_name} occured in shutdown -> {self._in_shutdown} {exc.args}"
+            )
+            return SuiRpcResult(False, e_name, exc)
+        finally:
+            if queue:
+                await connection.unsubscribe(queue, builder)
+
+    @versionadded(version="0.71.0", reason="Pluggable subscription result retention.")
+    async def _sink_listener(
+        self, result_sink: Optional[EventSink], listener: Coroutine
+    ) -> SuiRpcResult:
+        """Await the subscription listener, closing result_sink when it ends."""
+        try:
+            return await listener
+        finally:
+            if result_sink:
+                result_sink.close()
 
+    @versionchanged(version="0.71.0", reason="Added handler_pool and result_sink.")
     async def new_event_subscription(
         self,
         sbuilder: SubscribeEvent,
         handler: Callable[[SubscribedEvent, int, int], Any],
         task_name: str = None,
         continue_on_close: Optional[bool] = False,
+        handler_pool: Optional[HandlerPool] = None,
+        result_sink: Optional[EventSink] = None,
     ) -> SuiRpcResult:
         """new_event_subscription Initiate and run a move event subscription feed.
 
@@ -314,6 +1054,14 @@ class SuiClient(Provider):
         :type handler: Callable[[SubscribedEvent, int], Any]
         :param task_name: A name to assign to the listener task, defaults to None
         :type task_name: str, optional
+        :param continue_on_close: Reconnect if the connection is closed, defaults to False
+        :type continue_on_close: Optional[bool], optional
+        :param handler_pool: Call handler from a HandlerPool, decoupled from websocket reads,
+            defaults to None (handler called inline)
+        :type handler_pool: Optional[HandlerPool], optional
+        :param result_sink: Where handler data entries go, closed when the subscription ends,
+            defaults to None (retain all in memory)
+        :type result_sink: Optional[EventSink], optional
         :return: Result of subscribed move event handling
         :rtype: SuiRpcResult
         """
@@ -321,7 +1069,16 @@ class SuiClient(Provider):
         async with self._ACCESS_LOCK:
             if not self._in_shutdown:
                 new_task: asyncio.Task = asyncio.create_task(
-                    self._subscription_listener(sbuilder, handler, continue_on_close),
+                    self._sink_listener(
+                        result_sink,
+                        self._subscription_listener(
+                            sbuilder,
+                            handler,
+                            continue_on_close,
+                            handler_pool,
+                            result_sink,
+                        ),
+                    ),
                     name=task_name,
                 )
                 _task_name = new_task.get_name()
@@ -336,12 +1093,15 @@ class SuiClient(Provider):
         return _sui_result
 
     @versionadded(version="0.20.0", reason="Transaction Effects Subscription")
+    @versionchanged(version="0.71.0", reason="Added handler_pool and result_sink.")
     async def new_transaction_subscription(
         self,
         sbuilder: SubscribeTransaction,
         handler: Callable[[SubscribedTransaction, int, int], Any],
         task_name: str = None,
         continue_on_close: Optional[bool] = False,
+        handler_pool: Optional[HandlerPool] = None,
+        result_sink: Optional[EventSink] = None,
     ) -> SuiRpcResult:
         """new_event_subscription Initiate and run a move event subscription feed.
 
@@ -351,6 +1111,14 @@ class SuiClient(Provider):
         :type handler: Callable[[SubscribedTransaction, int], Any]
         :param task_name: A name to assign to the listener task, defaults to None
         :type task_name: str, optional
+        :param continue_on_close: Reconnect if the connection is closed, defaults to False
+        :type continue_on_close: Optional[bool], optional
+        :param handler_pool: Call handler from a HandlerPool, decoupled from websocket reads,
+            defaults to None (handler called inline)
+        :type handler_pool: Optional[HandlerPool], optional
+        :param result_sink: Where handler data entries go, closed when the subscription ends,
+            defaults to None (retain all in memory)
+        :type result_sink: Optional[EventSink], optional
         :return: Result of subscribed transaction event handling
         :rtype: SuiRpcResult
         """
@@ -358,7 +1126,16 @@ class SuiClient(Provider):
         async with self._ACCESS_LOCK:
             if not self._in_shutdown:
                 new_task: asyncio.Task = asyncio.create_task(
-                    self._subscription_listener(sbuilder, handler, continue_on_close),
+                    self._sink_listener(
+                        result_sink,
+                        self._subscription_listener(
+                            sbuilder,
+                            handler,
+                            continue_on_close,
+                            handler_pool,
+                            result_sink,
+                        ),
+                    ),
                     name=task_name,
                 )
                 _task_name = new_task.get_name()
@@ -383,6 +1160,7 @@ class SuiClient(Provider):
             ev_sub_results = await asyncio.gather(
                 *self._event_subscriptions.values(), return_exceptions=True
             )
+            await asyncio.gather(*(x.close() for x in self._connections))
             self._in_shutdown = False
         return ev_sub_results
 
@@ -63,9 +63,6 @@ from pysui.sui.sui_builders.exec_builders import (
 )
 from pysui.sui.sui_utils import partition
 
-from pysui.bfc.context import is_bfc_activated
-from pysui.bfc.rpc_patch import to_bfc_rpc_method
-
 
 # Standard library logging setup
 logger = logging.getLogger("pysui.sync_client")
@@ -78,13 +75,18 @@ class SuiClient(ClientMixin):
     """Sui Syncrhonous Client."""
 
     @versionchanged(version="0.28.0", reason="Added logging")
+    @versionchanged(version="0.71.0", reason="Added per client BFC mode")
     def __init__(
         self,
         config: SuiConfig,
         request_type: SuiRequestType = SuiRequestType.WAITFORLOCALEXECUTION,
+        bfc: Optional[bool] = None,
     ) -> None:
-        """Client initializer."""
-        super().__init__(config, request_type)
+        """Client initializer.
+
+        :param bfc: Connect in BFC mode, defaults to bfc.context activation
+        """
+        super().__init__(config, request_type, bfc)
         self._client = httpx.Client(
             http2=True,
             timeout=120.0,
@@ -103,11 +105,6 @@ class SuiClient(ClientMixin):
         """Execute the builder construct."""
         # Validate builder and send request
         vres = self._validate_builder(builder)
-        ### BEGIN_BFC_PATCH
-        if is_bfc_activated():
-            vres["method"] = to_bfc_rpc_method(vres["method"])
-            builder._method = to_bfc_rpc_method(builder.method)
-        ### END_BFC_PATCH
         # print(vres)
         try:
             result = self._client.post(
@@ -299,8 +296,7 @@ class SuiClient(ClientMixin):
         :rtype: SuiRpcResult
         """
         ### BEGIN_BFC_PATCH
-        if is_bfc_activated() and str(coin_type) == "0x2::sui::SUI":
-            coin_type = SuiString("0x2::bfc::BFC")
+        coin_type = self._coin_types.get(str(coin_type), coin_type)
         ### END_BFC_PATCH
         result = self.execute(GetCoinTypeBalance(owner=address, coin_type=coin_type))
         if result.is_ok():
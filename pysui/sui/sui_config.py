@@ -56,6 +56,7 @@ from pysui.sui.sui_crypto import (
     create_new_address,
     emphemeral_keys_and_addresses,
     keypair_from_keystring,
+    lazy_keys_and_addresses,
     load_keys_and_addresses,
     recover_key_and_address,
     gen_mnemonic_phrase,
@@ -103,6 +104,7 @@ class SuiConfig(ClientConfiguration):
 
     @versionchanged(version="0.29.0", reason="Now accepts ws url.")
     @versionchanged(version="0.53.0", reason="Added GraphQL url property.")
+    @versionchanged(version="0.71.0", reason="Added lazy keystore loading.")
     def _initiate(
         self,
         active_address: str,
@@ -110,6 +112,7 @@ class SuiConfig(ClientConfiguration):
         socket_url: str,
         environment: str,
         gql_url: Optional[str] = None,
+        lazy_keys: Optional[bool] = False,
     ) -> None:
         """."""
         self._active_address = SuiAddress(active_address)
@@ -135,7 +138,18 @@ class SuiConfig(ClientConfiguration):
                 self._socket_url = socket_url if socket_url else MAINNET_SOCKET_URL
             case _:
                 self._socket_url = socket_url
-        self._cref_matrix = load_keys_and_addresses(self.keystore_file)
+        if lazy_keys:
+            self._cref_load_background(lambda: self._load_keystore(True))
+        else:
+            self._load_keystore(False)
+
+    @versionadded(version="0.71.0", reason="Lazy keystore loading.")
+    def _load_keystore(self, lazy_keys: bool) -> None:
+        """Load the keystore cross reference and associate aliases."""
+        if lazy_keys:
+            self._cref_matrix = lazy_keys_and_addresses(self.keystore_file)
+        else:
+            self._cref_matrix = load_keys_and_addresses(self.keystore_file)
         # Setup aliases
         if self.alias_file:
             try:
@@ -509,8 +523,13 @@ class SuiConfig(ClientConfiguration):
     @classmethod
     @versionadded(version="0.16.1", reason="More flexible configuration.")
     @versionchanged(version="0.41.0", reason="Sui aliases configuration feature added")
+    @versionchanged(version="0.71.0", reason="Added lazy keystore loading.")
     def _create_config(
-        cls, expanded_path: Path, expanded_binary: Path, expanded_alias: Path
+        cls,
+        expanded_path: Path,
+        expanded_binary: Path,
+        expanded_alias: Path,
+        lazy_keys: Optional[bool] = False,
     ) -> "SuiConfig":
         """."""
         client_yaml = yaml.safe_load(expanded_path.read_text(encoding="utf8"))
@@ -522,15 +541,18 @@ class SuiConfig(ClientConfiguration):
             str(expanded_path), client_yaml["keystore"]["File"], str(expanded_alias)
         )
         _set_env_vars(expanded_path, expanded_binary)
-        config._initiate(*cls._new_parse_config(client_yaml))
+        config._initiate(*cls._new_parse_config(client_yaml), lazy_keys=lazy_keys)
         return config
 
     @classmethod
     @versionadded(version="0.16.1", reason="New loading of default configuration.")
     @versionchanged(version="0.41.0", reason="Sui aliases configuration feature added")
-    def default_config(cls) -> "SuiConfig":
+    @versionchanged(version="0.71.0", reason="Added lazy keystore loading.")
+    def default_config(cls, *, lazy_keys: Optional[bool] = False) -> "SuiConfig":
         """default_config Loads the configuration created by use of sui binaries `sui client`
 
+        :param lazy_keys: Load keys on a background thread using the derived address index, defaults to False
+        :type lazy_keys: Optional[bool], optional
         :raises SuiFileNotFound: If Sui configuration does not exist
         :return: Instantiated configuration ready for use
         :rtype: SuiConfig
@@ -542,18 +564,24 @@ class SuiConfig(ClientConfiguration):
                 expanded_path,
                 Path(os.path.expanduser(DEFAULT_SUI_BINARY_PATH)),
                 Path(os.path.expanduser(DEFAULT_ALIAS_PATH_STRING)),
+                lazy_keys,
             )
         raise SuiFileNotFound(f"{expanded_path} not found.")
 
     @classmethod
     @versionadded(version="0.51.0", reason="New alternate configuration path loading.")
-    def pysui_config(cls, cfg_path: str) -> "SuiConfig":
+    @versionchanged(version="0.71.0", reason="Added lazy keystore loading.")
+    def pysui_config(
+        cls, cfg_path: str, *, lazy_keys: Optional[bool] = False
+    ) -> "SuiConfig":
         """pysui_config Loads an alternate configuration from specified path.
 
         This behaves as a normal configuration where address and alias adds/changes are persisted
 
         :param cfg_path: path to folder holding alternate configuration
         :type cfg_path: str
+        :param lazy_keys: Load keys on a background thread using the derived address index, defaults to False
+        :type lazy_keys: Optional[bool], optional
         :raises SuiFileNotFound: If path is invalid
         :return: Instantiated configuration ready for use
         :rtype: SuiConfig
@@ -567,6 +595,7 @@ class SuiConfig(ClientConfiguration):
                 expanded_path,
                 Path(os.path.expanduser(DEFAULT_SUI_BINARY_PATH)),
                 alias_path,
+                lazy_keys,
             )
         raise SuiFileNotFound(f"{expanded_path} not found.")
 
@@ -575,14 +604,17 @@ class SuiConfig(ClientConfiguration):
         version="0.16.1",
         reason="Supporting more flexible non-default configurations",
     )
-    def sui_base_config(cls) -> "SuiConfig":
+    @versionchanged(version="0.71.0", reason="Added lazy keystore loading.")
+    def sui_base_config(cls, *, lazy_keys: Optional[bool] = False) -> "SuiConfig":
         """sui_base_config Loads the active configuration set by suibase
 
+        :param lazy_keys: Load keys on a background thread using the derived address index, defaults to False
+        :type lazy_keys: Optional[bool], optional
         :return: Instantiated configuration ready for use
         :rtype: SuiConfig
         """
         logger.debug("Initializing suibase local node configuration.")
-        return cls._create_config(*sui_base_get_config())
+        return cls._create_config(*sui_base_get_config(), lazy_keys)
 
     @classmethod
     @versionadded(version="0.25.0", reason="Removes reliance on client.yaml")
@@ -602,6 +634,7 @@ class SuiConfig(ClientConfiguration):
         version="0.57.0",
         reason="Add gql_url argument to support setting GraphQL RPC host URL",
     )
+    @versionchanged(version="0.71.0", reason="Added lazy keystore loading.")
     def user_config(
         cls,
         *,
@@ -609,6 +642,7 @@ class SuiConfig(ClientConfiguration):
         prv_keys: Optional[list[Union[str, dict]]] = None,
         ws_url: Optional[str] = None,
         gql_url: Optional[str] = None,
+        lazy_keys: Optional[bool] = False,
     ) -> "SuiConfig":
         """user_config Load a user defined configuraiton.
 
@@ -632,6 +666,11 @@ class SuiConfig(ClientConfiguration):
         :type ws_url: Optional[str], optional
         :param gql_url: Optional GraphQL RPC url, defaults to None
         :type gql_url: Optional[str], optional
+        :param lazy_keys: Derive prv_keys addresses on a background thread, defaults to False.
+            Only the active address is derived up front, the others are all derived
+            by the background load (not individually on demand) and as the keys are
+            ephemeral no derived address index is kept. Lookups wait for the load.
+        :type lazy_keys: Optional[bool], optional
         :return: An instance of SuiConfig that can be used to initialize a SuiClient
         :rtype: SuiConfig
         """
@@ -661,6 +700,18 @@ class SuiConfig(ClientConfiguration):
             config._faucet_url = EMPEHMERAL_USER
             config._socket_url = ws_url or EMPEHMERAL_USER
         config._local_running = False
+        if prv_keys and lazy_keys:
+            # Only the active address is derived up front
+            config._active_address = SuiAddress.from_keypair_string(
+                keypair_from_keystring(as_keystrings(prv_keys[:1])[0]).to_b64()
+            )
+
+            def _load():
+                config._cref_matrix = emphemeral_keys_and_addresses(prv_keys)
+                config._alias_assocation([])
+
+            config._cref_load_background(_load)
+            return config
         if prv_keys:
             config._cref_matrix = emphemeral_keys_and_addresses(prv_keys)
             if len(config.addresses):
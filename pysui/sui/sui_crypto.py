@@ -18,9 +18,12 @@ import os
 import base64
 import binascii
 import hashlib
+import itertools
 import json
+import logging
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from enum import IntEnum
-from typing import Optional, Union
+from typing import Any, Callable, Iterable, Iterator, Optional, Union
 from deprecated.sphinx import versionadded, versionchanged, deprecated
 import pysui_fastcrypto as pfc
 
@@ -37,12 +40,12 @@ from pysui.sui.sui_constants import (
     SECP256K1_DEFAULT_KEYPATH,
     SECP256K1_PUBLICKEY_BYTES_LEN,
     SECP256R1_DEFAULT_KEYPATH,
+    SECP256R1_PUBLICKEY_BYTES_LEN,
+    KEYSTORE_INDEX_SUFFIX,
 )
 
 from pysui.sui.sui_types import SuiSignature, SuiAddress
 from pysui.sui.sui_types.bcs import (
-    MsBitmap,
-    MsCompressedSig,
     MsEd25519PublicKey,
     MsNewPublicKey,
     MsSecp256k1PublicKey,
@@ -51,6 +54,12 @@ from pysui.sui.sui_types.bcs import (
 )
 from pysui.sui.sui_types.scalars import SuiTxBytes
 
+# Standard library logging setup
+logger = logging.getLogger("pysui.sui_crypto")
+if not logging.getLogger().handlers:
+    logger.addHandler(logging.NullHandler())
+    logger.propagate = False
+
 
 class IntentScope(IntEnum):
     TransactionData = 0  # Used for a user signature on a transaction data.
@@ -115,6 +124,34 @@ class SuiPrivateKey(PrivateKey):
             [IntentScope.PersonalMessage, 0, 0],
         )
 
+    @versionadded(version="0.71.0", reason="Bytes native signing")
+    def sign_secure_bytes(
+        self,
+        tx_data: Union[bytes, memoryview],
+        intent: Optional[IntentScope] = IntentScope.TransactionData,
+    ) -> bytes:
+        """sign_secure_bytes Sign transaction bytes with intent.
+
+        The intent message digest is computed locally so only the 32 byte
+        digest crosses into the signer, the transaction bytes are never base64 encoded.
+
+        :param tx_data: Transaction (or message) bytes being signed
+        :type tx_data: Union[bytes, memoryview]
+        :param intent: The intent scope, defaults to IntentScope.TransactionData
+        :type intent: Optional[IntentScope], optional
+        :return: The raw signature bytes
+        :rtype: bytes
+        """
+        digest = hashlib.blake2b(bytes([intent, 0, 0]), digest_size=32)
+        digest.update(tx_data)
+        return base64.b64decode(
+            pfc.sign_message(
+                self.scheme,
+                self.key_bytes,
+                base64.b64encode(digest.digest()).decode(),
+            )
+        )
+
     @versionadded(version="0.33.0", reason="Hide private key")
     def __repr__(self) -> str:
         """To string."""
@@ -147,12 +184,32 @@ class SuiKeyPair(KeyPair):
         return self._scheme
 
     @versionchanged(version="0.33.0", reason="Changes to SuiPrivateKey")
-    def new_sign_secure(self, tx_data: str) -> SuiSignature:
-        """New secure sign with intent."""
+    @versionchanged(version="0.71.0", reason="Accepts transaction bytes")
+    def new_sign_secure(self, tx_data: Union[str, bytes]) -> SuiSignature:
+        """New secure sign with intent, tx_data is base64 string or raw bytes."""
         assert self.private_key, "Can not sign with invalid private key"
-        sig = bytearray(self.private_key.sign_secure(tx_data))
+        if isinstance(tx_data, str):
+            sig = bytes(self.private_key.sign_secure(tx_data))
+        else:
+            sig = self.sign_secure_bytes(tx_data)
         return SuiSignature(base64.b64encode(sig).decode())
 
+    @versionadded(version="0.71.0", reason="Bytes native signing")
+    def sign_secure_bytes(self, tx_data: Union[bytes, memoryview]) -> bytes:
+        """sign_secure_bytes Sign transaction bytes with intent.
+
+        :param tx_data: The TransactionData bytes
+        :type tx_data: Union[bytes, memoryview]
+        :return: Serialized signature bytes (flag | signature | public key)
+        :rtype: bytes
+        """
+        assert self.private_key, "Can not sign with invalid private key"
+        return (
+            self.scheme.to_bytes(1, "little")
+            + self.private_key.sign_secure_bytes(tx_data)
+            + self.public_key.key_bytes
+        )
+
     @versionadded(version="0.71.0", reason="Personal message with intent.")
     def sign_personal_message(self, message: str) -> str:
         """."""
@@ -287,6 +344,16 @@ class BaseMultiSig:
             self._public_keys = sui_pub_keys
             self._threshold: int = threshold
             self._address: SuiAddress = self._multi_sig_address()
+            # Immutable signature parts, computed once
+            self._key_index: dict[bytes, int] = {
+                pkey.scheme_and_key(): index
+                for index, pkey in enumerate(sui_pub_keys)
+            }
+            self._pk_map_bytes: bytes = bytes([len(sui_pub_keys)]) + b"".join(
+                npk.serialize() for npk in self._new_publickey()
+            )
+            self._threshold_bytes: bytes = threshold.to_bytes(2, "little")
+            self._bitmaps: dict[tuple[int, ...], bytes] = {}
         else:
             raise ValueError("Invalid arguments provided to constructor")
 
@@ -345,17 +412,27 @@ class BaseMultiSig:
     @versionchanged(
         version="0.21.1", reason="Exposed as public for use by SuiTransaction"
     )
+    @versionchanged(version="0.71.0", reason="Indexed lookup and cached bitmaps")
     def validate_signers(
         self, pub_keys: list[SuiPublicKey]
     ) -> Union[list[int], ValueError]:
         """Validate pubkeys part of multisig and have enough weight."""
         # Must be subset of full ms list
         if len(pub_keys) <= len(self._public_keys):
-            hit_indexes = [self._public_keys.index(i) for i in pub_keys]
-            # If all inbound pubkeys have reference to item in ms list
-            if len(hit_indexes) == len(pub_keys):
-                if sum([self._weights[x] for x in hit_indexes]) >= self._threshold:
-                    return hit_indexes
+            try:
+                hit_indexes = tuple(
+                    self._key_index[pkey.scheme_and_key()] for pkey in pub_keys
+                )
+            except KeyError as kerr:
+                raise ValueError(f"{kerr.args[0]} is not in list") from kerr
+            if hit_indexes in self._bitmaps:
+                return list(hit_indexes)
+            if sum([self._weights[x] for x in hit_indexes]) >= self._threshold:
+                bm_pks: int = 0
+                for index in hit_indexes:
+                    bm_pks |= 1 << index
+                self._bitmaps[hit_indexes] = bm_pks.to_bytes(2, "little")
+                return list(hit_indexes)
         raise ValueError("Keys and weights for signing do not meet thresholds")
 
     def _new_publickey(self) -> list[MsNewPublicKey]:
@@ -382,28 +459,25 @@ class BaseMultiSig:
             pks.append(npk)
         return pks
 
+    @versionchanged(version="0.71.0", reason="Assembles from precomputed parts")
     def _signature(
         self,
         pub_keys: list[SuiPublicKey],
-        compressed_sigs: list[MsCompressedSig],
+        compressed_sigs: list[bytes],
     ) -> SuiSignature:
-        """."""
+        """Assemble the BCS MultiSignature from compressed signatures."""
         key_indices = self.validate_signers(pub_keys)
-        # Generate the public keys used position bitmap
-        # then build the signature
-        bm_pks: int = 0
-        for index in key_indices:
-            bm_pks |= 1 << index
-        serialized_rbm: MsBitmap = MsBitmap(bm_pks)
-
-        msig_signature = MultiSignature(
-            self._scheme,
-            compressed_sigs,
-            serialized_rbm,
-            self._new_publickey(),
-            self.threshold,
+        msig_signature = b"".join(
+            [
+                self._scheme.to_bytes(1, "little"),
+                bytes([len(compressed_sigs)]),
+                *compressed_sigs,
+                self._bitmaps[tuple(key_indices)],
+                self._pk_map_bytes,
+                self._threshold_bytes,
+            ]
         )
-        return SuiSignature(base64.b64encode(msig_signature.serialize()).decode())
+        return SuiSignature(base64.b64encode(msig_signature).decode())
 
     def signature_from(
         self, pub_keys: list[SuiPublicKey], signatures: list[SuiSignature]
@@ -417,14 +491,10 @@ class BaseMultiSig:
         :return: A multisig signature
         :rtype: SuiSignature
         """
-        compressed: list[MsCompressedSig] = []
-        for index in signatures:
-            sig = str(index.value)
-            compressed.append(
-                MsCompressedSig(
-                    list(base64.b64decode(sig)[0 : self._COMPRESSED_SIG_LEN])
-                )
-            )
+        compressed: list[bytes] = [
+            base64.b64decode(str(sig.value))[0 : self._COMPRESSED_SIG_LEN]
+            for sig in signatures
+        ]
         return self._signature(pub_keys, compressed)
 
 
@@ -452,36 +522,33 @@ class MultiSig(BaseMultiSig):
         return self._keys.copy()
 
     @versionadded(version="0.21.1", reason="Support for inline multisig signing")
+    @versionchanged(version="0.71.0", reason="Signs transaction bytes")
     def _compressed_signatures(
-        self, tx_bytes: str, key_indices: list[int]
-    ) -> list[MsCompressedSig]:
+        self, tx_bytes: bytes, key_indices: list[int]
+    ) -> list[bytes]:
         """Creates compressed signatures from each of the signing keys present."""
-        compressed: list[MsCompressedSig] = []
-        for index in key_indices:
-            sig_t = self._keys[index].new_sign_secure(tx_bytes)
-            sig = str(sig_t.value)
-            compressed.append(
-                MsCompressedSig(
-                    list(base64.b64decode(sig)[0 : self._COMPRESSED_SIG_LEN])
-                )
-            )
-        return compressed
+        return [
+            self._keys[index].sign_secure_bytes(tx_bytes)[0 : self._COMPRESSED_SIG_LEN]
+            for index in key_indices
+        ]
 
     @versionadded(version="0.21.1", reason="Full signature creation without binaries.")
     @versionchanged(
         version="0.31.0",
         reason="Roaring bitmap no longer required in Sui 1.4.x and above.",
     )
+    @versionchanged(version="0.71.0", reason="Accepts transaction bytes")
     def sign(
-        self, tx_bytes: Union[str, SuiTxBytes], pub_keys: list[SuiPublicKey]
+        self, tx_bytes: Union[str, bytes, SuiTxBytes], pub_keys: list[SuiPublicKey]
     ) -> SuiSignature:
         """sign Signs transaction bytes for operation that changes objects owned by MultiSig address."""
-        # Validate the pub_keys alignment with self._keys
-        # key_indices = self._validate_signers(pub_keys)
         # Generate BCS compressed signatures for the subset of keys
-        tx_bytes = tx_bytes if isinstance(tx_bytes, str) else tx_bytes.value  # type: ignore
-        compressed_sigs: list[MsCompressedSig] = self._compressed_signatures(
-            str(tx_bytes), self.validate_signers(pub_keys)
+        if isinstance(tx_bytes, SuiTxBytes):
+            tx_bytes = tx_bytes.value
+        if isinstance(tx_bytes, str):
+            tx_bytes = base64.b64decode(tx_bytes)
+        compressed_sigs: list[bytes] = self._compressed_signatures(
+            tx_bytes, self.validate_signers(pub_keys)
         )
         return self._signature(pub_keys, compressed_sigs)
 
@@ -543,6 +610,264 @@ class MultiSig(BaseMultiSig):
             raise ValueError(f"{berr.args}") from berr
 
 
+def _map_chunks(
+    func: Callable[[Any, list], list],
+    shared: Any,
+    items: list,
+    executor: Optional[Executor],
+    max_workers: Optional[int],
+    use_processes: bool,
+    chunk_size: int,
+) -> list:
+    """Apply func(shared, chunk) to chunks of items on a pool, results flattened in order."""
+    chunks = [
+        items[index : index + chunk_size] for index in range(0, len(items), chunk_size)
+    ]
+    if len(chunks) <= 1 and not executor:
+        return func(shared, items)
+    pool = executor or (
+        ProcessPoolExecutor(max_workers)
+        if use_processes
+        else ThreadPoolExecutor(max_workers)
+    )
+    try:
+        return [
+            result
+            for chunk_results in pool.map(func, [shared] * len(chunks), chunks)
+            for result in chunk_results
+        ]
+    finally:
+        if not executor:
+            pool.shutdown()
+
+
+# A batch signer is a keypair or a MultiSig with the subset of public keys signing
+BatchSigner = Union[SuiKeyPair, tuple[MultiSig, list[SuiPublicKey]]]
+
+
+def _sign_chunk(
+    signers: list[BatchSigner], chunk: list[Union[str, bytes]]
+) -> list[list[str]]:
+    """Sign each transaction in chunk with every signer, returns base64 signatures."""
+    results: list[list[str]] = []
+    for tx_bytes in chunk:
+        if isinstance(tx_bytes, str):
+            tx_bytes = base64.b64decode(tx_bytes)
+        sigs: list[str] = []
+        for signer in signers:
+            if isinstance(signer, SuiKeyPair):
+                sigs.append(signer.new_sign_secure(tx_bytes).value)
+            else:
+                msig, pub_keys = signer
+                sigs.append(msig.sign(tx_bytes, pub_keys).value)
+        results.append(sigs)
+    return results
+
+
+@versionadded(version="0.71.0", reason="Batch signing of transactions")
+def sign_batch(
+    keypair_or_signers: Union[BatchSigner, list[BatchSigner]],
+    tx_bytes_list: list[Union[str, bytes]],
+    *,
+    executor: Optional[Executor] = None,
+    max_workers: Optional[int] = None,
+    use_processes: Optional[bool] = False,
+    chunk_size: Optional[int] = 256,
+) -> Union[list[str], list[list[str]]]:
+    """sign_batch Sign many transactions across a worker pool.
+
+    Signers are either a SuiKeyPair or a tuple of MultiSig and the public keys
+    participating in the signature. Pass a list of signers (e.g. sender then sponsor)
+    to get every signature required for each transaction.
+
+    Transactions are signed in chunks. Threads only run in parallel if the native
+    signer releases the GIL, use_processes (or a ProcessPoolExecutor) signs on
+    separate cores at the cost of sending the signers to each worker process.
+
+    :param keypair_or_signers: A single signer or a list of signers
+    :type keypair_or_signers: Union[BatchSigner, list[BatchSigner]]
+    :param tx_bytes_list: TransactionData as base64 strings or bytes
+    :type tx_bytes_list: list[Union[str, bytes]]
+    :param executor: An existing executor to use, defaults to None
+    :type executor: Optional[Executor], optional
+    :param max_workers: Worker count when an executor is created, defaults to None
+    :type max_workers: Optional[int], optional
+    :param use_processes: Create a process instead of thread pool, defaults to False
+    :type use_processes: Optional[bool], optional
+    :param chunk_size: Transactions per unit of work, defaults to 256
+    :type chunk_size: Optional[int], optional
+    :return: Base64 signatures in tx_bytes_list order, a list per transaction if a list of signers was given
+    :rtype: Union[list[str], list[list[str]]]
+    """
+    single = not isinstance(keypair_or_signers, list)
+    signers: list[BatchSigner] = (
+        [keypair_or_signers] if single else keypair_or_signers
+    )
+    for signer in signers:
+        if not isinstance(signer, SuiKeyPair) and not (
+            isinstance(signer, tuple) and isinstance(signer[0], MultiSig)
+        ):
+            raise ValueError(f"{signer} can not sign transactions")
+    signed = _map_chunks(
+        _sign_chunk,
+        signers,
+        tx_bytes_list,
+        executor,
+        max_workers,
+        use_processes,
+        chunk_size,
+    )
+    return [sigs[0] for sigs in signed] if single else signed
+
+
+def _verify_single(
+    scheme: SignatureScheme, pub_key: bytes, digest_b64: str, raw_sig: bytes
+) -> bool:
+    """Verify a raw signature over an intent digest with a public key."""
+    try:
+        return pfc.verify_pubk(
+            scheme, pub_key, digest_b64, base64.b64encode(raw_sig).decode()
+        )
+    except Exception:  # pylint: disable=broad-exception-caught
+        return False
+
+
+_PUBLIC_KEY_LEN: dict[int, int] = {
+    SignatureScheme.ED25519: ED25519_PUBLICKEY_BYTES_LEN,
+    SignatureScheme.SECP256K1: SECP256K1_PUBLICKEY_BYTES_LEN,
+    SignatureScheme.SECP256R1: SECP256R1_PUBLICKEY_BYTES_LEN,
+}
+
+
+@versionadded(version="0.71.0", reason="Public key signature verification")
+def verify_serialized_signature(
+    message: Union[str, bytes],
+    signature: str,
+    *,
+    intent: Optional[IntentScope] = IntentScope.PersonalMessage,
+    address: Optional[str] = None,
+) -> bool:
+    """verify_serialized_signature Verify a Sui serialized signature using the public key it carries.
+
+    Supports ED25519, SECP256K1, SECP256R1 (flag | signature | public key) and
+    MultiSig (flag | BCS MultiSignature) signatures. No private key is needed.
+
+    :param message: The signed message (or TransactionData) as base64 string or bytes
+    :type message: Union[str, bytes]
+    :param signature: The base64 serialized signature
+    :type signature: str
+    :param intent: The intent scope signed with, defaults to IntentScope.PersonalMessage
+    :type intent: Optional[IntentScope], optional
+    :param address: If provided, the signature public key(s) must also derive this address, defaults to None
+    :type address: Optional[str], optional
+    :return: True if the signature is valid
+    :rtype: bool
+    """
+    try:
+        if isinstance(message, str):
+            message = base64.b64decode(message)
+        sig_bytes = base64.b64decode(signature)
+        digest = hashlib.blake2b(bytes([intent, 0, 0]), digest_size=32)
+        digest.update(message)
+        digest_b64 = base64.b64encode(digest.digest()).decode()
+        flag = sig_bytes[0]
+        if flag == SignatureScheme.MULTISIG:
+            msig = MultiSignature.deserialize(sig_bytes)
+            addy_bytes = bytearray(sig_bytes[0:1])
+            addy_bytes += msig.Threshold.to_bytes(2, "little")
+            keys: list[tuple[int, bytes, int]] = []
+            for npk in msig.PkMap:
+                key_scheme = npk.index
+                key_bytes = bytes(npk.value.PublicKey)
+                keys.append((key_scheme, key_bytes, npk.value.Weight))
+                addy_bytes += bytes([key_scheme]) + key_bytes
+                addy_bytes += npk.value.Weight.to_bytes(1, "little")
+            bitmap = msig.BitMap.Bitmap
+            signer_indexes = [
+                index for index in range(len(keys)) if bitmap >> index & 1
+            ]
+            if len(signer_indexes) != len(msig.Sigs):
+                return False
+            weight = 0
+            for index, csig in zip(signer_indexes, msig.Sigs):
+                key_scheme, key_bytes, key_weight = keys[index]
+                raw = bytes(csig.Sig)
+                if raw[0] != key_scheme or not _verify_single(
+                    SignatureScheme(key_scheme), key_bytes, digest_b64, raw[1:]
+                ):
+                    return False
+                weight += key_weight
+            if weight < msig.Threshold:
+                return False
+        else:
+            scheme = SignatureScheme(flag)
+            pub_key = sig_bytes[-_PUBLIC_KEY_LEN[scheme] :]
+            raw = sig_bytes[1 : -len(pub_key)]
+            if not _verify_single(scheme, pub_key, digest_b64, raw):
+                return False
+            addy_bytes = sig_bytes[0:1] + pub_key
+        if address:
+            derived = "0x" + hashlib.blake2b(addy_bytes, digest_size=32).hexdigest()
+            return derived == address
+        return True
+    except Exception:  # pylint: disable=broad-exception-caught
+        return False
+
+
+def _verify_chunk(intent: IntentScope, chunk: list[tuple]) -> list[bool]:
+    """Verify each (message, signature[, address]) in chunk."""
+    return [
+        verify_serialized_signature(
+            item[0],
+            item[1],
+            intent=intent,
+            address=item[2] if len(item) > 2 else None,
+        )
+        for item in chunk
+    ]
+
+
+@versionadded(version="0.71.0", reason="Batch signature verification")
+def verify_batch(
+    items: list[tuple],
+    *,
+    intent: Optional[IntentScope] = IntentScope.PersonalMessage,
+    executor: Optional[Executor] = None,
+    max_workers: Optional[int] = None,
+    use_processes: Optional[bool] = False,
+    chunk_size: Optional[int] = 256,
+) -> list[bool]:
+    """verify_batch Verify many signatures using only public keys.
+
+    Each item is a tuple of (message, signature) or (message, signature, address)
+    as accepted by verify_serialized_signature. Malformed items verify as False.
+
+    :param items: Message, signature and optional expected address tuples
+    :type items: list[tuple]
+    :param intent: The intent scope all messages were signed with, defaults to IntentScope.PersonalMessage
+    :type intent: Optional[IntentScope], optional
+    :param executor: An existing executor to use, defaults to None
+    :type executor: Optional[Executor], optional
+    :param max_workers: Worker count when an executor is created, defaults to None
+    :type max_workers: Optional[int], optional
+    :param use_processes: Create a process instead of thread pool, defaults to False
+    :type use_processes: Optional[bool], optional
+    :param chunk_size: Items per unit of work, defaults to 256
+    :type chunk_size: Optional[int], optional
+    :return: Verification result for each item, in items order
+    :rtype: list[bool]
+    """
+    return _map_chunks(
+        _verify_chunk,
+        intent,
+        items,
+        executor,
+        max_workers,
+        use_processes,
+        chunk_size,
+    )
+
+
 def gen_mnemonic_phrase(word_counts: int) -> str:
     """gen_mnemonic_phrase Generates a unique string of words of count word_counts.
 
@@ -626,6 +951,177 @@ def recover_key_and_address(
     return mnemonics, new_kp, SuiAddress.from_bytes(new_kp.to_bytes())  # type: ignore
 
 
+_INDEXED_KEYPATHS: list[str] = [
+    "m/44'/784'/{}'/0'/0'",
+    "m/54'/784'/{}'/0/0",
+    "m/74'/784'/{}'/0/0",
+]
+
+
+def _keypair_chunk(
+    spec: tuple[SignatureScheme, int, Optional[str]], derv_paths: list[str]
+) -> list[tuple[str, bytes, bytes]]:
+    """Derive a keypair for each path, from spec mnemonic or a new one per key."""
+    scheme, word_counts, mnemonic = spec
+    results: list[tuple[str, bytes, bytes]] = []
+    for derv_path in derv_paths:
+        if mnemonic:
+            pub_list, prv_list = pfc.keys_from_mnemonics(scheme, derv_path, mnemonic)
+            phrase = mnemonic
+        else:
+            phrase, pub_list, prv_list = pfc.generate_new_keypair(
+                scheme, derv_path, str(word_counts)
+            )
+        results.append((str(phrase), bytes(pub_list), bytes(prv_list)))
+    return results
+
+
+@versionadded(version="0.71.0", reason="Bulk keypair generation")
+def iter_new_keypairs(
+    count: Optional[int] = None,
+    scheme: Optional[SignatureScheme] = SignatureScheme.ED25519,
+    word_counts: Optional[int] = 12,
+    *,
+    derv_paths: Optional[list[str]] = None,
+    mnemonic: Optional[str] = None,
+    executor: Optional[Executor] = None,
+    max_workers: Optional[int] = None,
+    use_processes: Optional[bool] = True,
+    chunk_size: Optional[int] = 256,
+) -> Iterator[tuple[str, SuiKeyPair]]:
+    """iter_new_keypairs Derive many keypairs on a worker pool, yielding them in order as ready.
+
+    Variants:
+
+    * count only: each key has its own new mnemonic and the scheme default path
+    * derv_paths: one key per derivation path
+    * mnemonic: every key derives from mnemonic, by default at account indexes 0..count-1
+
+    :param count: Number of keys, defaults to len(derv_paths)
+    :type count: Optional[int], optional
+    :param scheme: One of ED25519, SECP256K1 or SECP256R1, defaults to SignatureScheme.ED25519
+    :type scheme: Optional[SignatureScheme], optional
+    :param word_counts: Word count of new mnemonic phrases, defaults to 12
+    :type word_counts: Optional[int], optional
+    :param derv_paths: Derivation path for each key, defaults to None
+    :type derv_paths: Optional[list[str]], optional
+    :param mnemonic: Existing mnemonic phrase to derive keys from, defaults to None
+    :type mnemonic: Optional[str], optional
+    :param executor: An existing executor to use, defaults to None
+    :type executor: Optional[Executor], optional
+    :param max_workers: Worker count when an executor is created, defaults to None
+    :type max_workers: Optional[int], optional
+    :param use_processes: Create a process instead of thread pool, defaults to True
+    :type use_processes: Optional[bool], optional
+    :param chunk_size: Keys per unit of work, defaults to 256
+    :type chunk_size: Optional[int], optional
+    :raises ValueError: If the scheme, word count or key count is invalid
+    :return: Generator of mnemonic phrase and keypair
+    :rtype: Iterator[tuple[str, SuiKeyPair]]
+    """
+    if not isinstance(scheme, SignatureScheme) or scheme > 2:
+        raise ValueError(f"Signature Scheme {scheme} not supported")
+    if not word_counts in {12, 15, 18, 21, 24}:
+        raise ValueError("Word count must be one of integer {12, 15, 18, 21, 24}")
+    if derv_paths is None:
+        if not count or count < 0:
+            raise ValueError("Either a positive count or derv_paths is required")
+        if mnemonic:
+            derv_paths = [_INDEXED_KEYPATHS[scheme].format(x) for x in range(count)]
+        else:
+            derv_paths = [
+                [
+                    ED25519_DEFAULT_KEYPATH,
+                    SECP256K1_DEFAULT_KEYPATH,
+                    SECP256R1_DEFAULT_KEYPATH,
+                ][scheme]
+            ] * count
+    spec = (scheme, word_counts, mnemonic)
+    chunks = [
+        derv_paths[index : index + chunk_size]
+        for index in range(0, len(derv_paths), chunk_size)
+    ]
+    if len(chunks) <= 1 and not executor:
+        results = iter([_keypair_chunk(spec, derv_paths)])
+        pool = None
+    else:
+        pool = executor or (
+            ProcessPoolExecutor(max_workers)
+            if use_processes
+            else ThreadPoolExecutor(max_workers)
+        )
+        results = pool.map(_keypair_chunk, [spec] * len(chunks), chunks)
+    try:
+        for chunk_results in results:
+            for phrase, pub_bytes, prv_bytes in chunk_results:
+                yield phrase, SuiKeyPair.from_pfc_bytes(scheme, pub_bytes, prv_bytes)
+    finally:
+        if pool and not executor:
+            pool.shutdown(cancel_futures=True)
+
+
+@versionadded(version="0.71.0", reason="Bulk keypair generation")
+def create_new_keypairs(
+    count: Optional[int] = None,
+    scheme: Optional[SignatureScheme] = SignatureScheme.ED25519,
+    word_counts: Optional[int] = 12,
+    **kwargs,
+) -> list[tuple[str, SuiKeyPair]]:
+    """create_new_keypairs Derive many keypairs on a worker pool.
+
+    See iter_new_keypairs for the variants and pool arguments.
+
+    :return: List of mnemonic phrase and keypair
+    :rtype: list[tuple[str, SuiKeyPair]]
+    """
+    return list(iter_new_keypairs(count, scheme, word_counts, **kwargs))
+
+
+@versionadded(version="0.71.0", reason="Bulk keypair generation")
+def write_keystore(
+    keystore_file: str,
+    keypairs: Iterable[Union[SuiKeyPair, tuple[str, SuiKeyPair]]],
+    *,
+    append: Optional[bool] = False,
+) -> int:
+    """write_keystore Stream keypairs out to a Sui keystore file (JSON list of keystrings).
+
+    Keystrings are written as the keypairs are produced, so a generator (e.g.
+    iter_new_keypairs) is never held in memory. The file is written to a temporary
+    name and renamed into place when complete.
+
+    :param keystore_file: The keystore file path
+    :type keystore_file: str
+    :param keypairs: Keypairs or (mnemonic, keypair) tuples
+    :type keypairs: Iterable[Union[SuiKeyPair, tuple[str, SuiKeyPair]]]
+    :param append: Keep the keystrings of an existing keystore file ahead of the new
+        ones, otherwise an existing file is replaced, defaults to False
+    :type append: Optional[bool], optional
+    :return: The count of new keystrings written
+    :rtype: int
+    """
+    existing: list[str] = []
+    if append and os.path.exists(keystore_file):
+        with open(keystore_file, encoding="utf8") as keystore:
+            existing = json.load(keystore)
+    written = 0
+    temp_file = f"{keystore_file}.tmp"
+    with open(temp_file, "w", encoding="utf8") as keystore:
+        keystore.write("[")
+        for keystring in itertools.chain(
+            existing,
+            (
+                (keypair[1] if isinstance(keypair, tuple) else keypair).serialize()
+                for keypair in keypairs
+            ),
+        ):
+            keystore.write(f'{"," if written else ""}\n  "{keystring}"')
+            written += 1
+        keystore.write("\n]")
+    os.replace(temp_file, keystore_file)
+    return written - len(existing)
+
+
 @versionchanged(
     version="0.33.0",
     reason="Requires word count, no longer allows phrase.",
@@ -702,16 +1198,7 @@ def load_keys_and_addresses(
                 _cref_matrix: list[list[dict]] = []
                 if len(_keystrings) > 0:
                     for keystr in _keystrings:
-                        crm_entry = [{}]
-                        kpair = keypair_from_keystring(keystr)
-                        puks = base64.b64encode(
-                            kpair.public_key.scheme_and_key()
-                        ).decode()
-                        addy = SuiAddress.from_keypair_string(kpair.to_b64())
-                        crm_entry.extend(
-                            [{keystr: kpair}, {puks: keystr}, {addy.address: addy}]
-                        )
-                        _cref_matrix.append(crm_entry)
+                        _cref_matrix.append(_cref_row(keystr))
                     return _cref_matrix
                 else:
                     raise ValueError("Empty keystring found")
@@ -774,15 +1261,114 @@ def emphemeral_keys_and_addresses(
     """
     _keystrings = as_keystrings(keystrings)
 
+    return [_cref_row(keystr) for keystr in _keystrings]
+
+
+class _DeferredKeyPair(dict):
+    """A {keystring: KeyPair} cross reference entry that decodes the keypair on first use."""
+
+    def _resolve(self) -> None:
+        """Decode the keypair if not already done."""
+        keystr = next(iter(self))
+        if dict.__getitem__(self, keystr) is None:
+            dict.__setitem__(self, keystr, keypair_from_keystring(keystr))
+
+    def __getitem__(self, key: str) -> "SuiKeyPair":
+        """Return the decoded keypair."""
+        self._resolve()
+        return dict.__getitem__(self, key)
+
+    def get(self, key: str, default=None) -> Optional["SuiKeyPair"]:
+        """Return the decoded keypair or default."""
+        return self[key] if key in self else default
+
+    def values(self):
+        """Return the decoded keypair view."""
+        self._resolve()
+        return dict.values(self)
+
+    def items(self):
+        """Return the decoded keystring and keypair view."""
+        self._resolve()
+        return dict.items(self)
+
+
+def _cref_row(keystr: str) -> list[dict]:
+    """Derive a cross reference matrix row from a keystring."""
+    kpair = keypair_from_keystring(keystr)
+    puks = base64.b64encode(kpair.public_key.scheme_and_key()).decode()
+    addy = SuiAddress.from_keypair_string(kpair.to_b64())
+    return [{}, {keystr: kpair}, {puks: keystr}, {addy.address: addy}]
+
+
+def _keystring_digest(keystr: str) -> str:
+    """Index key for a keystring, the keystring itself is never written to the index."""
+    return hashlib.blake2b(keystr.encode(), digest_size=32).hexdigest()
+
+
+@versionadded(version="0.71.0", reason="Lazy keystore loading")
+def lazy_keys_and_addresses(
+    keystore_file: str,
+    index_file: Optional[str] = None,
+    persist_index: Optional[bool] = True,
+) -> list[list[dict]]:
+    """lazy_keys_and_addresses Load keys and addresses, deferring keypair decoding.
+
+    Public keys and addresses of keystrings found in the index sidecar file are used
+    as is and their keypairs are only decoded when first used. Keystrings not in the
+    index are derived and, if persist_index is True, the index is rewritten.
+
+    :param keystore_file: The current in use keystore file path
+    :type keystore_file: str
+    :param index_file: The derived address index path, defaults to keystore_file + KEYSTORE_INDEX_SUFFIX
+    :type index_file: Optional[str], optional
+    :param persist_index: Write the index if keystrings were derived, a failed write
+        is logged and ignored, defaults to True
+    :type persist_index: Optional[bool], optional
+    :raises ValueError: If the keystore is missing or empty
+    :return: Cross reference matrix [{},{keystring:KeyPair},{publickyestring:keystring},{str:SuiAddress}]
+    :rtype: list[list[dict]]
+    """
+    if not os.path.exists(keystore_file):
+        raise ValueError(f"{keystore_file} not found")
+    with open(keystore_file, encoding="utf8") as keyfile:
+        _keystrings = json.load(keyfile)
+    if not _keystrings:
+        raise ValueError("Empty keystring found")
+    index_file = index_file or f"{keystore_file}{KEYSTORE_INDEX_SUFFIX}"
+    try:
+        with open(index_file, encoding="utf8") as idxfile:
+            _index: dict[str, list[str]] = json.load(idxfile).get("keys", {})
+    except (OSError, ValueError, AttributeError):
+        _index = {}
+
     _cref_matrix: list[list[dict]] = []
+    _current: dict[str, list[str]] = {}
+    _derived = False
     for keystr in _keystrings:
-        kpair = keypair_from_keystring(keystr)
-        addy = SuiAddress.from_keypair_string(kpair.to_b64())
-        # addy = SuiAddress.from_keypair_string(keystr)
-        crm_entry = [{}]
-        puks = base64.b64encode(kpair.public_key.scheme_and_key()).decode()
-        crm_entry.extend([{keystr: kpair}, {puks: keystr}, {addy.address: addy}])
-        _cref_matrix.append(crm_entry)
+        kdigest = _keystring_digest(keystr)
+        if kdigest in _index:
+            puks, address = _index[kdigest]
+            _cref_matrix.append(
+                [
+                    {},
+                    _DeferredKeyPair({keystr: None}),
+                    {puks: keystr},
+                    {address: SuiAddress(address)},
+                ]
+            )
+        else:
+            _cref_matrix.append(_cref_row(keystr))
+            _derived = True
+        row = _cref_matrix[-1]
+        _current[kdigest] = [next(iter(row[2])), next(iter(row[3]))]
+    if persist_index and (_derived or len(_current) != len(_index)):
+        # The index is only a cache, keys load without it
+        try:
+            with open(index_file, "w", encoding="utf8") as idxfile:
+                json.dump({"version": 1, "keys": _current}, idxfile, indent=2)
+        except OSError as exc:
+            logger.warning(f"Unable to write keystore index {index_file}: {exc}")
     return _cref_matrix
 
 
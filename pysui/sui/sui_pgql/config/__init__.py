@@ -5,5 +5,18 @@
 
 """Pysui Sui GraphQL Configuration Package."""
 
-from .pysui_config import PysuiConfiguration
-from .confmodel import PysuiConfigModel
+from typing import TYPE_CHECKING
+from pysui._lazy import lazy_attributes
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    globals(),
+    {
+        "PysuiConfiguration": (f"{__name__}.pysui_config", "PysuiConfiguration"),
+        "PysuiConfigModel": (f"{__name__}.confmodel", "PysuiConfigModel"),
+    },
+)
+
+if TYPE_CHECKING:
+    from .pysui_config import PysuiConfiguration
+    from .confmodel import PysuiConfigModel
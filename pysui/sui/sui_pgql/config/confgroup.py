@@ -53,6 +53,90 @@ class ProfileGroup(dataclasses_json.DataClassJsonMixin):
     address_list: Optional[list[str]] = dataclasses.field(default_factory=list)
     profiles: Optional[list[Profile]] = dataclasses.field(default_factory=list)
 
+    @classmethod
+    def from_config_dict(cls, group: dict) -> "ProfileGroup":
+        """Construct from a decoded PysuiConfig.json group without dataclasses_json reflection."""
+        return cls(
+            group["group_name"],
+            group["using_profile"],
+            group["using_address"],
+            [
+                ProfileAlias(x["alias"], x["public_key_base64"])
+                for x in group["alias_list"]
+            ],
+            [ProfileKey(x["private_key_base64"]) for x in group["key_list"]],
+            list(group.get("address_list") or []),
+            [
+                Profile(
+                    x["profile_name"],
+                    x["url"],
+                    x.get("faucet_url"),
+                    x.get("faucet_status_url"),
+                )
+                for x in group.get("profiles") or []
+            ],
+        )
+
+    def to_config_dict(self) -> dict:
+        """Produce the PysuiConfig.json form of the group, equivalent to to_dict."""
+        return {
+            "group_name": self.group_name,
+            "using_profile": self.using_profile,
+            "using_address": self.using_address,
+            "alias_list": [
+                {"alias": x.alias, "public_key_base64": x.public_key_base64}
+                for x in self.alias_list
+            ],
+            "key_list": [
+                {"private_key_base64": x.private_key_base64} for x in self.key_list
+            ],
+            "address_list": list(self.address_list),
+            "profiles": [
+                {
+                    "profile_name": x.profile_name,
+                    "url": x.url,
+                    "faucet_url": x.faucet_url,
+                    "faucet_status_url": x.faucet_status_url,
+                }
+                for x in self.profiles
+            ],
+        }
+
+    def _indexes(self) -> "ProfileGroup":
+        """Refresh the lookup indexes if the key, alias or address lists changed shape."""
+        _shape = (
+            id(self.address_list),
+            len(self.address_list),
+            id(self.alias_list),
+            len(self.alias_list),
+            id(self.key_list),
+            len(self.key_list),
+        )
+        if self.__dict__.get("_index_shape") != _shape:
+            self._addr_key: dict[str, ProfileKey] = dict(
+                zip(self.address_list, self.key_list)
+            )
+            self._addr_alias: dict[str, ProfileAlias] = dict(
+                zip(self.address_list, self.alias_list)
+            )
+            self._alias_addr: dict[str, str] = {
+                ally.alias: addy
+                for ally, addy in zip(self.alias_list, self.address_list)
+            }
+            self._alias_entry: dict[str, ProfileAlias] = {
+                ally.alias: ally for ally in self.alias_list
+            }
+            self._key_entry: dict[str, ProfileKey] = {
+                pkey.private_key_base64: pkey for pkey in self.key_list
+            }
+            self._keypairs: dict[str, tuple[str, crypto.SuiKeyPair]] = {}
+            self._index_shape = _shape
+        return self
+
+    def _invalidate_indexes(self) -> None:
+        """Force the lookup indexes and keypair cache to be rebuilt."""
+        self.__dict__.pop("_index_shape", None)
+
     def _profile_exists(self, *, profile_name: str) -> Union[Profile, bool]:
         """Check if a profile, by name, exists."""
         return next(
@@ -61,20 +145,15 @@ class ProfileGroup(dataclasses_json.DataClassJsonMixin):
 
     def _alias_exists(self, *, alias_name: str) -> Union[ProfileAlias, bool]:
         """Check if an alias, by name, exists."""
-        return next(
-            filter(lambda ally: ally.alias == alias_name, self.alias_list), False
-        )
+        return self._indexes()._alias_entry.get(alias_name, False)
 
     def _address_exists(self, *, address: str) -> Union[str, bool]:
         """Check if address is valid."""
-        return next(filter(lambda addy: addy == address, self.address_list), False)
+        return address if address in self._indexes()._addr_key else False
 
     def _key_exists(self, *, key_string: str) -> Union[ProfileKey, bool]:
         """Check if key string exists."""
-        return next(
-            filter(lambda pkey: pkey.private_key_base64 == key_string, self.key_list),
-            False,
-        )
+        return self._indexes()._key_entry.get(key_string, False)
 
     @property
     def active_address(self) -> str:
@@ -84,50 +163,43 @@ class ProfileGroup(dataclasses_json.DataClassJsonMixin):
     @active_address.setter
     def active_address(self, change_to: str) -> str:
         """Set the using address to change_to."""
-        _ = self.address_list.index(change_to)
+        if not self._address_exists(address=change_to):
+            raise ValueError(f"{change_to} is not in list")
         self.using_address = change_to
         return change_to
 
     @property
     def active_alias(self) -> str:
         """Return the alias associated to the using (active) address."""
-        adex = self.address_list.index(self.using_address)
-        return self.alias_list[adex].alias
+        return self.alias_for_address(address=self.using_address).alias
 
     @active_alias.setter
     def active_alias(self, change_to: str) -> str:
         """Change the alias that is active."""
         # Find the index of the change_to alias
-        _res = self._alias_exists(alias_name=change_to)
+        _res = self._indexes()._alias_addr.get(change_to)
         if _res:
-            aliindx = self.alias_list.index(_res)
-            self.using_address = self.address_list[aliindx]
-            return _res.alias
+            self.using_address = _res
+            return change_to
         raise ValueError(f"Alias {change_to} not found in group")
 
     def address_for_alias(self, *, alias: str) -> str:
         """Get address associated with alias."""
-        _res = self._alias_exists(alias_name=alias)
+        _res = self._indexes()._alias_addr.get(alias)
         if _res:
-            aliindx = self.alias_list.index(_res)
-            return self.address_list[aliindx]
+            return _res
         raise ValueError(f"Alias {alias} not found in group")
 
     def alias_for_address(self, *, address: str) -> ProfileAlias:
         """Get alias associated with address."""
-        _res = self._address_exists(address=address)
+        _res = self._indexes()._addr_alias.get(address)
         if _res:
-            adindex = self.address_list.index(_res)
-            return self.alias_list[adindex]
+            return _res
         raise ValueError(f"Address {address} not found in group")
 
     def alias_name_for_address(self, *, address: str) -> str:
         """Get alias associated with address."""
-        _res = self._address_exists(address=address)
-        if _res:
-            adindex = self.address_list.index(_res)
-            return self.alias_list[adindex].alias
-        raise ValueError(f"Address {address} not found in group")
+        return self.alias_for_address(address=address).alias
 
     def replace_alias_name(self, *, from_alias: str, to_alias: str) -> str:
         """Replace alias name and return associated address."""
@@ -135,9 +207,10 @@ class ProfileGroup(dataclasses_json.DataClassJsonMixin):
         if _res:
             _rese = self._alias_exists(alias_name=to_alias)
             if not _rese:
-                aliindx = self.alias_list.index(_res)
                 _res.alias = to_alias
-                return self.address_list[aliindx]
+                _addy = self._alias_addr[from_alias]
+                self._invalidate_indexes()
+                return _addy
             raise ValueError(f"Alias {to_alias} already exists")
         raise ValueError(f"Alias {from_alias} not found in group")
 
@@ -172,12 +245,20 @@ class ProfileGroup(dataclasses_json.DataClassJsonMixin):
         raise ValueError(f"{profile_name} profile does not exist")
 
     def keypair_for_address(self, *, address: str) -> crypto.SuiKeyPair:
-        """Fetch an addresses KeyPair."""
-        _res = self._address_exists(address=address)
+        """Fetch an addresses KeyPair.
+
+        Decoded keypairs are cached until keys are added or removed from the group.
+        """
+        _idx = self._indexes()
+        _res = _idx._addr_key.get(address)
         if _res:
-            return crypto.keypair_from_keystring(
-                self.key_list[self.address_list.index(_res)].private_key_base64
-            )
+            _keystr = _res.private_key_base64
+            _cached = _idx._keypairs.get(address)
+            if _cached and _cached[0] == _keystr:
+                return _cached[1]
+            _keypair = crypto.keypair_from_keystring(_keystr)
+            _idx._keypairs[address] = (_keystr, _keypair)
+            return _keypair
         raise ValueError(f"Keypair for address: {address} does not exist.")
 
     @staticmethod
@@ -314,6 +395,102 @@ class ProfileGroup(dataclasses_json.DataClassJsonMixin):
             f"Private keystring {new_key.private_key_base64} already exists attempting new key and address.."
         )
 
+    @staticmethod
+    def keypair_parts(
+        keypair: crypto.SuiKeyPair,
+        alias: str,
+    ) -> tuple[str, ProfileKey, ProfileAlias]:
+        """keypair_parts Produce the address, private key and alias entries for a keypair.
+
+        :param keypair: The keypair
+        :type keypair: crypto.SuiKeyPair
+        :param alias: The alias name to associate
+        :type alias: str
+        :return: address derived from key, private key and alias
+        :rtype: tuple[str, ProfileKey, ProfileAlias]
+        """
+        _pkey_bytes = keypair.to_bytes()
+        _digest = _pkey_bytes[0:33] if _pkey_bytes[0] == 0 else _pkey_bytes[0:34]
+        return (
+            format(f"0x{hashlib.blake2b(_digest, digest_size=32).hexdigest()}"),
+            ProfileKey(keypair.serialize()),
+            ProfileAlias(
+                alias,
+                base64.b64encode(keypair.public_key.scheme_and_key()).decode(),
+            ),
+        )
+
+    def add_keypairs(
+        self,
+        *,
+        keypairs: list[crypto.SuiKeyPair],
+        aliases: Optional[list[str]] = None,
+        alias_prefix: Optional[str] = None,
+        word_counts: Optional[int] = 12,
+        make_active: Optional[bool] = False,
+    ) -> list[str]:
+        """add_keypairs Add a block of keypairs, all validated before the group is changed.
+
+        Aliases are taken, in priority, from aliases, alias_prefix (as 'prefix-n') or generated.
+
+        :param keypairs: The keypairs to add
+        :type keypairs: list[crypto.SuiKeyPair]
+        :param aliases: Alias name for each keypair, defaults to None
+        :type aliases: Optional[list[str]], optional
+        :param alias_prefix: Prefix for numbered alias names, defaults to None
+        :type alias_prefix: Optional[str], optional
+        :param word_counts: Words used when generating alias names, defaults to 12
+        :type word_counts: Optional[int], optional
+        :param make_active: Make the first new address the active address, defaults to False
+        :type make_active: Optional[bool], optional
+        :raises ValueError: If a key or alias already exists or aliases length mismatch
+        :return: The new addresses in keypairs order
+        :rtype: list[str]
+        """
+        if aliases and len(aliases) != len(keypairs):
+            raise ValueError("Length of aliases must match length of keypairs")
+        _alias_names = set(self._indexes()._alias_entry)
+        _key_strings: set[str] = set()
+        _addies: list[str] = []
+        _pfkey: list[ProfileKey] = []
+        _pfalias: list[ProfileAlias] = []
+        for index, keypair in enumerate(keypairs):
+            if aliases:
+                alias = aliases[index]
+            elif alias_prefix:
+                alias = f"{alias_prefix}-{index}"
+            else:
+                alias = ProfileGroup._alias_check_or_gen(
+                    aliases=_alias_names, word_counts=word_counts
+                )
+            if alias in _alias_names:
+                raise ValueError(
+                    f"Alias {alias} already exist attempting new key and address."
+                )
+            new_address, new_key, new_alias = ProfileGroup.keypair_parts(
+                keypair, alias
+            )
+            if (
+                new_key.private_key_base64 in _key_strings
+                or self._key_exists(key_string=new_key.private_key_base64)
+            ):
+                raise ValueError(
+                    f"Private keystring {new_key.private_key_base64} already exists attempting new key and address.."
+                )
+            _alias_names.add(alias)
+            _key_strings.add(new_key.private_key_base64)
+            _addies.append(new_address)
+            _pfkey.append(new_key)
+            _pfalias.append(new_alias)
+        # Populate group
+        self.address_list.extend(_addies)
+        self.key_list.extend(_pfkey)
+        self.alias_list.extend(_pfalias)
+        self._invalidate_indexes()
+        if make_active and _addies:
+            self.using_address = _addies[0]
+        return _addies
+
     def add_keys(self, *, keys: list[dict[str, str]]) -> list[str]:
         """Add in a block of keys w/alias (or generate).
 
@@ -34,6 +34,35 @@ class PysuiConfigModel(dataclasses_json.DataClassJsonMixin):
         default_factory=list
     )
 
+    @classmethod
+    def from_config_dict(cls, config: dict) -> "PysuiConfigModel":
+        """Construct from decoded PysuiConfig.json without dataclasses_json reflection.
+
+        :param config: The decoded configuration
+        :type config: dict
+        :raises KeyError: If a required field is missing
+        :return: The configuration model
+        :rtype: PysuiConfigModel
+        """
+        return cls(
+            config.get("version", ""),
+            config.get("sui_binary", ""),
+            config.get("group_active", ""),
+            [
+                prfgrp.ProfileGroup.from_config_dict(x)
+                for x in config.get("groups") or []
+            ],
+        )
+
+    def to_config_dict(self) -> dict:
+        """Produce the PysuiConfig.json form of the model, equivalent to to_dict."""
+        return {
+            "version": self.version,
+            "sui_binary": self.sui_binary,
+            "group_active": self.group_active,
+            "groups": [x.to_config_dict() for x in self.groups],
+        }
+
     def _group_exists(self, *, group_name: str) -> Union[prfgrp.ProfileGroup, bool]:
         """Check if a group, by name, exists."""
         return next(
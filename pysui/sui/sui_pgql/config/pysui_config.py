@@ -6,11 +6,15 @@
 """Pysui Configuration."""
 
 
+import contextlib
+import json
+import os
 import platform
 from pathlib import Path
 from typing import Optional
 
 from pysui.abstracts.client_keypair import SignatureScheme
+import pysui.sui.sui_crypto as crypto
 from pysui.sui.sui_pgql.config.confmodel import PysuiConfigModel
 import pysui.sui.sui_pgql.config.confgroup as cfg_group
 
@@ -54,15 +58,17 @@ class PysuiConfiguration:
         # If the primmary path doesn't exist create
         if not self._config_root.exists():
             self._config_root.mkdir()
+        # Persistence state, see _write_model and batch_updates
+        self._written: str = ""
+        self._dirty: bool = False
+        self._batch_depth: int = 0
         # If above, then true else determine
         if not self._config_file.exists():
             # Populate the default profile configuration and write
             self._model: PysuiConfigModel = PysuiConfigModel()
-            self._config_file.write_text(self._model.to_json(indent=2))
+            self._write_model()
         else:
-            self._model: PysuiConfigModel = PysuiConfigModel.from_json(
-                self._config_file.read_text(encoding="utf8")
-            )
+            self._model: PysuiConfigModel = self._load_model()
         # Set up user group if not exist, don't overwrite
         self.model.add_group(
             group=cfg_group.ProfileGroup(self.SUI_USER_GROUP, "", "", [], [], [], []),
@@ -73,7 +79,7 @@ class PysuiConfiguration:
             self.rebuild_from_sui_client(
                 rebuild_gql=not self._model.has_group(group_name=self.SUI_GQL_RPC_GROUP)
             )
-            self._config_file.write_text(self._model.to_json(indent=2))
+            self._write_model()
 
         # Fixup GQL
         if not self._model.version:
@@ -88,9 +94,60 @@ class PysuiConfiguration:
             persist=persist,
         )
 
+    def _load_model(self) -> PysuiConfigModel:
+        """Read the configuration model, decoding plain dicts before falling back to from_json."""
+        _content = self._config_file.read_text(encoding="utf8")
+        try:
+            _model = PysuiConfigModel.from_config_dict(json.loads(_content))
+        except (KeyError, TypeError, AttributeError):
+            _model = PysuiConfigModel.from_json(_content)
+        self._written = _content
+        return _model
+
     def _write_model(self):
-        """Writes out the configuration model."""
-        self._config_file.write_text(self.to_json(indent=2))
+        """Writes out the configuration model.
+
+        Deferred while in batch_updates, skipped if the content is unchanged since
+        last read or written and otherwise written to a temporary file renamed over
+        PysuiConfig.json so the file is never partially written.
+        """
+        if self._batch_depth:
+            self._dirty = True
+            return
+        self._dirty = False
+        _content = json.dumps(self._model.to_config_dict(), indent=2)
+        if _content == self._written:
+            return
+        _temp_file = self._config_file.with_name(f"{self._config_file.name}.tmp")
+        with open(_temp_file, "w", encoding="utf8") as config_file:
+            config_file.write(_content)
+            config_file.flush()
+            os.fsync(config_file.fileno())
+        os.replace(_temp_file, self._config_file)
+        self._written = _content
+
+    @contextlib.contextmanager
+    def batch_updates(self):
+        """batch_updates Defer configuration writes, writing once on leaving the context.
+
+        Methods called with persist=True in the context only mark the configuration
+        changed. If the context raises, changes remain pending until the next write.
+
+        .. code-block:: python
+
+            with cfg.batch_updates():
+                cfg.rename_alias(existing_alias="a", new_alias="b")
+                cfg.make_active(alias="b", persist=True)
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._batch_depth -= 1
+            raise
+        self._batch_depth -= 1
+        if not self._batch_depth and self._dirty:
+            self._write_model()
 
     def to_json(self, *_cmds, **kwargs) -> str:
         """Return JSON formatted representation of PysuiConfiguration."""
@@ -420,6 +477,90 @@ class PysuiConfiguration:
             return mnem, new_addy
         raise ValueError(f"{of_keytype}: Not recognized as valid keypair scheme.")
 
+    def new_keypairs(
+        self,
+        *,
+        count: Optional[int] = None,
+        of_keytype: Optional[SignatureScheme] = SignatureScheme.ED25519,
+        in_group: Optional[str] = None,
+        word_counts: Optional[int] = 12,
+        derivation_paths: Optional[list[str]] = None,
+        mnemonic: Optional[str] = None,
+        alias_prefix: Optional[str] = None,
+        make_active: Optional[bool] = False,
+        keystore_file: Optional[str] = None,
+        persist: Optional[bool] = True,
+        **pool_args,
+    ) -> list[tuple[str, str]]:
+        """new_keypairs Create many keypairs on a worker pool and add them to a group at once.
+
+        Keys are derived with sui_crypto.iter_new_keypairs (see for pool_args), added to the
+        group as a block and the configuration is written once. The new mnemonics and
+        keypairs are all held in memory until returned.
+
+        :param count: Number of keys to create, defaults to len(derivation_paths)
+        :type count: Optional[int], optional
+        :param of_keytype: Identifies whether new keys are ed25519, secp256k1 or secp256r1
+        :type of_keytype: Optional[SignatureScheme], optional
+        :param in_group: The group to add keys to, defaults to active group
+        :type in_group: Optional[str], optional
+        :param word_counts: count of words to generate mnemonic phrases, defaults to 12
+        :type word_counts: Optional[int], optional
+        :param derivation_paths: A derivation path for each key, defaults to None
+        :type derivation_paths: Optional[list[str]], optional
+        :param mnemonic: Derive all keys from this mnemonic phrase, defaults to None
+        :type mnemonic: Optional[str], optional
+        :param alias_prefix: Aliases are 'prefix-n', generated if None
+        :type alias_prefix: Optional[str], optional
+        :param make_active: Make the first new address the active_address, defaults to False
+        :type make_active: Optional[bool], optional
+        :param keystore_file: Also append the new keystrings to this keystore file, created
+            if it does not exist, after they are added to the group, defaults to None
+        :type keystore_file: Optional[str], optional
+        :param persist: Persist updates to PysuiConfig.json, defaults to True
+        :type persist: Optional[bool], optional
+        :return: The mnemonic phrase and new address for each key
+        :rtype: list[tuple[str, str]]
+        """
+        # Resolve group
+        _group = (
+            self._model.get_group(group_name=in_group)
+            if in_group
+            else self.active_group
+        )
+        if of_keytype not in [
+            SignatureScheme.ED25519,
+            SignatureScheme.SECP256K1,
+            SignatureScheme.SECP256R1,
+        ]:
+            raise ValueError(f"{of_keytype}: Not recognized as valid keypair scheme.")
+        mnems: list[str] = []
+        keypairs: list[crypto.SuiKeyPair] = []
+        for mnem, keypair in crypto.iter_new_keypairs(
+            count,
+            of_keytype,
+            word_counts,
+            derv_paths=derivation_paths,
+            mnemonic=mnemonic,
+            **pool_args,
+        ):
+            mnems.append(mnem)
+            keypairs.append(keypair)
+        # Validates keys and aliases before anything is written
+        new_addies = _group.add_keypairs(
+            keypairs=keypairs,
+            alias_prefix=alias_prefix,
+            word_counts=word_counts,
+            make_active=make_active,
+        )
+        if keystore_file:
+            crypto.write_keystore(keystore_file, keypairs, append=True)
+        if make_active and _group.group_name != self.active_group.group_name:
+            self._model.active_group = _group.group_name
+        if persist:
+            self._write_model()
+        return list(zip(mnems, new_addies))
+
     def add_keys(
         self,
         *,
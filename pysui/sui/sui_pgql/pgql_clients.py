@@ -9,7 +9,7 @@
 from abc import ABC, abstractmethod
 import logging
 import asyncio
-from typing import Callable, Any, Optional, Union
+from typing import AsyncIterator, Callable, Any, Optional, Union
 from deprecated.sphinx import versionchanged, versionadded, deprecated
 from gql import Client, gql
 from gql.client import ReconnectingAsyncClientSession
@@ -17,6 +17,8 @@ from gql.client import ReconnectingAsyncClientSession
 import httpx
 
 from gql.transport.httpx import HTTPXAsyncTransport
+from gql.transport.websockets import WebsocketsTransport
+from websockets.exceptions import WebSocketException
 
 from gql.transport import exceptions as texc
 from gql.dsl import (
@@ -128,11 +130,19 @@ class BaseSuiGQLClient:
         """Fetch the graphql configuration."""
         return self._schema.rpc_config
 
+    @versionchanged(version="0.71.0", reason="Fetched on first use if lazy_protocol")
     def protocol(
         self, for_version: Optional[str] = None
     ) -> pgql_type.TransactionConstraints:
         """Fetch the protocol constraint block."""
-        return self._schema.rpc_config.protocolConfig
+        return self._schema.protocol_config()
+
+    @versionadded(version="0.71.0", reason="Startup diagnostics")
+    @property
+    def startup_timings(self) -> dict[str, float]:
+        """Seconds spent in each client startup step (introspection, service_config,
+        protocol_config) and in total."""
+        return self._schema.startup_timings
 
     def url(self) -> str:
         """Fetch the active GraphQL URL."""
@@ -201,20 +211,27 @@ class SuiGQLClient(BaseSuiGQLClient):
     @versionchanged(
         version="0.65.0", reason="BREAKING Uses PysuiConfiguration instead of SuiConfig"
     )
+    @versionchanged(version="0.71.0", reason="Lazy protocol configuration option")
     def __init__(
         self,
         *,
         pysui_config: PysuiConfiguration,
         write_schema: Optional[bool] = False,
         default_header: Optional[dict] = None,
+        lazy_protocol: Optional[bool] = False,
     ):
-        """Sui GraphQL Client initializer."""
+        """Sui GraphQL Client initializer.
+
+        :param lazy_protocol: Fetch the protocol configuration on first protocol()
+            call instead of at startup, defaults to False
+        :type lazy_protocol: Optional[bool], optional
+        """
         gurl = pysui_config.url
         genv = pysui_config.active_profile
         # gurl, genv = BaseSuiGQLClient._resolve_url(config, schema_version)
         super().__init__(
             pysui_config=pysui_config,
-            schema=scm.Schema(gql_url=gurl, gql_env=genv),
+            schema=scm.Schema(gql_url=gurl, gql_env=genv, lazy_protocol=lazy_protocol),
             write_schema=write_schema,
             default_header=default_header,
         )
@@ -357,20 +374,92 @@ class SuiGQLClient(BaseSuiGQLClient):
             )
 
 
+def _ws_url(url: str) -> str:
+    """Websocket url for the same endpoint as an http(s) url."""
+    if url.startswith("https://"):
+        return "wss://" + url[8:]
+    if url.startswith("http://"):
+        return "ws://" + url[7:]
+    return url
+
+
+async def _subscribe_document(
+    ws_url: str,
+    node: DocumentNode,
+    headers: Optional[dict],
+    encode_fn: Optional[Callable[[dict], Any]],
+    *,
+    reconnect: bool,
+    retry_delay: float,
+    max_retry_delay: float,
+) -> AsyncIterator[SuiRpcResult]:
+    """Yield each subscription message, resubscribing after connection loss."""
+    delay = retry_delay
+    while True:
+        transport = WebsocketsTransport(url=ws_url, headers=headers or None)
+        try:
+            async with Client(transport=transport) as session:
+                async for message in session.subscribe(node):
+                    delay = retry_delay
+                    try:
+                        yield SuiRpcResult(
+                            True, None, encode_fn(message) if encode_fn else message
+                        )
+                    except (KeyError, TypeError, ValueError) as exc:
+                        yield SuiRpcResult(
+                            False,
+                            exc.__class__.__name__,
+                            pgql_type.ErrorGQL.from_query(exc.args),
+                        )
+            # Completed by the server
+            return
+        except texc.TransportQueryError as gte:
+            yield SuiRpcResult(
+                False, "TransportQueryError", pgql_type.ErrorGQL.from_query(gte.errors)
+            )
+            return
+        except (
+            texc.TransportClosed,
+            texc.TransportServerError,
+            WebSocketException,
+            OSError,
+            asyncio.TimeoutError,
+        ) as exc:
+            if not reconnect:
+                yield SuiRpcResult(
+                    False, f"Subscription error: {exc.__class__.__name__}", str(exc)
+                )
+                return
+            logger.warning(
+                "Subscription connection lost (%s), reconnecting in %.1fs",
+                exc.__class__.__name__,
+                delay,
+            )
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, max_retry_delay)
+
+
 class AsyncSuiGQLClient(BaseSuiGQLClient):
     """Asynchronous pysui GraphQL client."""
 
     @versionchanged(
         version="0.65.0", reason="BREAKING Uses PysuiConfiguration instead of SuiConfig"
     )
+    @versionchanged(version="0.71.0", reason="Subscription websocket url")
     def __init__(
         self,
         *,
         pysui_config: PysuiConfiguration,
         write_schema: Optional[bool] = False,
         default_header: Optional[dict] = None,
+        ws_url: Optional[str] = None,
     ):
-        """Async Sui GraphQL Client initializer."""
+        """Async Sui GraphQL Client initializer.
+
+        :param ws_url: Subscriptions endpoint, defaults to None (configuration url
+            with a ws or wss scheme)
+        :type ws_url: Optional[str], optional
+        """
         scm_mgr: scm.Schema = scm.Schema(
             gql_url=pysui_config.url, gql_env=pysui_config.active_profile
         )
@@ -383,6 +472,12 @@ class AsyncSuiGQLClient(BaseSuiGQLClient):
             default_header=default_header,
         )
         self._slock = asyncio.Semaphore()
+        self._ws_url = ws_url or _ws_url(pysui_config.url)
+
+    @property
+    def ws_url(self) -> str:
+        """Fetch the subscriptions websocket url."""
+        return self._ws_url
 
     @property
     def session(self) -> Any:
@@ -535,3 +630,54 @@ class AsyncSuiGQLClient(BaseSuiGQLClient):
             return SuiRpcResult(
                 False, "ValueError", pgql_type.ErrorGQL.from_query(ve.args)
             )
+
+    @versionadded(version="0.71.0", reason="GraphQL subscriptions")
+    async def subscribe_query_node(
+        self,
+        *,
+        with_node: PGQL_QueryNode,
+        with_headers: Optional[dict] = None,
+        encode_fn: Optional[Callable[[dict], Any]] = None,
+        reconnect: Optional[bool] = True,
+        retry_delay: Optional[float] = 0.5,
+        max_retry_delay: Optional[float] = 30.0,
+    ) -> AsyncIterator[SuiRpcResult]:
+        """subscribe_query_node Subscribe with a pysui GraphQL subscription QueryNode.
+
+        Each message is yielded as a SuiRpcResult, decoded by the encode function. A
+        lost connection is reopened and the subscription resent after a doubling
+        delay. Messages sent while disconnected are not recovered, use an
+        EventStream (pgql_event_stream) for gap free delivery.
+
+        :param with_node: The subscription QueryNode (e.g. SubscribeEvents)
+        :type with_node: PGQL_QueryNode
+        :param with_headers: Add extra arguments for websocket headers, default to None
+        :type with_headers: Optional[dict]
+        :param encode_fn: Encoding function, defaults to None (the QueryNode's)
+        :type encode_fn: Optional[Callable[[dict], Any]], optional
+        :param reconnect: Reconnect after connection loss, defaults to True
+        :type reconnect: Optional[bool], optional
+        :param retry_delay: First reconnect delay in seconds, defaults to 0.5
+        :type retry_delay: Optional[float], optional
+        :param max_retry_delay: Upper bound of the reconnect delay, defaults to 30.0
+        :type max_retry_delay: Optional[float], optional
+        :return: Async iterator of SuiRpcResult, one per message
+        :rtype: AsyncIterator[SuiRpcResult]
+        """
+        try:
+            qdoc_node = self._qnode_pre_run(with_node)
+        except ValueError as ve:
+            yield SuiRpcResult(
+                False, "ValueError", pgql_type.ErrorGQL.from_query(ve.args)
+            )
+            return
+        async for result in _subscribe_document(
+            self._ws_url,
+            qdoc_node,
+            with_headers or self._default_header,
+            encode_fn or with_node.encode_fn(),
+            reconnect=reconnect,
+            retry_delay=retry_delay,
+            max_retry_delay=max_retry_delay,
+        ):
+            yield result
@@ -9,12 +9,11 @@
 import dataclasses
 from typing import Any, Optional, Union, Callable
 import dataclasses_json
+from deprecated.sphinx import versionadded, versionchanged
 
 import pysui.sui.sui_pgql.pgql_types as pgql_type
 
-_QUERY = """
-
-    query {
+_SERVICE_SELECTION = """
         chainIdentifier
         checkpoints (last: 1) {
             nodes {
@@ -43,6 +42,9 @@ _QUERY = """
             maxTransactionIds
             maxScanLimit
         }
+"""
+
+_PROTOCOL_SELECTION = """
       protocolConfig {
           protocolVersion
           configs {
@@ -54,9 +56,14 @@ _QUERY = """
             value
           }
         }
-    }
 """
 
+_QUERY = "query {" + _SERVICE_SELECTION + _PROTOCOL_SELECTION + "}"
+
+_SERVICE_QUERY = "query {" + _SERVICE_SELECTION + "}"
+
+_PROTOCOL_QUERY = "query {" + _PROTOCOL_SELECTION + "}"
+
 
 @dataclasses_json.dataclass_json(letter_case=dataclasses_json.LetterCase.CAMEL)
 @dataclasses.dataclass
@@ -102,22 +109,77 @@ class CheckpointConnectionGQL:
     nodes: list[CheckpointNodeGQL]
 
 
+_SERVICE_FIELDS: frozenset[str] = frozenset(
+    field.name for field in dataclasses.fields(ServiceConfigGQL)
+)
+
+
+def _protocol_from_query(in_data: dict) -> pgql_type.ProtocolConfigGQL:
+    """Decode the protocolConfig result without dataclasses_json reflection."""
+    return pgql_type.ProtocolConfigGQL(
+        protocolVersion=in_data["protocolVersion"],
+        configs=[
+            pgql_type.KeyValue(kv["key"], kv["value"]) for kv in in_data["configs"]
+        ],
+        featureFlags=[
+            pgql_type.KeyValue(kv["key"], kv["value"]) for kv in in_data["featureFlags"]
+        ],
+    )
+
+
 # TODO: Make primary when changes moved through mainnet
 @dataclasses_json.dataclass_json(letter_case=dataclasses_json.LetterCase.CAMEL)
 @dataclasses.dataclass
 class SuiConfigGQL:
     chainIdentifier: str
     serviceConfig: ServiceConfigGQL
-    protocolConfig: pgql_type.ProtocolConfigGQL
-    checkpoints: CheckpointConnectionGQL
+    # Defaults keep the original positional order, protocolConfig may be lazy
+    protocolConfig: Optional[pgql_type.ProtocolConfigGQL] = None
+    checkpoints: Optional[CheckpointConnectionGQL] = None
     gqlEnvironment: Optional[str] = None
 
     @classmethod
+    @versionchanged(
+        version="0.71.0",
+        reason="Decodes directly, protocolConfig is optional (loaded on demand)",
+    )
     def from_query(clz, in_data: dict) -> "SuiConfigGQL":
         """."""
-        return SuiConfigGQL.from_dict(in_data)
+        service = in_data["serviceConfig"]
+        protocol = in_data.get("protocolConfig")
+        return SuiConfigGQL(
+            chainIdentifier=in_data["chainIdentifier"],
+            serviceConfig=ServiceConfigGQL(
+                **{key: val for key, val in service.items() if key in _SERVICE_FIELDS}
+            ),
+            checkpoints=CheckpointConnectionGQL(
+                [
+                    CheckpointNodeGQL(
+                        node["sequenceNumber"], node["timestamp"], node["epoch"]
+                    )
+                    for node in in_data["checkpoints"]["nodes"]
+                ]
+            ),
+            protocolConfig=_protocol_from_query(protocol) if protocol else None,
+        )
 
 
 def pgql_config(env: str, sversion: Optional[str] = None) -> tuple[str, Callable]:
     """Get the configuration for Sui GraphQL."""
     return _QUERY, SuiConfigGQL.from_query
+
+
+@versionadded(version="0.71.0", reason="Split startup configuration queries")
+def pgql_service_config() -> tuple[str, Callable[[dict], SuiConfigGQL]]:
+    """Get the configuration query without the protocol configuration."""
+    return _SERVICE_QUERY, SuiConfigGQL.from_query
+
+
+@versionadded(version="0.71.0", reason="Split startup configuration queries")
+def pgql_protocol_config() -> (
+    tuple[str, Callable[[dict], pgql_type.ProtocolConfigGQL]]
+):
+    """Get the protocol configuration query."""
+    return _PROTOCOL_QUERY, lambda in_data: _protocol_from_query(
+        in_data["protocolConfig"]
+    )
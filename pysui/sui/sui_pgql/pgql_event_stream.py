@@ -0,0 +1,382 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""Gap free event and transaction streams over Sui GraphQL paging."""
+
+import asyncio
+import dataclasses
+import datetime
+import inspect
+import json
+import logging
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Optional, Union
+
+from deprecated.sphinx import versionadded
+from gql.transport import exceptions as texc
+
+from pysui.sui.sui_pgql.pgql_clients import AsyncSuiGQLClient, PGQL_QueryNode
+import pysui.sui.sui_pgql.pgql_query as qn
+import pysui.sui.sui_pgql.pgql_types as pgql_type
+
+# Standard library logging setup
+logger = logging.getLogger("pysui.pgql_event_stream")
+if not logging.getLogger().handlers:
+    logger.addHandler(logging.NullHandler())
+    logger.propagate = False
+
+StreamItem = Union[pgql_type.EventGQL, pgql_type.TransactionSummaryGQL]
+
+
+@dataclasses.dataclass(frozen=True)
+class StreamCheckpoint:
+    """Position of the last delivered item.
+
+    Events have no cursor of their own, the position is the page cursor the
+    items were fetched after and how many of that page's items were delivered.
+    """
+
+    cursor: Optional[str] = None
+    offset: int = 0
+
+
+class CursorStore(ABC):
+    """Persists an EventStream checkpoint."""
+
+    @abstractmethod
+    def load(self) -> StreamCheckpoint:
+        """Return the stored checkpoint or the start of the stream."""
+
+    @abstractmethod
+    def save(self, checkpoint: StreamCheckpoint) -> None:
+        """Store the checkpoint."""
+
+
+class MemoryCursorStore(CursorStore):
+    """Keeps the checkpoint in memory, for streams that need not survive restarts."""
+
+    def __init__(self, checkpoint: Optional[StreamCheckpoint] = None):
+        """Initialize store.
+
+        :param checkpoint: Where to start, defaults to None (start of stream)
+        :type checkpoint: Optional[StreamCheckpoint], optional
+        """
+        self._checkpoint = checkpoint or StreamCheckpoint()
+
+    def load(self) -> StreamCheckpoint:
+        """Return the checkpoint."""
+        return self._checkpoint
+
+    def save(self, checkpoint: StreamCheckpoint) -> None:
+        """Store the checkpoint."""
+        self._checkpoint = checkpoint
+
+
+class FileCursorStore(CursorStore):
+    """Keeps the checkpoint in a JSON file, replaced atomically on each save."""
+
+    def __init__(self, file_path: str, *, fsync: Optional[bool] = False):
+        """Initialize store.
+
+        :param file_path: The checkpoint file, created on first save
+        :type file_path: str
+        :param fsync: Flush each save to disk to survive power loss, defaults to False
+        :type fsync: Optional[bool], optional
+        """
+        self._path = os.path.abspath(os.path.expanduser(file_path))
+        self._fsync = fsync
+
+    def load(self) -> StreamCheckpoint:
+        """Return the stored checkpoint or the start of the stream."""
+        try:
+            with open(self._path, encoding="utf8") as ckpt_file:
+                return StreamCheckpoint(**json.load(ckpt_file))
+        except FileNotFoundError:
+            return StreamCheckpoint()
+
+    def save(self, checkpoint: StreamCheckpoint) -> None:
+        """Store the checkpoint."""
+        fdesc, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(self._path), suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fdesc, "w", encoding="utf8") as ckpt_file:
+                json.dump(dataclasses.asdict(checkpoint), ckpt_file)
+                if self._fsync:
+                    ckpt_file.flush()
+                    os.fsync(ckpt_file.fileno())
+            os.replace(tmp_path, self._path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+@dataclasses.dataclass
+class StreamMetrics:
+    """Live EventStream counters, lag is seconds from item timestamp to delivery."""
+
+    delivered: int = 0
+    pages: int = 0
+    polls: int = 0
+    errors: int = 0
+    backfilling: bool = True
+    lag: float = 0.0
+    max_lag: float = 0.0
+
+
+def _timestamp_lag(timestamp: Optional[str]) -> Optional[float]:
+    """Seconds from an ISO 8601 chain timestamp to now."""
+    if not timestamp:
+        return None
+    try:
+        stamp = datetime.datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if stamp.tzinfo is None:
+        stamp = stamp.replace(tzinfo=datetime.timezone.utc)
+    return (datetime.datetime.now(datetime.timezone.utc) - stamp).total_seconds()
+
+
+@versionadded(version="0.71.0", reason="Gap free event streaming.")
+class EventStream:
+    """Delivers events (GetEvents) or transactions (GetFilteredTx) in order.
+
+    The stream resumes from the store's checkpoint: it backfills at the service's
+    maximum page size, fetching the next page while the current one is delivered,
+    then polls for new items, or with wake_on set waits for a subscription message
+    announcing them. The checkpoint is saved after each delivered item so a
+    restart skips no items. Delivery is at least once: an item whose handler
+    returned but whose checkpoint was not yet saved, when the process stopped, is
+    delivered again on the next run, handlers should be idempotent.
+
+    Transport failures are retried with backoff, other query failures stop the
+    stream with ValueError.
+
+    The handler is called with each item, it may be a coroutine function. If the
+    handler raises, the stream stops with that exception and the item is
+    delivered again on the next run. Returning False stops the stream after the
+    item.
+    """
+
+    def __init__(
+        self,
+        client: AsyncSuiGQLClient,
+        *,
+        handler: Callable[[StreamItem], Any],
+        event_filter: Optional[dict] = None,
+        tx_filter: Optional[dict] = None,
+        store: Optional[CursorStore] = None,
+        page_size: Optional[int] = None,
+        poll_interval: Optional[float] = 0.5,
+        retry_delay: Optional[float] = 0.5,
+        max_retry_delay: Optional[float] = 30.0,
+        wake_on: Optional[PGQL_QueryNode] = None,
+    ):
+        """Initialize stream.
+
+        :param client: The asynchronous GraphQL client
+        :type client: AsyncSuiGQLClient
+        :param handler: Called with each EventGQL or TransactionSummaryGQL
+        :type handler: Callable[[StreamItem], Any]
+        :param event_filter: GetEvents filter, defaults to None
+        :type event_filter: Optional[dict], optional
+        :param tx_filter: GetFilteredTx filter, defaults to None
+        :type tx_filter: Optional[dict], optional
+        :param store: Checkpoint persistence, defaults to None (MemoryCursorStore)
+        :type store: Optional[CursorStore], optional
+        :param page_size: Items per query, defaults to None (service maxPageSize)
+        :type page_size: Optional[int], optional
+        :param poll_interval: Seconds between polls once caught up, defaults to 0.5
+        :type poll_interval: Optional[float], optional
+        :param retry_delay: First delay in seconds after a failed query, defaults to 0.5
+        :type retry_delay: Optional[float], optional
+        :param max_retry_delay: Upper bound of the doubling retry delay, defaults to 30.0
+        :type max_retry_delay: Optional[float], optional
+        :param wake_on: Subscription (e.g. SubscribeEvents) whose messages trigger the
+            next query once caught up, poll_interval is then the fallback, defaults to None
+        :type wake_on: Optional[PGQL_QueryNode], optional
+        :raises ValueError: If not exactly one of event_filter or tx_filter is set
+        """
+        if (event_filter is None) == (tx_filter is None):
+            raise ValueError("EventStream requires one of event_filter or tx_filter")
+        self._client = client
+        self._handler = handler
+        self._event_filter = event_filter
+        self._tx_filter = tx_filter
+        self._store = store or MemoryCursorStore()
+        self._page_size = page_size
+        self._poll_interval = poll_interval
+        self._retry_delay = retry_delay
+        self._max_retry_delay = max_retry_delay
+        self._wake_on = wake_on
+        self._wake_event: Optional[asyncio.Event] = None
+        self._checkpoint = self._store.load()
+        self._metrics = StreamMetrics()
+        self._stop_event: Optional[asyncio.Event] = None
+        self._stopping = False
+
+    @property
+    def metrics(self) -> StreamMetrics:
+        """Return the live stream counters."""
+        return self._metrics
+
+    @property
+    def checkpoint(self) -> StreamCheckpoint:
+        """Return the position of the last delivered item."""
+        return self._checkpoint
+
+    def stop(self) -> None:
+        """Stop the stream after the item being delivered, if any."""
+        self._stopping = True
+        if self._stop_event:
+            self._stop_event.set()
+
+    def _query(self, cursor: Optional[str], page_size: int) -> PGQL_QueryNode:
+        """Query for the page following cursor."""
+        # Paging queries are no-ops without hasNextPage, polls continue past the end
+        next_page = pgql_type.PagingCursor(True, cursor) if cursor else None
+        if self._event_filter is not None:
+            return qn.GetEvents(
+                event_filter=self._event_filter,
+                next_page=next_page,
+                page_size=page_size,
+            )
+        return qn.GetFilteredTx(
+            tx_filter=self._tx_filter, next_page=next_page, page_size=page_size
+        )
+
+    async def _fetch(
+        self, cursor: Optional[str], page_size: int
+    ) -> Union[pgql_type.EventsGQL, pgql_type.TransactionSummariesGQL]:
+        """Fetch the page following cursor.
+
+        Transport failures are retried with backoff until the query succeeds, any
+        other failure (query, syntax or validation errors) would fail every retry
+        and is raised.
+
+        :raises ValueError: If the query fails other than in transport
+        """
+        delay = self._retry_delay
+        while True:
+            try:
+                result = await self._client.execute_query_node(
+                    with_node=self._query(cursor, page_size)
+                )
+                if result.is_ok() and hasattr(result.result_data, "data"):
+                    self._metrics.pages += 1
+                    return result.result_data
+                if result.is_ok() or not str(result.result_string).startswith(
+                    "HTTPX error"
+                ):
+                    raise ValueError(
+                        f"Stream query after {cursor} failed: "
+                        f"{result.result_string} {result.result_data}"
+                    )
+                logger.warning(
+                    "Stream query after %s failed: %s", cursor, result.result_string
+                )
+            except (
+                texc.TransportClosed,
+                texc.TransportServerError,
+                OSError,
+                asyncio.TimeoutError,
+            ) as exc:
+                logger.warning("Stream query after %s failed: %s", cursor, exc)
+            self._metrics.errors += 1
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self._max_retry_delay)
+
+    async def _watch(self) -> None:
+        """Set the wake event on each subscription message."""
+        async for result in self._client.subscribe_query_node(with_node=self._wake_on):
+            if result.is_ok():
+                self._wake_event.set()
+            else:
+                logger.warning("Stream wake subscription: %s", result.result_string)
+
+    async def _wait(self, seconds: float) -> None:
+        """Sleep until stopped, woken or seconds elapse."""
+        waits = [asyncio.ensure_future(self._stop_event.wait())]
+        if self._wake_event:
+            waits.append(asyncio.ensure_future(self._wake_event.wait()))
+        _, pending = await asyncio.wait(
+            waits, timeout=seconds, return_when=asyncio.FIRST_COMPLETED
+        )
+        for waiter in pending:
+            waiter.cancel()
+        if self._wake_event:
+            self._wake_event.clear()
+
+    async def _deliver(self, cursor: Optional[str], items: list[StreamItem]) -> None:
+        """Hand items fetched after cursor to the handler, checkpointing each."""
+        offset = self._checkpoint.offset if self._checkpoint.cursor == cursor else 0
+        for item in items[offset:]:
+            if self._stopping:
+                break
+            result = self._handler(item)
+            if inspect.isawaitable(result):
+                result = await result
+            offset += 1
+            self._checkpoint = StreamCheckpoint(cursor, offset)
+            self._store.save(self._checkpoint)
+            self._metrics.delivered += 1
+            lag = _timestamp_lag(getattr(item, "timestamp", None))
+            if lag is not None:
+                self._metrics.lag = lag
+                self._metrics.max_lag = max(self._metrics.max_lag, lag)
+            if result is False:
+                self._stopping = True
+
+    async def run(self) -> StreamCheckpoint:
+        """Stream items until stopped.
+
+        :return: The checkpoint of the last delivered item
+        :rtype: StreamCheckpoint
+        """
+        self._stopping = False
+        self._stop_event = asyncio.Event()
+        self._checkpoint = self._store.load()
+        page_size = (
+            self._page_size or self._client.rpc_config().serviceConfig.maxPageSize
+        )
+        cursor = self._checkpoint.cursor
+        watcher = None
+        if self._wake_on:
+            self._wake_event = asyncio.Event()
+            watcher = asyncio.ensure_future(self._watch())
+        pending = asyncio.ensure_future(self._fetch(cursor, page_size))
+        try:
+            while not self._stopping:
+                page = await pending
+                pending = None
+                end_cursor = page.next_cursor.endCursor if page.data else None
+                has_next = bool(page.next_cursor.hasNextPage and end_cursor)
+                self._metrics.backfilling = has_next
+                if has_next:
+                    # Prefetch while this page is delivered
+                    pending = asyncio.ensure_future(self._fetch(end_cursor, page_size))
+                await self._deliver(cursor, page.data)
+                if self._stopping:
+                    break
+                if end_cursor:
+                    cursor = end_cursor
+                    self._checkpoint = StreamCheckpoint(cursor)
+                    self._store.save(self._checkpoint)
+                if pending is None:
+                    # Caught up, a full page means more are waiting
+                    if len(page.data) < page_size:
+                        self._metrics.polls += 1
+                        await self._wait(self._poll_interval)
+                    if self._stopping:
+                        break
+                    pending = asyncio.ensure_future(self._fetch(cursor, page_size))
+        finally:
+            if pending:
+                pending.cancel()
+            if watcher:
+                watcher.cancel()
+        return self._checkpoint
@@ -5,6 +5,7 @@
 
 """QueryNode generators."""
 
+import base64
 from typing import Optional, Callable, Union, Any
 from gql import gql
 from gql.dsl import (
@@ -14,6 +15,7 @@ from gql.dsl import (
     DSLMetaField,
     DSLInlineFragment,
     DSLMutation,
+    DSLSubscription,
 )
 from graphql import DocumentNode
 
@@ -571,6 +573,7 @@ class GetEvents(PGQL_QueryNode):
         *,
         event_filter: dict,
         next_page: Optional[pgql_type.PagingCursor] = None,
+        page_size: Optional[int] = None,
     ) -> None:
         """QueryNode initializer to query chain events of type defined by event_filter.
 
@@ -597,9 +600,12 @@ class GetEvents(PGQL_QueryNode):
         :type event_filter: dict
         :param next_page: pgql_type.PagingCursor to advance query, defaults to None
         :type next_page: pgql_type.PagingCursor
+        :param page_size: Number of events to fetch, defaults to None (service default)
+        :type page_size: Optional[int], optional
         """
         self.event_filter = event_filter
         self.next_page = next_page
+        self.page_size = page_size
 
     def as_document_node(self, schema: DSLSchema) -> DocumentNode:
         """Build DocumentNode."""
@@ -611,6 +617,8 @@ class GetEvents(PGQL_QueryNode):
         qres = schema.Query.events(filter=self.event_filter)
         if self.next_page:
             qres(after=self.next_page.endCursor)
+        if self.page_size:
+            qres(first=self.page_size)
 
         qres.select(
             cursor=schema.EventConnection.pageInfo.select(pg_cursor.fragment(schema)),
@@ -722,7 +730,11 @@ class GetFilteredTx(PGQL_QueryNode):
     """GetTxs returns all transactions with TransactionBlockFilter set and is controlled by paging."""
 
     def __init__(
-        self, *, tx_filter: dict, next_page: Optional[pgql_type.PagingCursor] = None
+        self,
+        *,
+        tx_filter: dict,
+        next_page: Optional[pgql_type.PagingCursor] = None,
+        page_size: Optional[int] = None,
     ) -> None:
         """QueryNode initializer.
 
@@ -730,9 +742,12 @@ class GetFilteredTx(PGQL_QueryNode):
         :type tx_filter: dict
         :param next_page: _description_, defaults to None
         :type next_page: Optional[pgql_type.PagingCursor], optional
+        :param page_size: Number of transactions to fetch, defaults to None (service default)
+        :type page_size: Optional[int], optional
         """
         self.next_page = next_page
         self.filter = tx_filter
+        self.page_size = page_size
 
     def as_document_node(self, schema: DSLSchema) -> DocumentNode:
         """Builds the GQL DocumentNode
@@ -746,6 +761,8 @@ class GetFilteredTx(PGQL_QueryNode):
         qres = schema.Query.transactionBlocks(filter=self.filter)
         if self.next_page:
             qres(after=self.next_page.endCursor)
+        if self.page_size:
+            qres(first=self.page_size)
 
         pg_cursor = frag.PageCursor().fragment(schema)
 
@@ -1549,10 +1566,22 @@ class DryRunTransaction(PGQL_QueryNode):
 class ExecuteTransaction(PGQL_QueryNode):
     """."""
 
-    def __init__(self, *, tx_bytestr: str, sig_array: list[str]) -> None:
-        """__init__ Initialize ExecuteTransaction object."""
-        self.tx_data: str = tx_bytestr
-        self.sigs: list[str] = sig_array
+    def __init__(
+        self, *, tx_bytestr: Union[str, bytes], sig_array: list[Union[str, bytes]]
+    ) -> None:
+        """__init__ Initialize ExecuteTransaction object.
+
+        Transaction and signature bytes are base64 encoded here, at the wire boundary.
+        """
+        self.tx_data: str = (
+            tx_bytestr
+            if isinstance(tx_bytestr, str)
+            else base64.b64encode(tx_bytestr).decode()
+        )
+        self.sigs: list[str] = [
+            sig if isinstance(sig, str) else base64.b64encode(sig).decode()
+            for sig in sig_array
+        ]
 
     def as_document_node(self, schema: DSLSchema) -> DocumentNode:
         """."""
@@ -1575,3 +1604,77 @@ class ExecuteTransaction(PGQL_QueryNode):
     def encode_fn() -> Union[Callable[[dict], pgql_type.ExecutionResultGQL], None]:
         """Return the serialization Execution result function."""
         return pgql_type.ExecutionResultGQL.from_query
+
+
+def _subscription_root(schema: DSLSchema):
+    """Return the schema Subscription type or raise ValueError."""
+    if getattr(schema, "_schema").subscription_type is None:
+        raise ValueError("GraphQL schema does not support subscriptions")
+    return schema.Subscription
+
+
+class SubscribeEvents(PGQL_QueryNode):
+    """SubscribeEvents When subscribed, receive each event matching the filter."""
+
+    def __init__(self, *, event_filter: Optional[dict] = None) -> None:
+        """QueryNode initializer to subscribe to events of type defined by event_filter.
+
+        Filter keys are those of the Sui GraphQL schema's SubscriptionEventFilter, e.g.
+          {
+              "eventType": "0x3::validator::StakingRequestEvent"
+          }
+
+        :param event_filter: Filter key/values, defaults to None (all events)
+        :type event_filter: Optional[dict], optional
+        """
+        self.event_filter = event_filter
+
+    def as_document_node(self, schema: DSLSchema) -> DocumentNode:
+        """Build DocumentNode."""
+        std_event = frag.StandardEvent()
+        sres = _subscription_root(schema).events
+        if self.event_filter:
+            sres(filter=self.event_filter)
+        sres.select(std_event.fragment(schema))
+        return dsl_gql(std_event.fragment(schema), DSLSubscription(sres))
+
+    @staticmethod
+    def encode_fn() -> Callable[[dict], pgql_type.EventGQL]:
+        """Return the serializer to EventGQL function."""
+        return lambda in_data: pgql_type.EventGQL.from_query(in_data.pop("events"))
+
+
+class SubscribeTransactions(PGQL_QueryNode):
+    """SubscribeTransactions When subscribed, receive each transaction's effects summary."""
+
+    def __init__(self, *, tx_filter: Optional[dict] = None) -> None:
+        """QueryNode initializer.
+
+        :param tx_filter: SubscriptionTransactionFilter dict, defaults to None (all)
+        :type tx_filter: Optional[dict], optional
+        """
+        self.filter = tx_filter
+
+    def as_document_node(self, schema: DSLSchema) -> DocumentNode:
+        """Build DocumentNode."""
+        sres = _subscription_root(schema).transactions
+        if self.filter:
+            sres(filter=self.filter)
+        sres.select(
+            schema.TransactionBlock.digest,
+            schema.TransactionBlock.signatures,
+            schema.TransactionBlock.kind.select(tx_kind=DSLMetaField("__typename")),
+            schema.TransactionBlock.effects.select(
+                schema.TransactionBlockEffects.status,
+                schema.TransactionBlockEffects.timestamp,
+                schema.TransactionBlockEffects.errors,
+            ),
+        )
+        return dsl_gql(DSLSubscription(sres))
+
+    @staticmethod
+    def encode_fn() -> Callable[[dict], pgql_type.TransactionSummaryGQL]:
+        """Return the serializer to TransactionSummaryGQL function."""
+        return lambda in_data: pgql_type.TransactionSummaryGQL.from_query(
+            in_data.pop("transactions")
+        )
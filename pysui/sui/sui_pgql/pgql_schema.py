@@ -5,6 +5,11 @@
 
 """Schema management module."""
 
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+from deprecated.sphinx import versionadded, versionchanged
 from gql import Client, gql
 from gql.client import ReconnectingAsyncClientSession
 import httpx
@@ -15,7 +20,12 @@ from gql.transport.httpx import HTTPXAsyncTransport
 from gql.dsl import (
     DSLSchema,
 )
-from pysui.sui.sui_pgql.pgql_configs import pgql_config, SuiConfigGQL
+from pysui.sui.sui_pgql.pgql_configs import (
+    pgql_protocol_config,
+    pgql_service_config,
+    SuiConfigGQL,
+)
+import pysui.sui.sui_pgql.pgql_types as pgql_type
 
 
 class Schema:
@@ -23,34 +33,105 @@ class Schema:
 
     SCHEMA_HEADER_SCHEMA_KEY: str = "x-sui-rpc-version"
 
-    def __init__(self, *, gql_url: str, gql_env: str):
-        """."""
+    @versionchanged(
+        version="0.71.0",
+        reason="Startup queries run concurrently, protocol configuration may be lazy",
+    )
+    def __init__(
+        self, *, gql_url: str, gql_env: str, lazy_protocol: Optional[bool] = False
+    ):
+        """Introspect the schema and fetch the service configuration.
+
+        Schema introspection, the service configuration (with gas price) and,
+        unless lazy_protocol, the protocol configuration are fetched concurrently.
+
+        :param gql_url: The Sui GraphQL url
+        :type gql_url: str
+        :param gql_env: The environment (profile) name
+        :type gql_env: str
+        :param lazy_protocol: Fetch the protocol configuration on first use,
+            defaults to False
+        :type lazy_protocol: Optional[bool], optional
+        """
+        started = time.perf_counter()
+        self._graph_url: str = gql_url
+        self._timings: dict[str, float] = {}
+        self._protocol_lock = threading.Lock()
         _init_client: Client = Client(
-            transport=HTTPXTransport(
-                url=gql_url,
-                verify=True,
-                http2=True,
-                timeout=120.0,
-            ),
+            transport=self._transport(),
             fetch_schema_from_transport=True,
         )
-        with _init_client as session:
-            _long_version = session.transport.response_headers[
-                Schema.SCHEMA_HEADER_SCHEMA_KEY
-            ]
-            _base_version = ".".join(_long_version.split(".")[:2])
-            _schema: DSLSchema = DSLSchema(_init_client.schema)
-            qstr, fndeser = pgql_config(gql_env, _base_version)
-            _rpc_config: SuiConfigGQL = fndeser(session.execute(gql(qstr)))
-            _rpc_config.gqlEnvironment = gql_env
-            self._base_version: str = _base_version
-            self._build_version: str = _long_version
-            self._rpc_config: SuiConfigGQL = _rpc_config
-            self._dsl_schema: DSLSchema = _schema
-            self._graph_url: str = gql_url
-            self._sync_client: Client = _init_client
-            self._async_client: Client = None
-            self._async_session: ReconnectingAsyncClientSession = None
+        with ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="pysui-schema"
+        ) as pool:
+            service: Future = pool.submit(
+                self._timed, "service_config", self._query, *pgql_service_config()
+            )
+            protocol: Optional[Future] = None
+            if not lazy_protocol:
+                protocol = pool.submit(
+                    self._timed, "protocol_config", self._query, *pgql_protocol_config()
+                )
+            introspect_start = time.perf_counter()
+            with _init_client as session:
+                self._timings["introspection"] = (
+                    time.perf_counter() - introspect_start
+                )
+                _long_version = session.transport.response_headers[
+                    Schema.SCHEMA_HEADER_SCHEMA_KEY
+                ]
+                _schema: DSLSchema = DSLSchema(_init_client.schema)
+            _rpc_config: SuiConfigGQL = service.result()
+            if protocol:
+                _rpc_config.protocolConfig = protocol.result()
+        _rpc_config.gqlEnvironment = gql_env
+        self._base_version: str = ".".join(_long_version.split(".")[:2])
+        self._build_version: str = _long_version
+        self._rpc_config: SuiConfigGQL = _rpc_config
+        self._dsl_schema: DSLSchema = _schema
+        self._sync_client: Client = _init_client
+        self._async_client: Client = None
+        self._async_session: ReconnectingAsyncClientSession = None
+        self._timings["total"] = time.perf_counter() - started
+
+    def _transport(self) -> HTTPXTransport:
+        """Synchronous transport to the GraphQL url."""
+        return HTTPXTransport(
+            url=self._graph_url,
+            verify=True,
+            http2=True,
+            timeout=120.0,
+        )
+
+    def _timed(self, step: str, func: Callable, *args) -> Any:
+        """Call func recording its duration as a startup step."""
+        started = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            self._timings[step] = time.perf_counter() - started
+
+    def _query(self, query: str, decode_fn: Callable[[dict], Any]) -> Any:
+        """Execute a configuration query on its own connection."""
+        with Client(transport=self._transport()) as session:
+            return decode_fn(session.execute(gql(query)))
+
+    @versionadded(version="0.71.0", reason="Lazy protocol configuration")
+    def protocol_config(self) -> pgql_type.ProtocolConfigGQL:
+        """Return the protocol configuration, fetching it on first use if lazy."""
+        if self._rpc_config.protocolConfig is None:
+            with self._protocol_lock:
+                if self._rpc_config.protocolConfig is None:
+                    self._rpc_config.protocolConfig = self._timed(
+                        "protocol_config", self._query, *pgql_protocol_config()
+                    )
+        return self._rpc_config.protocolConfig
+
+    @versionadded(version="0.71.0", reason="Startup diagnostics")
+    @property
+    def startup_timings(self) -> dict[str, float]:
+        """Seconds spent in each startup step and in total."""
+        return dict(self._timings)
 
     @property
     def base_version(self) -> str:
@@ -105,31 +105,54 @@ class SuiTransaction(txbase):
         txn_expires_after: Optional[int] = None,
     ) -> Union[bcs.TransactionData, ValueError]:
         """Generate the TransactionData structure."""
-        obj_in_use: set[str] = set(self.builder.objects_registry.keys())
-        tx_kind = self.builder.finish_for_inspect()
-        gas_data: bcs.GasData = gd.get_gas_data(
-            signing=self.signer_block,
-            client=self.client,
-            budget=gas_budget if not gas_budget else int(gas_budget),
-            use_coins=use_gas_objects,
-            objects_in_use=obj_in_use,
-            active_gas_price=self.gas_price,
-            tx_kind=tx_kind,
+        gas_data: bcs.GasData = self._build_gas_data(
+            gas_budget, use_gas_objects, self.builder.kind_bytes()
         )
         return bcs.TransactionData(
             "V1",
             bcs.TransactionDataV1(
-                tx_kind,
+                self.builder.finish_for_inspect(),
                 bcs.Address.from_str(self.signer_block.sender_str),
                 gas_data,
-                bcs.TransactionExpiration(
-                    "None"
-                    if not txn_expires_after
-                    else bcs.TransactionExpiration("Epoch", txn_expires_after)
-                ),
+                self._txn_expiration(txn_expires_after),
             ),
         )
 
+    def _build_txn_bytes(
+        self,
+        gas_budget: str = "",
+        use_gas_objects: Optional[list[Union[str, pgql_type.SuiCoinObjectGQL]]] = None,
+        txn_expires_after: Optional[int] = None,
+    ) -> bytes:
+        """Generate the TransactionData BCS bytes from the builder serialized segments."""
+        kind_bytes = self.builder.kind_bytes()
+        gas_data: bcs.GasData = self._build_gas_data(
+            gas_budget, use_gas_objects, kind_bytes
+        )
+        return self.builder.transaction_data_bytes(
+            sender=bcs.Address.from_str(self.signer_block.sender_str),
+            gas_data=gas_data,
+            expiration=self._txn_expiration(txn_expires_after),
+            kind_bytes=kind_bytes,
+        )
+
+    def _build_gas_data(
+        self,
+        gas_budget: str,
+        use_gas_objects: Optional[list[Union[str, pgql_type.SuiCoinObjectGQL]]],
+        kind_bytes: bytes,
+    ) -> bcs.GasData:
+        """Generate the GasData structure."""
+        return gd.get_gas_data(
+            signing=self.signer_block,
+            client=self.client,
+            budget=gas_budget if not gas_budget else int(gas_budget),
+            use_coins=use_gas_objects,
+            objects_in_use=set(self.builder.objects_registry.keys()),
+            active_gas_price=self.gas_price,
+            tx_kind=kind_bytes,
+        )
+
     def transaction_data(
         self,
         *,
@@ -173,12 +196,8 @@ class SuiTransaction(txbase):
         :return: Base64 encoded transaction bytes
         :rtype: str
         """
-        txn_data = self.transaction_data(
-            gas_budget=gas_budget,
-            use_gas_objects=use_gas_objects,
-            txn_expires_after=txn_expires_after,
-        )
-        return base64.b64encode(txn_data.serialize()).decode()
+        txn_data = self._build_txn_bytes(gas_budget, use_gas_objects, txn_expires_after)
+        return base64.b64encode(txn_data).decode()
 
     @versionchanged(version="0.64.0", reason="Return dict instead of tuple")
     def build_and_sign(
@@ -204,16 +223,14 @@ class SuiTransaction(txbase):
             }
         :rtype: dict[str, str]
         """
-        txn_kind = self.transaction_data(
-            gas_budget=gas_budget,
-            use_gas_objects=use_gas_objects,
-            txn_expires_after=txn_expires_after,
-        )
-        tx_bytes = base64.b64encode(txn_kind.serialize()).decode()
+        txn_data = self._build_txn_bytes(gas_budget, use_gas_objects, txn_expires_after)
         sigs = self.signer_block.get_signatures(
-            config=self.client.config, tx_bytes=tx_bytes
+            config=self.client.config, tx_bytes=txn_data
         )
-        return {self._BUILD_BYTE_STR: tx_bytes, self._SIG_ARRAY: sigs}
+        return {
+            self._BUILD_BYTE_STR: base64.b64encode(txn_data).decode(),
+            self._SIG_ARRAY: sigs,
+        }
 
     def split_coin(
         self,
@@ -10,6 +10,10 @@ from pysui.sui.sui_pgql.pgql_clients import BaseSuiGQLClient
 import pysui.sui.sui_pgql.pgql_types as pgql_type
 import pysui.sui.sui_pgql.pgql_query as qn
 from pysui.sui.sui_types import bcs
+from pysui.sui.sui_trace import TraceSubsystem, trace, trace_logger
+
+# Standard library logging setup
+logger = trace_logger(TraceSubsystem.GAS)
 
 
 def _get_gas_objects(
@@ -66,6 +70,7 @@ def _dry_run_for_budget(
             skip_checks=False,
         )
     )
+    trace(logger, "dry_run", ok=result.is_ok())
     if result.is_ok():
         c_cost: int = int(
             result.result_data.transaction_block.effects["gasEffects"]["gasSummary"][
@@ -105,6 +110,13 @@ def _coins_for_budget(
                 f"Total gas available {_accum}, transaction requires {budget}"
             )
         _coin_fit = _accum_coin
+    trace(
+        logger,
+        "coins_for_budget",
+        budget=budget,
+        candidates=len(coins),
+        selected=lambda: [x.coin_object_id for x in _coin_fit],
+    )
     return [bcs.ObjectReference.from_gql_ref(x) for x in _coin_fit]
 
 
@@ -116,7 +128,7 @@ def get_gas_data(
     use_coins: Optional[list[Union[str, pgql_type.SuiCoinObjectGQL]]] = None,
     objects_in_use: set[str],
     active_gas_price: int,
-    tx_kind: bcs.TransactionKind,
+    tx_kind: Union[bcs.TransactionKind, bytes],
 ) -> bcs.GasData:
     """get_gas_data Builds the GasData BCS structure for the transaction data.
 
@@ -128,8 +140,8 @@ def get_gas_data(
     :type objects_in_use: set[str]
     :param active_gas_price: Current Gas Price
     :type active_gas_price: int
-    :param tx_kind: The TransactionKind BCS
-    :type tx_kind: bcs.TransactionKind
+    :param tx_kind: The TransactionKind BCS or its serialized bytes
+    :type tx_kind: Union[bcs.TransactionKind, bytes]
     :param budget: Option budget to set for transaction, defaults to None
     :type budget: Optional[int], optional
     :param use_coins: Gas coins to use for paying transactions, defaults to None
@@ -148,13 +160,23 @@ def get_gas_data(
             raise ValueError("use_gas_objects must use same type.")
     else:
         use_coins = _get_all_gas_objects(signing, client)
+    trace(
+        logger,
+        "gas_coins",
+        payer=lambda: signing.payer_address,
+        specified=_specified_coins,
+        count=len(use_coins),
+    )
     if not budget:
         budget = _dry_run_for_budget(
             signing,
             client,
-            base64.b64encode(tx_kind.serialize()).decode(),
+            base64.b64encode(
+                tx_kind if isinstance(tx_kind, bytes) else tx_kind.serialize()
+            ).decode(),
             active_gas_price,
         )
+        trace(logger, "budget", source="dry_run", budget=budget)
     # Remove conflicts with objects in use
     use_coins = [x for x in use_coins if x.coin_object_id not in objects_in_use]
     # Make sure something left to pay for
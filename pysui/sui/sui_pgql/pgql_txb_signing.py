@@ -6,8 +6,15 @@
 """Pysui Signing Block builder that works with GraphQL connection."""
 
 from typing import Optional, Union
+from deprecated.sphinx import versionadded, versionchanged
 from pysui import PysuiConfiguration
-from pysui.sui.sui_crypto import MultiSig, BaseMultiSig, SuiPublicKey
+from pysui.sui.sui_crypto import (
+    BatchSigner,
+    MultiSig,
+    BaseMultiSig,
+    SuiPublicKey,
+    sign_batch,
+)
 
 import pysui.sui.sui_pgql.pgql_types as pgql_type
 
@@ -123,8 +130,11 @@ class SignerBlock:
             result_list.append(self._sponsor)
         return result_list
 
-    def get_signatures(self, *, config: PysuiConfiguration, tx_bytes: str) -> list[str]:
-        """Get all the signatures needed for the transaction."""
+    @versionchanged(version="0.71.0", reason="Accepts transaction bytes")
+    def get_signatures(
+        self, *, config: PysuiConfiguration, tx_bytes: Union[str, bytes]
+    ) -> list[str]:
+        """Get all the signatures needed for the transaction, tx_bytes is base64 string or raw bytes."""
         sig_list: list[str] = []
         for signer in self._get_potential_signatures():
             if isinstance(signer, str):
@@ -140,3 +150,35 @@ class SignerBlock:
                 else:
                     raise ValueError("BaseMultiSig can not sign in execution")
         return [x.value for x in sig_list]
+
+    @versionadded(version="0.71.0", reason="Batch signing of transactions")
+    def get_signatures_batch(
+        self,
+        *,
+        config: PysuiConfiguration,
+        tx_bytes_list: list[Union[str, bytes]],
+        **pool_args,
+    ) -> list[list[str]]:
+        """get_signatures_batch Get all the signatures needed for each transaction.
+
+        Signers are resolved once and signing is spread over a worker pool, see
+        `sui_crypto.sign_batch` for the pool_args.
+
+        :param config: The configuration holding the signer keys
+        :type config: PysuiConfiguration
+        :param tx_bytes_list: TransactionData as base64 strings or bytes
+        :type tx_bytes_list: list[Union[str, bytes]]
+        :return: The signature list for each transaction, in tx_bytes_list order
+        :rtype: list[list[str]]
+        """
+        signers: list[BatchSigner] = []
+        for signer in self._get_potential_signatures():
+            if isinstance(signer, str):
+                signers.append(
+                    config.active_group.keypair_for_address(address=signer)
+                )
+            elif signer._can_sign_msg:
+                signers.append((signer.multi_sig, signer.pub_keys))
+            else:
+                raise ValueError("BaseMultiSig can not sign in execution")
+        return sign_batch(signers, tx_bytes_list, **pool_args)
@@ -17,6 +17,10 @@ import pysui.sui.sui_types as suit
 from pysui.sui.sui_types import bcs
 import pysui.sui.sui_txn.transaction_builder as tx_builder
 from pysui.sui.sui_utils import serialize_uint32_as_uleb128
+from pysui.sui.sui_trace import TraceSubsystem, trace, trace_logger
+
+# Standard library logging setup
+logger = trace_logger(TraceSubsystem.ARG_BUILDER)
 
 _SCALARS = {
     "u8": suit.SuiU8,
@@ -98,6 +102,7 @@ def _fetch_or_transpose_object(
     """Fetches and prepares an object reference to ObjectArg for BCS."""
     object_def: pgql_type.ObjectReadGQL = arg
     if isinstance(arg, str):
+        trace(logger, "fetch_object", object_id=arg)
         result = client.execute_query_node(with_node=qn.GetObject(object_id=arg))
         if result.is_ok():
             object_def = result.result_data
@@ -374,6 +379,7 @@ def build_args(
     :rtype: list
     """
     alen = len(in_args)
+    trace(logger, "build_args", count=alen, expected=len(meta_args.arg_list))
     if alen == len(meta_args.arg_list):
         track = _ArgSummary(
             in_args=in_args,
@@ -431,6 +437,13 @@ def build_args(
                 track.out_args[aindex] = _argument_builder(
                     client, in_arg, in_meta, outer, inner
                 )
+            trace(
+                logger,
+                "arg",
+                index=aindex,
+                meta=in_meta.__class__.__name__,
+                out=track.out_args[aindex],
+            )
 
         return track.out_args
 
@@ -11,6 +11,7 @@ import os
 from pathlib import Path
 from typing import Optional, Union
 import logging
+from deprecated.sphinx import versionadded
 
 
 from pysui import SuiAddress, ObjectID
@@ -25,7 +26,7 @@ import pysui.sui.sui_txn.transaction_builder as tx_builder
 import pysui.sui.sui_pgql.pgql_types as pgql_type
 from pysui.sui.sui_types import bcs
 from pysui.sui.sui_types.scalars import SuiString
-from pysui.sui.sui_utils import publish_buildg
+from pysui.sui.sui_utils import publish_buildg, transaction_digest
 
 # Standard library logging setup
 logger = logging.getLogger("pysui.gql_transaction")
@@ -46,6 +47,7 @@ class _SuiTransactionBase:
     _SPLIT_AND_KEEP: str = "0x2::pay::divide_and_keep"
     _PUBLIC_TRANSFER: str = "0x2::transfer::public_transfer"
     _PAY_GAS: int = 4000000
+    _BUILD_BYTE_STR: str = "tx_bytestr"
     _SPLIT_COIN = pgql_type.MoveArgSummary(
         [],
         [
@@ -216,7 +218,34 @@ class _SuiTransactionBase:
         :return: base64 string representation of underlying TransactionKind
         :rtype: str
         """
-        return base64.b64encode(self.raw_kind().serialize()).decode()
+        return base64.b64encode(self.builder.kind_bytes()).decode()
+
+    @versionadded(version="0.71.0", reason="Local transaction digest computation")
+    def transaction_digest(self, tx_bytes: Union[str, bytes, dict]) -> str:
+        """transaction_digest computes the transaction digest before submitting.
+
+        .. code-block:: python
+
+            tx_dict = txer.build_and_sign()
+            tx_digest = txer.transaction_digest(tx_dict)
+            # Record tx_digest, then execute
+            result = client.execute_query_node(with_node=qn.ExecuteTransaction(**tx_dict))
+
+        :param tx_bytes: Result of `build`, `build_and_sign` or TransactionData BCS bytes
+        :type tx_bytes: Union[str, bytes, dict]
+        :return: The base58 transaction digest
+        :rtype: str
+        """
+        if isinstance(tx_bytes, dict):
+            tx_bytes = tx_bytes[self._BUILD_BYTE_STR]
+        return transaction_digest(tx_bytes)
+
+    @staticmethod
+    def _txn_expiration(txn_expires_after: Optional[int]) -> bcs.TransactionExpiration:
+        """Returns the TransactionExpiration for an optional epoch."""
+        if txn_expires_after:
+            return bcs.TransactionExpiration("Epoch", txn_expires_after)
+        return bcs.TransactionExpiration("None")
 
     def verify_transaction(
         self, ser_kind: Optional[bytes] = None
@@ -284,35 +313,10 @@ class _SuiTransactionBase:
             result_err.max_programmable_tx_commands = len(self.commands)
 
         # Check size of transaction bytes
-        # Build faux gas as needed
-        if not ser_kind:
-            reuse_addy = bcs.Address.from_str("0x0")
-            ser_txdata = bcs.TransactionData(
-                "V1",
-                bcs.TransactionDataV1(
-                    self.raw_kind(),
-                    reuse_addy,
-                    bcs.GasData(
-                        [
-                            bcs.ObjectReference(
-                                reuse_addy,
-                                int(0),
-                                bcs.Digest.from_str(
-                                    "ByumsdYUAQWJfwYgowsme7hm5vE8d2mXik3rGaNC9R4W"
-                                ),
-                            )
-                        ],
-                        reuse_addy,
-                        int(self._current_gas_price),
-                        self._PAY_GAS,
-                    ),
-                    bcs.TransactionExpiration("None"),
-                ),
-            )
-            ser_kind = ser_txdata.serialize()
-
-        if len(ser_kind) > self.constraints.max_tx_size_bytes:
-            result_err.max_tx_size_bytes = len(ser_kind)
+        # Size with faux gas as needed
+        tx_size = len(ser_kind) if ser_kind else self.builder.transaction_data_size()
+        if tx_size > self.constraints.max_tx_size_bytes:
+            result_err.max_tx_size_bytes = tx_size
 
         var_map = vars(result_err)
         err_dict: dict = {x: y for (x, y) in var_map.items() if y != 0}
@@ -0,0 +1,128 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""Pysui structured build tracing.
+
+Tracing is built on standard library logging with one logger per subsystem.
+Trace calls are guarded by a level check and any callable field value is only
+evaluated when the subsystem is enabled, so disabled tracing costs a single
+``isEnabledFor`` lookup.
+"""
+
+import contextlib
+import logging
+from enum import Enum
+from typing import Any, Iterator, Optional, Union
+
+
+class TraceSubsystem(Enum):
+    """Traceable pysui subsystems and their logger names."""
+
+    BUILDER = "pysui.transaction_builder"
+    ARG_BUILDER = "pysui.pgql_txn_argb"
+    GAS = "pysui.pgql_txb_gas"
+
+
+def trace_logger(subsystem: Union[TraceSubsystem, str]) -> logging.Logger:
+    """trace_logger Fetch the logger for a subsystem using the pysui logging construct.
+
+    :param subsystem: The subsystem or logger name
+    :type subsystem: Union[TraceSubsystem, str]
+    :return: The subsystem logger
+    :rtype: logging.Logger
+    """
+    name = subsystem.value if isinstance(subsystem, TraceSubsystem) else subsystem
+    logger = logging.getLogger(name)
+    if not logging.getLogger().handlers and not logger.handlers:
+        logger.addHandler(logging.NullHandler())
+        logger.propagate = False
+    return logger
+
+
+def trace(logger: logging.Logger, event: str, **fields: Any) -> None:
+    """trace Emit a structured DEBUG trace record if the logger is enabled.
+
+    Callable field values are resolved lazily, only when the record is emitted.
+    The resolved fields are attached to the record as ``trace_event`` and
+    ``trace_fields`` for structured handlers.
+
+    :param logger: The subsystem logger
+    :type logger: logging.Logger
+    :param event: The trace event name
+    :type event: str
+    """
+    if logger.isEnabledFor(logging.DEBUG):
+        resolved = {
+            key: value() if callable(value) else value for key, value in fields.items()
+        }
+        logger.debug(
+            "%s %s",
+            event,
+            resolved,
+            extra={"trace_event": event, "trace_fields": resolved},
+            stacklevel=2,
+        )
+
+
+def set_trace(
+    subsystem: TraceSubsystem,
+    enabled: bool = True,
+    *,
+    handler: Optional[logging.Handler] = None,
+) -> None:
+    """set_trace Switch tracing on or off for a single subsystem.
+
+    When disabled the subsystem logger is raised to INFO, independent of how
+    the application configured the root logger.
+
+    :param subsystem: The subsystem to switch
+    :type subsystem: TraceSubsystem
+    :param enabled: Turn tracing on if True, off if False, defaults to True
+    :type enabled: bool, optional
+    :param handler: A handler to receive the trace records, defaults to None
+    :type handler: Optional[logging.Handler], optional
+    """
+    logger = trace_logger(subsystem)
+    logger.setLevel(logging.DEBUG if enabled else logging.INFO)
+    if handler and handler not in logger.handlers:
+        logger.addHandler(handler)
+
+
+@contextlib.contextmanager
+def trace_scope(
+    *subsystems: TraceSubsystem, handler: Optional[logging.Handler] = None
+) -> Iterator[None]:
+    """trace_scope Enable tracing of subsystems for the duration of the context.
+
+    Useful for capturing a detailed build trace for one transaction:
+
+    .. code-block:: python
+
+        with trace_scope(TraceSubsystem.BUILDER, TraceSubsystem.GAS, handler=hndlr):
+            txb = SuiTransaction(client=client)
+            ...
+            txdict = txb.build_and_sign()
+
+    :param subsystems: The subsystems to enable, defaults to all
+    :type subsystems: TraceSubsystem
+    :param handler: A handler to receive the trace records, detached on exit
+        unless it was already attached, defaults to None
+    :type handler: Optional[logging.Handler], optional
+    """
+    subsystems = subsystems or tuple(TraceSubsystem)
+    saved: list[tuple[logging.Logger, int, bool]] = []
+    for subsystem in subsystems:
+        logger = trace_logger(subsystem)
+        # Only a handler the scope attaches is detached on exit
+        attached = bool(handler) and handler not in logger.handlers
+        saved.append((logger, logger.level, attached))
+        set_trace(subsystem, True, handler=handler)
+    try:
+        yield
+    finally:
+        for logger, level, attached in saved:
+            logger.setLevel(level)
+            if attached:
+                logger.removeHandler(handler)
@@ -134,10 +134,11 @@ class _SignerBlockBase:
         return result_list
 
     @versionchanged(version="0.21.2", reason="Fix regression on MultiSig signing.")
+    @versionchanged(version="0.71.0", reason="Accepts transaction bytes")
     def get_signatures(
-        self, *, client: SyncClient, tx_bytes: str
+        self, *, client: SyncClient, tx_bytes: Union[str, bytes]
     ) -> SuiArray[SuiSignature]:
-        """Get all the signatures needed for the transaction."""
+        """Get all the signatures needed for the transaction, tx_bytes is base64 string or raw bytes."""
         sig_list: list[SuiSignature] = []
         for signer in self._get_potential_signatures():
             if isinstance(signer, SuiAddress):
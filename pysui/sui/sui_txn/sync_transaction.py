@@ -358,7 +358,7 @@ class SuiTransaction(_SuiTransactionBase):
         exec_tx = ExecuteTransaction(
             tx_bytes=tx_b64,
             signatures=self.signer_block.get_signatures(
-                client=self.client, tx_bytes=tx_b64
+                client=self.client, tx_bytes=ser_data
             ),
             options=options,
             request_type=SuiRequestType.WAITFORLOCALEXECUTION,
@@ -207,7 +207,18 @@ class _SuiTransactionBase:
         :return: base64 string representation of underlying TransactionKind
         :rtype: str
         """
-        return base64.b64encode(self.raw_kind().serialize()).decode()
+        return base64.b64encode(self.builder.kind_bytes()).decode()
+
+    @versionadded(version="0.71.0", reason="Local transaction digest computation")
+    def transaction_digest(self, tx_bytes: Union[str, bytes]) -> str:
+        """transaction_digest computes the transaction digest before submitting.
+
+        :param tx_bytes: Result of `deferred_execution` or TransactionData BCS bytes
+        :type tx_bytes: Union[str, bytes]
+        :return: The base58 transaction digest
+        :rtype: str
+        """
+        return sui_utils.transaction_digest(tx_bytes)
 
     @versionadded(version="0.30.0", reason="Observing Sui ProtocolConfig constraints")
     @versionchanged(version="0.31.0", reason="Validating against all PTB constraints")
@@ -278,35 +289,10 @@ class _SuiTransactionBase:
             result_err.max_programmable_tx_commands = len(self.commands)
 
         # Check size of transaction bytes
-        # Build faux gas as needed
-        if not ser_kind:
-            reuse_addy = bcs.Address.from_str("0x0")
-            ser_txdata = bcs.TransactionData(
-                "V1",
-                bcs.TransactionDataV1(
-                    self.raw_kind(),
-                    reuse_addy,
-                    bcs.GasData(
-                        [
-                            bcs.ObjectReference(
-                                reuse_addy,
-                                int(0),
-                                bcs.Digest.from_str(
-                                    "ByumsdYUAQWJfwYgowsme7hm5vE8d2mXik3rGaNC9R4W"
-                                ),
-                            )
-                        ],
-                        reuse_addy,
-                        int(self._current_gas_price),
-                        self._PAY_GAS,
-                    ),
-                    bcs.TransactionExpiration("None"),
-                ),
-            )
-            ser_kind = ser_txdata.serialize()
-
-        if len(ser_kind) > self.constraints.max_tx_size_bytes:
-            result_err.max_tx_size_bytes = len(ser_kind)
+        # Size with faux gas as needed
+        tx_size = len(ser_kind) if ser_kind else self.builder.transaction_data_size()
+        if tx_size > self.constraints.max_tx_size_bytes:
+            result_err.max_tx_size_bytes = tx_size
 
         var_map = vars(result_err)
         err_dict: dict = {x: y for (x, y) in var_map.items() if y != 0}
@@ -14,7 +14,6 @@
 
 """Sui low level Transaction Builder supports generation of TransactionKind."""
 
-import logging
 import binascii
 from math import ceil
 from typing import Optional, Set, Union
@@ -38,6 +37,7 @@ from pysui.sui.sui_types.scalars import (
     SuiU8,
 )
 from pysui.sui.sui_utils import serialize_uint32_as_uleb128
+from pysui.sui.sui_trace import TraceSubsystem, trace, trace_logger
 
 # Well known aliases
 _SUI_PACKAGE_ID: bcs.Address = bcs.Address.from_str("0x2")
@@ -46,10 +46,7 @@ _SUI_PACAKGE_AUTHORIZE_UPGRADE: str = "authorize_upgrade"
 _SUI_PACAKGE_COMMIt_UPGRADE: str = "commit_upgrade"
 
 # Standard library logging setup
-logger = logging.getLogger("pysui.transaction_builder")
-if not logging.getLogger().handlers:
-    logger.addHandler(logging.NullHandler())
-    logger.propagate = False
+logger = trace_logger(TraceSubsystem.BUILDER)
 
 
 @versionchanged(version="0.17.0", reason="Support bool arguments")
@@ -67,7 +64,7 @@ class PureInput:
     @classmethod
     def _(cls, arg: bool) -> list:
         """."""
-        logger.debug(f"bool->pure {arg}")
+        trace(logger, "pure", kind="bool", value=arg)
         return list(int(arg is True).to_bytes(1, "little"))
 
     @pure.register
@@ -80,7 +77,7 @@ class PureInput:
     @classmethod
     def _(cls, arg: int) -> list:
         """Convert int to minimal list of bytes."""
-        logger.debug(f"int->pure {arg}")
+        trace(logger, "pure", kind="int", value=arg)
         ccount = ceil(arg.bit_length() / 8.0)
         return list(int.to_bytes(arg, ccount, "little"))
 
@@ -88,7 +85,7 @@ class PureInput:
     @classmethod
     def _(cls, arg: bcs.Optional) -> list:
         """Convert OptionalU8 to list of bytes."""
-        logger.debug(f"Optional {arg}")
+        trace(logger, "pure", kind="Optional", value=arg)
         return list(arg.serialize())
 
     @pure.register
@@ -101,91 +98,91 @@ class PureInput:
     @classmethod
     def _(cls, arg: SuiU8) -> list:
         """Convert unsigned int to bytes."""
-        logger.debug(f"u8->pure {arg.value}")
+        trace(logger, "pure", kind="u8", value=arg.value)
         return list(arg.to_bytes())
 
     @pure.register
     @classmethod
     def _(cls, arg: bcs.OptionalU8) -> list:
         """Convert OptionalU8 to list of bytes."""
-        logger.debug(f"Optional<u8> {arg}")
+        trace(logger, "pure", kind="Optional<u8>", value=arg)
         return list(arg.serialize())
 
     @pure.register
     @classmethod
     def _(cls, arg: SuiU16) -> list:
         """Convert unsigned int to bytes."""
-        logger.debug(f"u16->pure {arg.value}")
+        trace(logger, "pure", kind="u16", value=arg.value)
         return list(arg.to_bytes())
 
     @pure.register
     @classmethod
     def _(cls, arg: bcs.OptionalU16) -> list:
         """Convert OptionalU16 to list of bytes."""
-        logger.debug(f"Optional<u16> {arg}")
+        trace(logger, "pure", kind="Optional<u16>", value=arg)
         return list(arg.serialize())
 
     @pure.register
     @classmethod
     def _(cls, arg: SuiU32) -> list:
         """Convert unsigned int to bytes."""
-        logger.debug(f"u32->pure {arg.value}")
+        trace(logger, "pure", kind="u32", value=arg.value)
         return list(arg.to_bytes())
 
     @pure.register
     @classmethod
     def _(cls, arg: bcs.OptionalU32) -> list:
         """Convert OptionalU32 to list of bytes."""
-        logger.debug(f"Optional<u32> {arg}")
+        trace(logger, "pure", kind="Optional<u32>", value=arg)
         return list(arg.serialize())
 
     @pure.register
     @classmethod
     def _(cls, arg: SuiU64) -> list:
         """Convert unsigned int to bytes."""
-        logger.debug(f"u64->pure {arg.value}")
+        trace(logger, "pure", kind="u64", value=arg.value)
         return list(arg.to_bytes())
 
     @pure.register
     @classmethod
     def _(cls, arg: bcs.OptionalU64) -> list:
         """Convert OptionalU64 to list of bytes."""
-        logger.debug(f"Optional<u64> {arg}")
+        trace(logger, "pure", kind="Optional<u64>", value=arg)
         return list(arg.serialize())
 
     @pure.register
     @classmethod
     def _(cls, arg: SuiU128) -> list:
         """Convert unsigned int to bytes."""
-        logger.debug(f"u128->pure {arg.value}")
+        trace(logger, "pure", kind="u128", value=arg.value)
         return list(arg.to_bytes())
 
     @pure.register
     @classmethod
     def _(cls, arg: bcs.OptionalU128) -> list:
         """Convert OptionalU128 to list of bytes."""
-        logger.debug(f"Optional<u128> {arg}")
+        trace(logger, "pure", kind="Optional<u128>", value=arg)
         return list(arg.serialize())
 
     @pure.register
     @classmethod
     def _(cls, arg: SuiU256) -> list:
         """Convert unsigned int to bytes."""
-        logger.debug(f"u256->pure {arg.value}")
+        trace(logger, "pure", kind="u256", value=arg.value)
         return list(arg.to_bytes())
 
     @pure.register
     @classmethod
     def _(cls, arg: bcs.OptionalU256) -> list:
         """Convert OptionalU256 to list of bytes."""
-        logger.debug(f"Optional<u256> {arg}")
+        trace(logger, "pure", kind="Optional<u256>", value=arg)
         return list(arg.serialize())
 
     @pure.register
     @classmethod
     def _(cls, arg: str) -> list:
         """Convert str to list of bytes."""
-        logger.debug(f"str->pure {arg}")
+        trace(logger, "pure", kind="str", value=arg)
         byte_list = list(bytearray(arg, encoding="utf-8"))
         length_prefix = list(bytearray(serialize_uint32_as_uleb128(len(byte_list))))
         return length_prefix + byte_list
@@ -200,7 +197,7 @@ class PureInput:
     @classmethod
     def _(cls, arg: bytes) -> list:
         """Bytes to list."""
-        logger.debug(f"bytes->pure {arg}")
+        trace(logger, "pure", kind="bytes", value=arg)
         base_list = list(arg)
         return base_list
 
@@ -208,14 +205,14 @@ class PureInput:
     @classmethod
     def _(cls, arg: ObjectID) -> list:
         """Convert ObjectID to list of bytes."""
-        logger.debug(f"ObjectID->pure {arg.value}")
+        trace(logger, "pure", kind="ObjectID", value=arg.value)
         return cls.pure(binascii.unhexlify(arg.value[2:]))
 
     @pure.register
     @classmethod
     def _(cls, arg: SuiAddress) -> list:
         """Convert SuiAddress to list of bytes."""
-        logger.debug(f"SuiAddress->pure {arg.address}")
+        trace(logger, "pure", kind="SuiAddress", value=arg.address)
         addy = bcs.Address.from_sui_address(arg)
         return list(addy.serialize())
 
@@ -223,28 +220,28 @@ class PureInput:
     @classmethod
     def _(cls, arg: bcs.Address) -> list:
         """Convert bcs.Address to list of bytes."""
-        logger.debug(f"bcs.Address->pure {arg.to_json()}")
+        trace(logger, "pure", kind="bcs.Address", value=arg.to_json)
         return list(arg.serialize())
 
     @pure.register
     @classmethod
     def _(cls, arg: bcs.Digest) -> list:
         """Convert bcs,Digest to list of bytes."""
-        logger.debug(f"bcs.Digest->pure {arg.to_json()}")
+        trace(logger, "pure", kind="bcs.Digest", value=arg.to_json)
         return list(arg.serialize())
 
     @pure.register
     @classmethod
     def _(cls, arg: bcs.Variable) -> list:
         """Convert bcs,Variable to list of bytes."""
-        logger.debug(f"bcs.Variable->pure {arg.to_json()}")
+        trace(logger, "pure", kind="bcs.Variable", value=arg.to_json)
         return list(arg.serialize())
 
     @pure.register
     @classmethod
     def _(cls, arg: list) -> list:
         """."""
-        logger.debug(f"list->pure {arg}")
+        trace(logger, "pure", kind="list", value=arg)
         stage_list = [PureInput.pure(x) for x in arg]
         res_list = list(serialize_uint32_as_uleb128(len(stage_list)))
         for stage_pure in stage_list:
@@ -257,14 +254,54 @@ class PureInput:
         return bcs.BuilderArg("Pure", cls.pure(args))
 
 
+# BCS enum variant prefixes used in segment assembly
+_CALLARG_PURE_PREFIX: bytes = b"\x00"
+_CALLARG_OBJECT_PREFIX: bytes = b"\x01"
+_KIND_PROGRAMMABLE_PREFIX: bytes = b"\x00"
+_TXDATA_V1_PREFIX: bytes = b"\x00"
+# Fixed BCS sizes used for TransactionData size estimation
+_ADDRESS_SIZE: int = len(bcs.Address.from_str("0x0").serialize())
+_OBJECT_REFERENCE_SIZE: int = len(
+    bcs.ObjectReference(
+        bcs.Address.from_str("0x0"),
+        0,
+        bcs.Digest.from_str("ByumsdYUAQWJfwYgowsme7hm5vE8d2mXik3rGaNC9R4W"),
+    ).serialize()
+)
+_U64_SIZE: int = 8
+_NO_EXPIRATION_SIZE: int = len(bcs.TransactionExpiration("None").serialize())
+
+
+def _call_arg_bytes(call_arg: bcs.CallArg) -> bytes:
+    """Serialize a CallArg, fast path for Pure."""
+    if call_arg.enum_name == "Pure":
+        return (
+            _CALLARG_PURE_PREFIX
+            + serialize_uint32_as_uleb128(len(call_arg.value))
+            + bytes(call_arg.value)
+        )
+    return _CALLARG_OBJECT_PREFIX + call_arg.value.serialize()
+
+
 @versionchanged(version="0.31.0", reason="Added command type frequency")
+@versionchanged(version="0.71.0", reason="Content indexed input deduplication")
+@versionchanged(version="0.71.0", reason="Incremental BCS serialization of inputs and commands")
 class ProgrammableTransactionBuilder:
-    """ProgrammableTransactionBuilder core transaction construction."""
+    """ProgrammableTransactionBuilder core transaction construction.
+
+    Inputs and commands are serialized as they are added so the size and bytes of the
+    resulting TransactionKind are available without re-serializing the whole structure.
+    """
 
     def __init__(self, *, compress_inputs: bool = False) -> None:
         """Builder initializer."""
-        self.inputs: dict[bcs.BuilderArg, bcs.CallArg] = {}
-        self.commands: list[bcs.Command] = []
+        self._inputs: dict[bcs.BuilderArg, bcs.CallArg] = {}
+        self._input_index: Optional[dict[bytes, int]] = None
+        self._input_segments: list[bytes] = []
+        self._input_segments_len: int = 0
+        self._commands: list[bcs.Command] = []
+        self._command_segments: list[bytes] = []
+        self._command_segments_len: int = 0
         self.objects_registry: dict[str, str] = {}
         self.compress_inputs: bool = compress_inputs
 
@@ -277,7 +314,75 @@ class ProgrammableTransactionBuilder:
             "MakeMoveVec": 0,
             "Upgrade": 0,
         }
-        logger.debug("TransactionBuilder initialized")
+        trace(logger, "init", compress_inputs=compress_inputs)
+
+    @property
+    def inputs(self) -> dict[bcs.BuilderArg, bcs.CallArg]:
+        """Returns the inputs collection."""
+        return self._inputs
+
+    @inputs.setter
+    def inputs(self, new_inputs: dict[bcs.BuilderArg, bcs.CallArg]) -> None:
+        """Replace the inputs collection, invalidating the index and segments."""
+        self._inputs = new_inputs
+        self._input_index = None
+        self._input_segments = []
+        self._input_segments_len = 0
+
+    @property
+    def commands(self) -> list[bcs.Command]:
+        """Returns the commands list."""
+        return self._commands
+
+    @commands.setter
+    def commands(self, new_commands: list[bcs.Command]) -> None:
+        """Replace the commands list, invalidating the segments."""
+        self._commands = new_commands
+        self._command_segments = []
+        self._command_segments_len = 0
+
+    def _sync_segments(self) -> None:
+        """Serialize any inputs or commands not yet in the segment caches."""
+        if len(self._input_segments) != len(self._inputs):
+            self._input_segments = [_call_arg_bytes(x) for x in self._inputs.values()]
+            self._input_segments_len = sum(len(x) for x in self._input_segments)
+            self._input_index = None
+        if len(self._command_segments) != len(self._commands):
+            self._command_segments = [x.serialize() for x in self._commands]
+            self._command_segments_len = sum(len(x) for x in self._command_segments)
+
+    def _dedup_index(self) -> dict[bytes, int]:
+        """Returns the content index of inputs, building it if needed."""
+        self._sync_segments()
+        if self._input_index is None:
+            self._input_index = {}
+            for e_index, segment in enumerate(self._input_segments):
+                self._input_index.setdefault(segment, e_index)
+        return self._input_index
+
+    def _add_input(self, key: bcs.BuilderArg, call_arg: bcs.CallArg) -> int:
+        """Add call_arg to inputs, reusing an identical input if compressing.
+
+        :return: The input index
+        :rtype: int
+        """
+        segment = _call_arg_bytes(call_arg)
+        if self.compress_inputs:
+            index = self._dedup_index()
+            e_index = index.get(segment)
+            if e_index is not None:
+                trace(logger, "input_reuse", kind=call_arg.enum_name, index=e_index)
+                return e_index
+            index[segment] = len(self._inputs)
+        else:
+            self._sync_segments()
+            self._input_index = None
+        out_index = len(self._inputs)
+        self._inputs[key] = call_arg
+        self._input_segments.append(segment)
+        self._input_segments_len += len(segment)
+        trace(logger, "input", kind=call_arg.enum_name, index=out_index)
+        return out_index
 
     def _finish(self) -> bcs.ProgrammableTransaction:
         """finish returns ProgrammableTransaction structure.
@@ -300,6 +405,103 @@ class ProgrammableTransactionBuilder:
         """
         return bcs.TransactionKind("ProgrammableTransaction", self._finish())
 
+    @versionadded(version="0.71.0", reason="Incremental BCS serialization")
+    def kind_size(self) -> int:
+        """kind_size returns the length of the serialized TransactionKind.
+
+        :return: The TransactionKind BCS byte count
+        :rtype: int
+        """
+        self._sync_segments()
+        return (
+            len(_KIND_PROGRAMMABLE_PREFIX)
+            + len(serialize_uint32_as_uleb128(len(self._input_segments)))
+            + self._input_segments_len
+            + len(serialize_uint32_as_uleb128(len(self._command_segments)))
+            + self._command_segments_len
+        )
+
+    @versionadded(version="0.71.0", reason="Incremental BCS serialization")
+    def transaction_data_size(self, gas_payments: int = 1) -> int:
+        """transaction_data_size returns the length of the serialized TransactionData.
+
+        Assumes no expiration.
+
+        :param gas_payments: The number of gas payment objects, defaults to 1
+        :type gas_payments: int, optional
+        :return: The TransactionData BCS byte count
+        :rtype: int
+        """
+        gas_size = (
+            len(serialize_uint32_as_uleb128(gas_payments))
+            + gas_payments * _OBJECT_REFERENCE_SIZE
+            + _ADDRESS_SIZE
+            + _U64_SIZE * 2
+        )
+        return (
+            len(_TXDATA_V1_PREFIX)
+            + self.kind_size()
+            + _ADDRESS_SIZE
+            + gas_size
+            + _NO_EXPIRATION_SIZE
+        )
+
+    @versionadded(version="0.71.0", reason="Incremental BCS serialization")
+    def kind_bytes(self) -> bytes:
+        """kind_bytes returns the serialized TransactionKind.
+
+        Equivalent to `finish_for_inspect().serialize()` without re-serializing
+        inputs and commands.
+
+        :return: The TransactionKind BCS bytes
+        :rtype: bytes
+        """
+        self._sync_segments()
+        return b"".join(
+            [
+                _KIND_PROGRAMMABLE_PREFIX,
+                serialize_uint32_as_uleb128(len(self._input_segments)),
+                *self._input_segments,
+                serialize_uint32_as_uleb128(len(self._command_segments)),
+                *self._command_segments,
+            ]
+        )
+
+    @versionadded(version="0.71.0", reason="Incremental BCS serialization")
+    def transaction_data_bytes(
+        self,
+        *,
+        sender: bcs.Address,
+        gas_data: bcs.GasData,
+        expiration: Optional[bcs.TransactionExpiration] = None,
+        kind_bytes: Optional[bytes] = None,
+    ) -> bytes:
+        """transaction_data_bytes returns the serialized TransactionData (V1).
+
+        Equivalent to serializing a `bcs.TransactionData` built from `finish_for_inspect()`.
+
+        :param sender: The transaction sender
+        :type sender: bcs.Address
+        :param gas_data: The transaction gas data
+        :type gas_data: bcs.GasData
+        :param expiration: The transaction expiration, defaults to None (no expiration)
+        :type expiration: Optional[bcs.TransactionExpiration], optional
+        :param kind_bytes: Previously fetched kind_bytes, defaults to None
+        :type kind_bytes: Optional[bytes], optional
+        :return: The TransactionData BCS bytes
+        :rtype: bytes
+        """
+        expiration = expiration or bcs.TransactionExpiration("None")
+        return b"".join(
+            [
+                _TXDATA_V1_PREFIX,
+                kind_bytes or self.kind_bytes(),
+                sender.serialize(),
+                gas_data.serialize(),
+                expiration.serialize(),
+            ]
+        )
+
     @versionchanged(version="0.20.0", reason="Check for duplication. See bug #99")
     @versionchanged(version="0.30.2", reason="Remove reuse of identical pure inputs")
     def input_pure(self, key: bcs.BuilderArg) -> bcs.Argument:
@@ -311,49 +513,22 @@ class ProgrammableTransactionBuilder:
         :return: The input Argument encapsulating it's input index
         :rtype: bcs.Argument
         """
-        logger.debug("Adding pure input")
-        out_index = len(self.inputs)
         if key.enum_name == "Pure":
-            if self.compress_inputs:
-                e_index = 0
-                for _ekey, evalue in self.inputs.items():
-                    if key.value == evalue.value:
-                        logger.debug(
-                            f"Duplicate object input found at index {e_index}, reusing"
-                        )
-                        return bcs.Argument("Input", e_index)
-                    e_index += 1
-            self.inputs[key] = bcs.CallArg(key.enum_name, key.value)
+            out_index = self._add_input(key, bcs.CallArg(key.enum_name, key.value))
         else:
             raise ValueError(f"Expected Pure builder arg, found {key.enum_name}")
-        logger.debug(f"New pure input created at index {out_index}")
         return bcs.Argument("Input", out_index)
 
     @versionchanged(version="0.20.0", reason="Check for duplication. See bug #99")
     def input_obj(self, key: bcs.BuilderArg, object_arg: bcs.ObjectArg) -> bcs.Argument:
         """."""
-        logger.debug("Adding object input")
-        out_index = len(self.inputs)
-        if key.enum_name == "Object" and isinstance(
-            object_arg, bcs.ObjectArg
-        ):  # _key = hash(input)
-            if self.compress_inputs:
-                e_index = 0
-                for _ekey, evalue in self.inputs.items():
-                    if object_arg == evalue.value:
-                        logger.debug(
-                            f"Duplicate object input found at index {e_index}, reusing"
-                        )
-                        return bcs.Argument("Input", e_index)
-                    e_index += 1
-            self.inputs[key] = bcs.CallArg(key.enum_name, object_arg)
+        if key.enum_name == "Object" and isinstance(object_arg, bcs.ObjectArg):
+            out_index = self._add_input(key, bcs.CallArg(key.enum_name, object_arg))
         else:
             raise ValueError(
                 f"Expected Object builder arg and ObjectArg, found {key.enum_name} and {type(object_arg)}"
             )
         self.objects_registry[key.value.to_address_str()] = object_arg.enum_name
-        # self.objects_registry.add(key.value.to_address_str())
-        logger.debug(f"New object input created at index {out_index}")
         return bcs.Argument("Input", out_index)
 
     @versionadded(version="0.54.0", reason="Support stand-alone ObjectArg")
@@ -374,16 +549,24 @@ class ProgrammableTransactionBuilder:
         :rtype: bcs.Argument
         """
         self.command_frequency[command_obj.enum_name] += 1
-        out_index = len(self.commands)
-        logger.debug(f"Adding command {out_index}")
-        self.commands.append(command_obj)
+        self._sync_segments()
+        out_index = len(self._commands)
+        trace(
+            logger,
+            "command",
+            kind=command_obj.enum_name,
+            index=out_index,
+            results=nresults,
+        )
+        segment = command_obj.serialize()
+        self._commands.append(command_obj)
+        self._command_segments.append(segment)
+        self._command_segments_len += len(segment)
         if nresults > 1:
-            logger.debug(f"Creating nested result return for {nresults} elements")
             nreslist: list[bcs.Argument] = []
             for nrindex in range(nresults):
                 nreslist.append(bcs.Argument("NestedResult", (out_index, nrindex)))
             return nreslist
-        logger.debug("Creating single result return")
         return bcs.Argument("Result", out_index)
 
     @versionchanged(
@@ -404,7 +587,7 @@ class ProgrammableTransactionBuilder:
     ) -> bcs.Argument:
         """Create a call to convert a list of items to a Sui 'vector' type."""
         # Sample first for type
-        logger.debug("Creating MakeMoveVec transaction")
+        trace(logger, "build", command="MakeMoveVec")
         argrefs: list[bcs.Argument] = []
         for arg in items:
             if isinstance(arg, bcs.BuilderArg):
@@ -439,7 +622,7 @@ class ProgrammableTransactionBuilder:
         res_count: int = 1,
     ) -> Union[bcs.Argument, list[bcs.Argument]]:
         """Setup a MoveCall command and return it's result Argument."""
-        logger.debug("Creating MakeCall transaction")
+        trace(logger, "build", command="MoveCall")
         argrefs: list[bcs.Argument] = []
         for arg in arguments:
             if isinstance(arg, bcs.BuilderArg):
@@ -484,7 +667,7 @@ class ProgrammableTransactionBuilder:
         amounts: list[bcs.BuilderArg],
     ) -> bcs.Argument:
         """Setup a SplitCoin command and return it's result Argument."""
-        logger.debug("Creating SplitCoin transaction")
+        trace(logger, "build", command="SplitCoin")
         amounts_arg = []
         for amount in amounts:
             if isinstance(amount, bcs.Argument):
@@ -514,7 +697,7 @@ class ProgrammableTransactionBuilder:
         ],
     ) -> bcs.Argument:
         """Setup a MergeCoins command and return it's result Argument."""
-        logger.debug("Creating MergeCoins transaction")
+        trace(logger, "build", command="MergeCoins")
 
         if isinstance(to_coin, bcs.ObjectArg):
             to_coin = self.input_obj_from_objarg(to_coin)
@@ -542,7 +725,7 @@ class ProgrammableTransactionBuilder:
         ],
     ) -> bcs.Argument:
         """Setup a TransferObjects command and return it's result Argument."""
-        logger.debug("Creating TransferObjects transaction")
+        trace(logger, "build", command="TransferObjects")
         receiver_arg = (
             recipient
             if isinstance(recipient, bcs.Argument)
@@ -573,7 +756,7 @@ class ProgrammableTransactionBuilder:
 
         First uses the SplitCoins result, then returns the TransferObjects result Argument.
         """
-        logger.debug("Creating TransferSui transaction")
+        trace(logger, "build", command="TransferSui")
         reciever_arg = self.input_pure(recipient)
         if amount and isinstance(amount, bcs.BuilderArg):
             coin_arg = self.split_coin(from_coin=from_coin, amounts=[amount])
@@ -604,7 +787,7 @@ class ProgrammableTransactionBuilder:
         self, modules: list[list[bcs.U8]], dep_ids: list[bcs.Address]
     ) -> bcs.Argument:
         """Setup a Publish command and return it's result Argument."""
-        logger.debug("Creating Publish transaction")
+        trace(logger, "build", command="Publish")
         # result = self.command(bcs.Command("Publish", bcs.Publish(modules, dep_ids)))
         return self.command(bcs.Command("Publish", bcs.Publish(modules, dep_ids)))
 
@@ -615,7 +798,7 @@ class ProgrammableTransactionBuilder:
         digest: bcs.BuilderArg,
     ) -> bcs.Argument:
         """Setup a Authorize Upgrade MoveCall and return it's result Argument."""
-        logger.debug("Creating UpgradeAuthorization transaction")
+        trace(logger, "build", command="UpgradeAuthorization")
         if isinstance(upgrade_cap, bcs.ObjectArg):
             ucap = self.input_obj_from_objarg(upgrade_cap)
         else:
@@ -645,7 +828,7 @@ class ProgrammableTransactionBuilder:
         upgrade_ticket: bcs.Argument,
     ) -> bcs.Argument:
         """Setup a Upgrade Command and return it's result Argument."""
-        logger.debug("Creating PublishUpgrade transaction")
+        trace(logger, "build", command="PublishUpgrade")
         return self.command(
             bcs.Command(
                 "Upgrade",
@@ -657,7 +840,7 @@ class ProgrammableTransactionBuilder:
         self, upgrade_cap: bcs.Argument, receipt: bcs.Argument
     ) -> bcs.Argument:
         """Setup a Commit Upgrade MoveCall and return it's result Argument."""
-        logger.debug("Creating UpgradeCommit transaction")
+        trace(logger, "build", command="UpgradeCommit")
         return self.command(
             bcs.Command(
                 "MoveCall",
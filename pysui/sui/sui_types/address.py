@@ -69,9 +69,14 @@ class SuiAddress(SuiBaseType):
             raise ValueError(f"{testvalid} is not valid address string")
         # Alias for transaction validation
         self.address = testvalid
-        ### BEGIN_BFC_PATCH
-        self.bfc_address = try_convert_to_bfc_address(testvalid)
-        ### END_BFC_PATCH
+
+    ### BEGIN_BFC_PATCH
+    @property
+    def bfc_address(self) -> str:
+        """Return the BFC form of the address, derived on use."""
+        return try_convert_to_bfc_address(self.address)
+
+    ### END_BFC_PATCH
 
     @property
     def signer(self) -> str:
@@ -25,7 +25,12 @@ from pysui.abstracts.client_keypair import PublicKey, SignatureScheme
 from pysui.sui.sui_txresults.common import GenericRef
 from pysui.sui.sui_txresults.single_tx import ObjectRead
 from pysui.sui.sui_types.address import SuiAddress
-from pysui.sui.sui_utils import b58str_to_list, hexstring_to_list, hexstring_to_sui_id
+from pysui.sui.sui_utils import (
+    b58str_to_list,
+    hexstring_to_list,
+    hexstring_to_sui_id,
+    transaction_digest,
+)
 import pysui.sui.sui_pgql.pgql_types as pgql_type
 
 _ADDRESS_LENGTH: int = 32
@@ -738,6 +743,15 @@ class TransactionData(canoser.RustEnum):
 
     _enums = [("V1", TransactionDataV1)]
 
+    @versionadded(version="0.71.0", reason="Local transaction digest computation")
+    def digest(self) -> str:
+        """digest computes the base58 transaction digest of this TransactionData.
+
+        :return: The transaction digest
+        :rtype: str
+        """
+        return transaction_digest(self.serialize())
+
     @classmethod
     def variant_for_index(
         cls, index: int
@@ -762,6 +776,95 @@ class TransactionData(canoser.RustEnum):
         return cls.deserialize(in_data)
 
 
+# On-chain object (e.g. ObjectReadGQL.bcs)
+
+
+@versionadded(version="0.71.0", reason="Support decoding object BCS")
+class MoveObjectType(canoser.RustEnum):
+    """MoveObjectType is the type of a Move object, with compact variants for common types."""
+
+    _enums = [
+        ("Other", StructTag),
+        ("GasCoin", None),
+        ("StakedSui", None),
+        ("Coin", TypeTag),
+    ]
+
+
+@versionadded(version="0.71.0", reason="Support decoding object BCS")
+class MoveObject(canoser.Struct):
+    """MoveObject represents a Move object, contents are the BCS of the Move struct."""
+
+    _fields = [
+        ("Type", MoveObjectType),
+        ("HasPublicTransfer", bool),
+        ("Version", canoser.Uint64),
+        ("Contents", [canoser.Uint8]),
+    ]
+
+
+@versionadded(version="0.71.0", reason="Support decoding object BCS")
+class TypeOrigin(canoser.Struct):
+    """TypeOrigin identifies the package that first defined a type."""
+
+    _fields = [
+        ("ModuleName", str),
+        ("DatatypeName", str),
+        ("Package", Address),
+    ]
+
+
+@versionadded(version="0.71.0", reason="Support decoding object BCS")
+class UpgradeInfo(canoser.Struct):
+    """UpgradeInfo is the linkage of a package dependency."""
+
+    _fields = [("UpgradedId", Address), ("UpgradedVersion", canoser.Uint64)]
+
+
+@versionadded(version="0.71.0", reason="Support decoding object BCS")
+class MovePackage(canoser.Struct):
+    """MovePackage represents a published package."""
+
+    _fields = [
+        ("Id", Address),
+        ("Version", canoser.Uint64),
+        ("ModuleMap", {str: [canoser.Uint8]}),
+        ("TypeOriginTable", [TypeOrigin]),
+        ("LinkageTable", {Address: UpgradeInfo}),
+    ]
+
+
+@versionadded(version="0.71.0", reason="Support decoding object BCS")
+class ObjectData(canoser.RustEnum):
+    """ObjectData is either a Move object or a package."""
+
+    _enums = [("Move", MoveObject), ("Package", MovePackage)]
+
+
+@versionadded(version="0.71.0", reason="Support decoding object BCS")
+class ObjectOwner(canoser.RustEnum):
+    """ObjectOwner is the ownership of an object, Shared holds the initial shared version."""
+
+    _enums = [
+        ("AddressOwner", Address),
+        ("ObjectOwner", Address),
+        ("Shared", canoser.Uint64),
+        ("Immutable", None),
+    ]
+
+
+@versionadded(version="0.71.0", reason="Support decoding object BCS")
+class Object(canoser.Struct):
+    """Object is the BCS representation of an on-chain object."""
+
+    _fields = [
+        ("Data", ObjectData),
+        ("Owner", ObjectOwner),
+        ("PreviousTransaction", Digest),
+        ("StorageRebate", canoser.Uint64),
+    ]
+
+
 # Multi-signature legacy
 @versionadded(version="0.20.4", reason="Added to support in-code MultiSig signing.")
 @deprecated(version="0.33.0", reason="Unused, scheduled for removal in 0.35.0")
@@ -0,0 +1,467 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""Lazy, zero-copy BCS decoding over memoryview.
+
+Views are driven by the canoser type definitions in ``pysui.sui.sui_types.bcs`` and
+decode nothing until asked. Locating a field or element skips over the encoded
+subtrees before it without materializing them, and fixed size subtrees are skipped
+in constant time.
+
+.. code-block:: python
+
+    txdata = transaction_data_view(tx_bytes)
+    gas = txdata.value["GasData"].decode()
+    for command in txdata.value["TransactionKind"].value["Command"]:
+        print(command.variant)
+"""
+
+import base64
+from functools import cache
+from typing import Any, Iterator, Optional, Union
+
+import canoser
+from canoser.types import type_mapping
+from deprecated.sphinx import versionadded
+
+from pysui.sui.sui_types import bcs
+
+BcsInput = Union[str, bytes, bytearray, memoryview]
+
+
+def _as_memoryview(data: BcsInput) -> memoryview:
+    """Coerce inbound data to a memoryview, base64 strings are decoded."""
+    if isinstance(data, str):
+        data = base64.b64decode(data)
+    return data if isinstance(data, memoryview) else memoryview(data)
+
+
+def _read_uleb128(buf: memoryview, pos: int) -> tuple[int, int]:
+    """Read a ULEB128 value, returns the value and position after it."""
+    value = 0
+    shift = 0
+    while True:
+        byte = buf[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+        if shift > 28:
+            raise ValueError("Invalid ULEB128 representation for Uint32")
+
+
+def _is_int(ctype: Any) -> bool:
+    """True if ctype is a canoser integer type."""
+    return isinstance(ctype, type) and issubclass(ctype, canoser.int_type.IntType)
+
+
+def _is_class_of(ctype: Any, base: type) -> bool:
+    """True if ctype is a subclass of base."""
+    return isinstance(ctype, type) and issubclass(ctype, base)
+
+
+@cache
+def _fixed_size_of_class(ctype: type) -> Optional[int]:
+    """Fixed encoded size of a canoser class type or None if variable."""
+    if _is_int(ctype):
+        return ctype.byte_lens
+    if ctype is canoser.BoolT:
+        return 1
+    if _is_class_of(ctype, canoser.Struct):
+        total = 0
+        for _, ftype in ctype._fields:
+            fsize = _fixed_size(type_mapping(ftype))
+            if fsize is None:
+                return None
+            total += fsize
+        return total
+    return None
+
+
+def _fixed_size(ctype: Any) -> Optional[int]:
+    """Fixed encoded size of a canoser type or None if variable."""
+    if isinstance(ctype, type):
+        return _fixed_size_of_class(ctype)
+    if isinstance(ctype, canoser.ArrayT) and not ctype.encode_len:
+        esize = _fixed_size(ctype.atype)
+        return None if esize is None else esize * ctype.fixed_len
+    if isinstance(ctype, canoser.BytesT) and not ctype.encode_len:
+        return ctype.fixed_len
+    if isinstance(ctype, canoser.TupleT):
+        total = 0
+        for ttype in ctype.ttypes:
+            tsize = _fixed_size(ttype)
+            if tsize is None:
+                return None
+            total += tsize
+        return total
+    return None
+
+
+def _skip(ctype: Any, buf: memoryview, pos: int) -> int:
+    """Return the position after the encoded value of ctype starting at pos."""
+    fsize = _fixed_size(ctype)
+    if fsize is not None:
+        return pos + fsize
+    if ctype is canoser.StrT or isinstance(ctype, canoser.BytesT):
+        size, pos = _read_uleb128(buf, pos)
+        return pos + size
+    if isinstance(ctype, canoser.ArrayT):
+        if ctype.encode_len:
+            count, pos = _read_uleb128(buf, pos)
+        else:
+            count = ctype.fixed_len
+        esize = _fixed_size(ctype.atype)
+        if esize is not None:
+            return pos + count * esize
+        for _ in range(count):
+            pos = _skip(ctype.atype, buf, pos)
+        return pos
+    if isinstance(ctype, canoser.TupleT):
+        for ttype in ctype.ttypes:
+            pos = _skip(ttype, buf, pos)
+        return pos
+    if isinstance(ctype, canoser.MapT):
+        count, pos = _read_uleb128(buf, pos)
+        for _ in range(count):
+            pos = _skip(ctype.ktype, buf, pos)
+            pos = _skip(ctype.vtype, buf, pos)
+        return pos
+    if _is_class_of(ctype, canoser.Struct):
+        for _, ftype in ctype._fields:
+            pos = _skip(type_mapping(ftype), buf, pos)
+        return pos
+    if _is_class_of(ctype, canoser.RustEnum):
+        index, pos = _read_uleb128(buf, pos)
+        vtype = ctype._enums[index][1]
+        return pos if vtype is None else _skip(type_mapping(vtype), buf, pos)
+    if _is_class_of(ctype, canoser.RustOptional):
+        if buf[pos]:
+            return _skip(type_mapping(ctype._type), buf, pos + 1)
+        return pos + 1
+    raise TypeError(f"Unsupported BCS type {ctype}")
+
+
+@versionadded(version="0.71.0", reason="Lazy BCS decoding")
+class BcsView:
+    """Lazy view of a BCS encoded value."""
+
+    __slots__ = ("_ctype", "_buf", "_start", "_end")
+
+    def __init__(self, ctype: Any, buf: memoryview, start: int = 0):
+        """__init__ View of ctype encoded in buf at start."""
+        self._ctype = ctype
+        self._buf = buf
+        self._start = start
+        self._end: Optional[int] = None
+
+    @property
+    def ctype(self) -> Any:
+        """Returns the canoser type of the view."""
+        return self._ctype
+
+    @property
+    def end(self) -> int:
+        """Returns the offset after the encoded value."""
+        if self._end is None:
+            self._end = _skip(self._ctype, self._buf, self._start)
+        return self._end
+
+    @property
+    def size(self) -> int:
+        """Returns the encoded byte count."""
+        return self.end - self._start
+
+    @property
+    def raw(self) -> memoryview:
+        """Returns the encoded bytes of the value, without copying."""
+        return self._buf[self._start : self.end]
+
+    def decode(self) -> Any:
+        """decode Materialize the value with the canoser type.
+
+        :return: The decoded value (python scalar or canoser object)
+        :rtype: Any
+        """
+        cursor = canoser.Cursor(bytes(self.raw))
+        return self._ctype.decode(cursor)
+
+    def __repr__(self) -> str:
+        """Summary of view."""
+        return f"{self.__class__.__name__}({self._ctype}, offset={self._start})"
+
+
+class ScalarView(BcsView):
+    """View of integers, bool and strings."""
+
+    __slots__ = ()
+
+    def decode(self) -> Union[int, bool, str]:
+        """decode Returns the python value."""
+        if _is_int(self._ctype):
+            return int.from_bytes(
+                self._buf[self._start : self.end],
+                byteorder="little",
+                signed=self._ctype.signed,
+            )
+        if self._ctype is canoser.BoolT:
+            return bool(self._buf[self._start])
+        size, pos = _read_uleb128(self._buf, self._start)
+        return str(self._buf[pos : pos + size], encoding="utf-8")
+
+
+class StructView(BcsView):
+    """View of a canoser.Struct, fields located on demand."""
+
+    __slots__ = ("_offsets",)
+
+    def __init__(self, ctype: Any, buf: memoryview, start: int = 0):
+        """__init__ View of ctype encoded in buf at start."""
+        super().__init__(ctype, buf, start)
+        self._offsets: list[int] = [start]
+
+    @property
+    def field_names(self) -> list[str]:
+        """Returns the struct field names."""
+        return [name for name, _ in self._ctype._fields]
+
+    def field(self, name: Union[str, int]) -> BcsView:
+        """field Returns a view of a field by name or position.
+
+        Only the fields before it are skipped, nothing is decoded.
+
+        :param name: The field name or index
+        :type name: Union[str, int]
+        :return: The field view
+        :rtype: BcsView
+        """
+        index = name if isinstance(name, int) else self.field_names.index(name)
+        fields = self._ctype._fields
+        while len(self._offsets) <= index:
+            prior = len(self._offsets) - 1
+            self._offsets.append(
+                _skip(type_mapping(fields[prior][1]), self._buf, self._offsets[prior])
+            )
+        return view_at(type_mapping(fields[index][1]), self._buf, self._offsets[index])
+
+    def __getitem__(self, name: Union[str, int]) -> BcsView:
+        """Field view by name or position."""
+        return self.field(name)
+
+
+class EnumView(BcsView):
+    """View of a canoser.RustEnum."""
+
+    __slots__ = ("_index", "_payload")
+
+    def __init__(self, ctype: Any, buf: memoryview, start: int = 0):
+        """__init__ View of ctype encoded in buf at start."""
+        super().__init__(ctype, buf, start)
+        self._index, self._payload = _read_uleb128(buf, start)
+
+    @property
+    def index(self) -> int:
+        """Returns the variant index."""
+        return self._index
+
+    @property
+    def variant(self) -> str:
+        """Returns the variant name."""
+        return self._ctype._enums[self._index][0]
+
+    @property
+    def value(self) -> Optional[BcsView]:
+        """Returns a view of the variant payload, None for unit variants."""
+        vtype = self._ctype._enums[self._index][1]
+        if vtype is None:
+            return None
+        return view_at(type_mapping(vtype), self._buf, self._payload)
+
+
+class OptionalView(BcsView):
+    """View of a canoser.RustOptional."""
+
+    __slots__ = ()
+
+    @property
+    def is_some(self) -> bool:
+        """Returns True if a value is present."""
+        return bool(self._buf[self._start])
+
+    @property
+    def value(self) -> Optional[BcsView]:
+        """Returns a view of the value if present."""
+        if not self.is_some:
+            return None
+        return view_at(type_mapping(self._ctype._type), self._buf, self._start + 1)
+
+
+class SequenceView(BcsView):
+    """View of arrays, vectors and tuples, elements located on demand."""
+
+    __slots__ = ("_count", "_first", "_esize", "_offsets")
+
+    def __init__(self, ctype: Any, buf: memoryview, start: int = 0):
+        """__init__ View of ctype encoded in buf at start."""
+        super().__init__(ctype, buf, start)
+        if isinstance(ctype, canoser.TupleT):
+            self._count, self._first = len(ctype.ttypes), start
+            self._esize = None
+        else:
+            if ctype.encode_len:
+                self._count, self._first = _read_uleb128(buf, start)
+            else:
+                self._count, self._first = ctype.fixed_len, start
+            self._esize = _fixed_size(ctype.atype)
+        self._offsets: list[int] = [self._first]
+
+    def _element_type(self, index: int) -> Any:
+        """Type of element at index."""
+        if isinstance(self._ctype, canoser.TupleT):
+            return self._ctype.ttypes[index]
+        return self._ctype.atype
+
+    def _offset(self, index: int) -> int:
+        """Offset of element at index."""
+        if self._esize is not None:
+            return self._first + index * self._esize
+        while len(self._offsets) <= index:
+            prior = len(self._offsets) - 1
+            self._offsets.append(
+                _skip(self._element_type(prior), self._buf, self._offsets[prior])
+            )
+        return self._offsets[index]
+
+    def __len__(self) -> int:
+        """Element count."""
+        return self._count
+
+    def __getitem__(self, index: int) -> BcsView:
+        """View of element at index."""
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError(f"Index {index} out of range for {self._count} elements")
+        return view_at(self._element_type(index), self._buf, self._offset(index))
+
+    def __iter__(self) -> Iterator[BcsView]:
+        """Lazily yield element views."""
+        pos = self._first
+        for index in range(self._count):
+            etype = self._element_type(index)
+            element = view_at(etype, self._buf, pos)
+            yield element
+            pos = element.end
+
+    def payload(self) -> memoryview:
+        """payload Returns the element bytes without the length prefix (e.g. vector<u8>).
+
+        :return: The element bytes
+        :rtype: memoryview
+        """
+        return self._buf[self._first : self.end]
+
+
+class MapView(BcsView):
+    """View of a canoser map, entries yielded on demand."""
+
+    __slots__ = ("_count", "_first")
+
+    def __init__(self, ctype: Any, buf: memoryview, start: int = 0):
+        """__init__ View of ctype encoded in buf at start."""
+        super().__init__(ctype, buf, start)
+        self._count, self._first = _read_uleb128(buf, start)
+
+    def __len__(self) -> int:
+        """Entry count."""
+        return self._count
+
+    def items(self) -> Iterator[tuple[BcsView, BcsView]]:
+        """Lazily yield key and value views."""
+        pos = self._first
+        for _ in range(self._count):
+            key = view_at(self._ctype.ktype, self._buf, pos)
+            value = view_at(self._ctype.vtype, self._buf, key.end)
+            yield key, value
+            pos = value.end
+
+
+def view_at(ctype: Any, buf: memoryview, start: int = 0) -> BcsView:
+    """view_at Returns the view matching a canoser type at a buffer offset.
+
+    :param ctype: The canoser type (e.g. bcs.TransactionData)
+    :type ctype: Any
+    :param buf: The buffer
+    :type buf: memoryview
+    :param start: Offset of the encoded value, defaults to 0
+    :type start: int, optional
+    :return: The view
+    :rtype: BcsView
+    """
+    ctype = type_mapping(ctype)
+    if _is_int(ctype) or ctype is canoser.BoolT or ctype is canoser.StrT:
+        return ScalarView(ctype, buf, start)
+    if _is_class_of(ctype, canoser.Struct):
+        return StructView(ctype, buf, start)
+    if _is_class_of(ctype, canoser.RustEnum):
+        return EnumView(ctype, buf, start)
+    if _is_class_of(ctype, canoser.RustOptional):
+        return OptionalView(ctype, buf, start)
+    if isinstance(ctype, (canoser.ArrayT, canoser.TupleT)):
+        return SequenceView(ctype, buf, start)
+    if isinstance(ctype, canoser.MapT):
+        return MapView(ctype, buf, start)
+    return BcsView(ctype, buf, start)
+
+
+@versionadded(version="0.71.0", reason="Lazy BCS decoding")
+def view(ctype: Any, data: BcsInput) -> BcsView:
+    """view Returns a lazy view of data encoded as ctype.
+
+    :param ctype: The canoser type (e.g. bcs.TransactionKind)
+    :type ctype: Any
+    :param data: BCS bytes, memoryview or base64 string
+    :type data: BcsInput
+    :return: The view
+    :rtype: BcsView
+    """
+    return view_at(ctype, _as_memoryview(data))
+
+
+@versionadded(version="0.71.0", reason="Lazy BCS decoding")
+def transaction_data_view(data: BcsInput) -> EnumView:
+    """transaction_data_view Returns a lazy view of TransactionData.
+
+    :param data: TransactionData BCS bytes, memoryview or base64 string
+    :type data: BcsInput
+    :return: The TransactionData enum view
+    :rtype: EnumView
+    """
+    return view(bcs.TransactionData, data)
+
+
+@versionadded(version="0.71.0", reason="Lazy BCS decoding")
+def transaction_kind_view(data: BcsInput) -> EnumView:
+    """transaction_kind_view Returns a lazy view of TransactionKind.
+
+    :param data: TransactionKind BCS bytes, memoryview or base64 string
+    :type data: BcsInput
+    :return: The TransactionKind enum view
+    :rtype: EnumView
+    """
+    return view(bcs.TransactionKind, data)
+
+
+@versionadded(version="0.71.0", reason="Lazy BCS decoding")
+def object_view(data: Any) -> StructView:
+    """object_view Returns a lazy view of an on-chain Object.
+
+    :param data: Object BCS bytes, base64 string or an object with a `bcs` attribute (e.g. ObjectReadGQL)
+    :type data: Any
+    :return: The Object struct view
+    :rtype: StructView
+    """
+    return view(bcs.Object, getattr(data, "bcs", data))
@@ -5,7 +5,10 @@
 
 """Sui query and get event filter types."""
 
-from typing import Optional, Union
+import datetime
+import json
+import re
+from typing import Any, Callable, Optional, Union
 from deprecated.sphinx import versionadded, deprecated
 from pysui.sui.sui_types.address import SuiAddress
 from pysui.sui.sui_types.collections import SuiMap
@@ -292,3 +295,270 @@ class TransactionKindEvent(_TransactionFilterType, SuiMap):
             else transaction_kind.value
         )
         super().__init__("TransactionKindEvent", transaction_kind)
+
+
+_ADDRESS_RE = re.compile(r"0x([0-9a-fA-F]{1,64})")
+
+# Index kinds, most selective first, And filters index on their best child
+_INDEX_RANK: tuple[str, ...] = (
+    "tx",
+    "event_type",
+    "sender",
+    "module",
+    "event_module",
+    "package",
+    "event_package",
+)
+
+
+def _norm_address(address: str) -> str:
+    """Long, lower case form of a hex address."""
+    return "0x" + address.lower().removeprefix("0x").rjust(64, "0")
+
+
+def _norm_type(type_str: str) -> str:
+    """Type or module path with all addresses in long form."""
+    return _ADDRESS_RE.sub(lambda m: _norm_address(m.group(1)), type_str)
+
+
+def _event_keys(event: Any) -> dict[str, Any]:
+    """Routing keys of a JSON RPC or GraphQL event.
+
+    Accepts subscription results (SubscribedEvent), Event, EventGQL or raw JSON RPC
+    event dicts. GraphQL events carry no event type and never match type filters.
+    """
+    if hasattr(event, "params"):
+        event = event.params.result
+    if isinstance(event, dict):
+        get = event.get
+        package = get("packageId")
+        module = get("transactionModule")
+        sender = get("sender")
+        etype = get("type")
+        digest = (get("id") or {}).get("txDigest")
+        stamp = get("timestampMs")
+        contents = get("parsedJson")
+    else:
+        package = getattr(event, "package_id", None)
+        module = getattr(event, "transaction_module", None) or getattr(
+            event, "module_name", None
+        )
+        sender = getattr(event, "sender", None)
+        etype = getattr(event, "event_type", None)
+        digest = (getattr(event, "event_id", None) or {}).get("txDigest")
+        stamp = getattr(event, "timestamp_ms", None) or getattr(
+            event, "timestamp", None
+        )
+        contents = getattr(event, "parsed_json", None)
+        if contents is None and isinstance(getattr(event, "json", None), str):
+            contents = json.loads(event.json)
+    if isinstance(sender, dict):
+        sender = sender.get("address")
+    keys: dict[str, Any] = {"tx": digest, "contents": contents, "time": None}
+    if package:
+        package = _norm_address(package)
+        keys["package"] = package
+        if module:
+            keys["module"] = (package, module)
+    if sender:
+        keys["sender"] = _norm_address(sender)
+    if etype:
+        etype = _norm_type(etype)
+        keys["event_type"] = etype
+        epackage, emodule = etype.split("::")[:2]
+        keys["event_package"] = epackage
+        keys["event_module"] = (epackage, emodule)
+    if stamp:
+        if isinstance(stamp, str) and not stamp.isdigit():
+            stamp = datetime.datetime.fromisoformat(stamp.replace("Z", "+00:00"))
+            keys["time"] = int(stamp.timestamp() * 1000)
+        else:
+            keys["time"] = int(stamp)
+    return keys
+
+
+def _field_value(contents: Any, path: str) -> Any:
+    """Value at a /separated path of parsed event json, KeyError if absent."""
+    for part in path.strip("/").split("/"):
+        if part:
+            contents = contents[int(part) if isinstance(contents, list) else part]
+    return contents
+
+
+def _leaf(kind: str, key: Any) -> tuple[list, Callable[[dict], bool]]:
+    """Indexed equality filter."""
+    return [(kind, key)], lambda keys: keys.get(kind) == key
+
+
+def _compile(efilter: dict) -> tuple[Optional[list], Callable[[dict], bool]]:
+    """Compile a filter map to its index keys (None to scan) and predicate."""
+    if len(efilter) != 1:
+        # GraphQL EventFilter, its keys are conjoined
+        return _compile({"All": [{key: val} for key, val in efilter.items()]})
+    ((name, value),) = efilter.items()
+    if name in ("Sender", "sender"):
+        return _leaf("sender", _norm_address(value))
+    if name in ("Transaction", "transactionDigest"):
+        return _leaf("tx", value)
+    if name == "Package":
+        return _leaf("package", _norm_address(value))
+    if name == "MoveModule":
+        return _leaf("module", (_norm_address(value["package"]), value["module"]))
+    if name == "MoveEventModule":
+        return _leaf(
+            "event_module", (_norm_address(value["package"]), value["module"])
+        )
+    if name == "MoveEventType":
+        return _leaf("event_type", _norm_type(value))
+    if name == "emittingModule":
+        parts = _norm_type(value).split("::")
+        if len(parts) == 1:
+            return _leaf("package", parts[0])
+        return _leaf("module", (parts[0], parts[1]))
+    if name == "eventType":
+        parts = _norm_type(value).split("::")
+        if len(parts) == 1:
+            return _leaf("event_package", parts[0])
+        if len(parts) == 2:
+            return _leaf("event_module", (parts[0], parts[1]))
+        return _leaf("event_type", "::".join(parts))
+    if name == "TimeRange":
+        start, end = int(value["startTime"]), int(value["endTime"])
+        return None, lambda keys: keys["time"] is not None and (
+            start <= keys["time"] < end
+        )
+    if name == "MoveEventField":
+        path, expected = value["path"], value["value"]
+
+        def _field_match(keys: dict) -> bool:
+            try:
+                return _field_value(keys["contents"], path) == expected
+            except (KeyError, IndexError, TypeError, ValueError):
+                return False
+
+        return None, _field_match
+    if name in ("And", "All"):
+        parts = [_compile(sub) for sub in value]
+        preds = [pred for _, pred in parts]
+        indexed = [index for index, _ in parts if index]
+        best = min(
+            indexed,
+            key=lambda index: (len(index), min(_INDEX_RANK.index(k) for k, _ in index)),
+            default=None,
+        )
+        return best, lambda keys: all(pred(keys) for pred in preds)
+    if name in ("Or", "Any"):
+        parts = [_compile(sub) for sub in value]
+        preds = [pred for _, pred in parts]
+        index = None
+        if all(index for index, _ in parts):
+            index = [entry for index, _ in parts for entry in index]
+        return index, lambda keys: any(pred(keys) for pred in preds)
+    raise ValueError(f"Unsupported event filter {name}")
+
+
+@versionadded(version="0.71.0", reason="Local event filter evaluation and fan out")
+class EventRouter:
+    """Routes events to the handlers whose filter they match, in process.
+
+    Filters are event filter types (e.g. SenderEventQuery, AndFilter) or GraphQL
+    EventFilter dicts (e.g. {"eventType": "0x2::coin"}). Sender, transaction,
+    package, module and event type filters, and And/Or combinations of them, are
+    indexed so an event only evaluates the routes it can match. TimeRange and
+    MoveEventField filters are evaluated against every event unless combined with
+    an indexed filter in an And.
+    """
+
+    def __init__(self):
+        """Initialize an empty router."""
+        self._routes: dict[int, tuple[Callable[[dict], bool], Callable]] = {}
+        self._index: dict[str, dict[Any, list[int]]] = {}
+        self._scan: list[int] = []
+        self._route_keys: dict[int, Optional[list]] = {}
+        self._next_id = 0
+
+    def __len__(self) -> int:
+        """Return the number of routes."""
+        return len(self._routes)
+
+    def add_route(
+        self, event_filter: Union[_EventFilterType, dict], handler: Callable[[Any], Any]
+    ) -> int:
+        """add_route Route events matching event_filter to handler.
+
+        :param event_filter: The event filter type or GraphQL EventFilter dict
+        :type event_filter: Union[_EventFilterType, dict]
+        :param handler: Called with each matching event
+        :type handler: Callable[[Any], Any]
+        :raises ValueError: If the filter is not supported
+        :return: Route id, used to remove the route
+        :rtype: int
+        """
+        if not isinstance(event_filter, dict):
+            event_filter = event_filter.filter
+        index, pred = _compile(event_filter)
+        route_id = self._next_id
+        self._next_id += 1
+        self._routes[route_id] = (pred, handler)
+        self._route_keys[route_id] = index
+        if index is None:
+            self._scan.append(route_id)
+        else:
+            for kind, key in set(index):
+                self._index.setdefault(kind, {}).setdefault(key, []).append(route_id)
+        return route_id
+
+    def remove_route(self, route_id: int) -> None:
+        """remove_route Remove a route.
+
+        :param route_id: The id returned by add_route
+        :type route_id: int
+        """
+        del self._routes[route_id]
+        index = self._route_keys.pop(route_id)
+        if index is None:
+            self._scan.remove(route_id)
+            return
+        for kind, key in set(index):
+            routes = self._index[kind][key]
+            routes.remove(route_id)
+            if not routes:
+                del self._index[kind][key]
+
+    def matches(self, event: Any) -> list[Callable[[Any], Any]]:
+        """matches Return the handlers of routes matching event, in route order.
+
+        :param event: A JSON RPC or GraphQL event
+        :type event: Any
+        :return: Handlers to call
+        :rtype: list[Callable[[Any], Any]]
+        """
+        keys = _event_keys(event)
+        candidates = set(self._scan)
+        for kind, by_key in self._index.items():
+            routes = by_key.get(keys.get(kind))
+            if routes:
+                candidates.update(routes)
+        return [
+            self._routes[route_id][1]
+            for route_id in sorted(candidates)
+            if self._routes[route_id][0](keys)
+        ]
+
+    def dispatch(self, event: Any) -> int:
+        """dispatch Call each matching route's handler with event.
+
+        :param event: A JSON RPC or GraphQL event
+        :type event: Any
+        :return: The number of handlers called
+        :rtype: int
+        """
+        handlers = self.matches(event)
+        for handler in handlers:
+            handler(event)
+        return len(handlers)
+
+    def subscription_handler(self, event: Any, _subscription_id: int, _counter: int):
+        """Dispatch as a JSON RPC subscription handler, keeps the subscription running."""
+        self.dispatch(event)
+        return True
@@ -381,6 +381,29 @@ def b58str_to_list(indata: str) -> list[int]:
     return [int(x) for x in decode_bytes]
 
 
+# Sui hashes TransactionData BCS bytes salted with its type name
+_TRANSACTION_DATA_SALT: bytes = b"TransactionData::"
+
+
+@versionadded(version="0.71.0", reason="Local transaction digest computation")
+def transaction_digest(tx_bytes: Union[str, bytes]) -> str:
+    """transaction_digest computes the Sui transaction digest of TransactionData.
+
+    The result matches the digest returned from executing the transaction.
+
+    :param tx_bytes: TransactionData BCS bytes or base64 encoded string of same
+    :type tx_bytes: Union[str, bytes]
+    :return: The base58 encoded transaction digest
+    :rtype: str
+    """
+    if isinstance(tx_bytes, str):
+        tx_bytes = base64.b64decode(tx_bytes)
+    hasher = hashlib.blake2b(digest_size=32)
+    hasher.update(_TRANSACTION_DATA_SALT)
+    hasher.update(tx_bytes)
+    return base58.b58encode(hasher.digest()).decode()
+
+
 def int_to_listu8(byte_count: int, in_el: int) -> list[int]:
     """int_to_listu8 converts integer to array of u8 bytes.
 
@@ -0,0 +1,104 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""Testing lazy BCS views (no transactions)."""
+
+import base64
+
+from pysui.sui.sui_txn.transaction_builder import (
+    ProgrammableTransactionBuilder,
+    PureInput,
+)
+from pysui.sui.sui_types import bcs
+from pysui.sui.sui_types.bcs_view import (
+    object_view,
+    transaction_data_view,
+    transaction_kind_view,
+)
+from tests.test_utils import OBJECT_DIGEST, owned_object_arg
+
+
+def _transaction_data() -> bcs.TransactionData:
+    """Build a transaction data with several commands."""
+    txb = ProgrammableTransactionBuilder()
+    coins = txb.split_coin(
+        owned_object_arg("0x10"), [PureInput.as_input(5), PureInput.as_input(6)]
+    )
+    txb.transfer_objects(PureInput.as_input(bcs.Address.from_str("0x1")), coins)
+    txb.move_call(
+        target=bcs.Address.from_str("0x2"),
+        arguments=[PureInput.as_input(list(range(200)))],
+        type_arguments=[],
+        module="pay",
+        function="noop",
+    )
+    sender = bcs.Address.from_str("0x3")
+    gas = bcs.GasData(
+        [bcs.ObjectReference(sender, 7, bcs.Digest.from_str(OBJECT_DIGEST))],
+        sender,
+        1000,
+        5000000,
+    )
+    return bcs.TransactionData(
+        "V1",
+        bcs.TransactionDataV1(
+            txb.finish_for_inspect(), sender, gas, bcs.TransactionExpiration("None")
+        ),
+    )
+
+
+def test_transaction_data_view():
+    """Lazy field access matches the full canoser decode."""
+    txdata = _transaction_data()
+    tx_bytes = txdata.serialize()
+    tdv = transaction_data_view(base64.b64encode(tx_bytes).decode())
+    assert tdv.variant == "V1"
+    assert tdv.size == len(tx_bytes)
+    v1 = tdv.value
+    gas = v1["GasData"]
+    assert gas["Budget"].decode() == 5000000
+    assert gas["Payment"][0]["SequenceNumber"].decode() == 7
+    assert gas.decode().serialize() == txdata.value.GasData.serialize()
+    assert v1["Sender"].decode().serialize() == txdata.value.Sender.serialize()
+    assert v1["TransactionExpiration"].variant == "None"
+    ptx = v1["TransactionKind"].value
+    commands = ptx["Command"]
+    assert [cmd.variant for cmd in commands] == ["SplitCoin", "TransferObjects", "MoveCall"]
+    assert commands[2].value["Function"].decode() == "noop"
+    pure = ptx["Inputs"][-1].value
+    assert bytes(pure.payload()) == bytes(txdata.value.TransactionKind.value.Inputs[-1].value)
+
+
+def test_transaction_kind_view():
+    """Kind views decode identically and yield raw slices."""
+    kind = _transaction_data().value.TransactionKind
+    kind_bytes = kind.serialize()
+    tkv = transaction_kind_view(kind_bytes)
+    assert bytes(tkv.raw) == kind_bytes
+    assert tkv.decode().serialize() == kind_bytes
+    for index, cmd in enumerate(tkv.value["Command"]):
+        assert cmd.decode().serialize() == kind.value.Command[index].serialize()
+
+
+def test_object_view():
+    """Object contents are viewed lazily."""
+    owner = bcs.Address.from_str("0x3")
+    obj = bcs.Object(
+        bcs.ObjectData(
+            "Move",
+            bcs.MoveObject(
+                bcs.MoveObjectType("GasCoin"), False, 12, list(b"\x01" * 40)
+            ),
+        ),
+        bcs.ObjectOwner("AddressOwner", owner),
+        bcs.Digest.from_str(OBJECT_DIGEST),
+        42,
+    )
+    obv = object_view(obj.serialize())
+    assert obv["Owner"].variant == "AddressOwner"
+    assert obv["StorageRebate"].decode() == 42
+    move = obv["Data"].value
+    assert move["Version"].decode() == 12
+    assert bytes(move["Contents"].payload()) == b"\x01" * 40
@@ -0,0 +1,35 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""Microbenchmark cases run and report (see tools/bench_micro.py)."""
+
+import importlib.util
+import json
+from pathlib import Path
+
+_BENCH = Path(__file__).parents[2] / "tools" / "bench_micro.py"
+
+
+def _bench_module():
+    spec = importlib.util.spec_from_file_location("bench_micro", _BENCH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_cases_run_and_compare():
+    """Every case runs against its fixtures and the record round trips."""
+    bench = _bench_module()
+    record = json.loads(json.dumps(bench.run_cases(repeat=1, min_time=0.0)))
+    assert set(record["results"]) == {case.name for case in bench.CASES}
+    for result in record["results"].values():
+        assert result["min_us"] > 0 and result["loops"] >= 1
+    assert {"pysui", "python", "timestamp", "commit"} <= set(record)
+
+    assert bench.compare(record, record, 10.0) == []
+    faster = json.loads(json.dumps(record))
+    name = bench.CASES[0].name
+    faster["results"][name]["min_us"] /= 2
+    assert bench.compare(record, faster, 10.0) == [name]
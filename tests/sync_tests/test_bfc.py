@@ -0,0 +1,48 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""Testing BFC method and address mapping (no network)."""
+
+from pysui.sui.sui_apidesc import build_api_descriptors
+from pysui.sui.sui_types.address import SuiAddress
+from pysui.bfc.address_patch import try_convert_to_sui_address
+
+
+def _discover(*names: str) -> dict:
+    """Minimal rpc.discover response."""
+    return {
+        "result": {
+            "info": {"version": "1.36.0"},
+            "components": {"schemas": {}},
+            "methods": [
+                {
+                    "name": name,
+                    "params": [],
+                    "result": {"name": "Result", "schema": {"type": "boolean"}},
+                }
+                for name in names
+            ],
+        }
+    }
+
+
+def test_bfc_descriptors():
+    """Sui method names resolve to the node's BFC descriptors."""
+    _, apis, _ = build_api_descriptors(
+        _discover("bfcx_getReferenceGasPrice", "bfc_getProtocolConfig")
+    )
+    assert apis["suix_getReferenceGasPrice"].name == "bfcx_getReferenceGasPrice"
+    assert apis["suix_getReferenceGasPrice"] is apis["bfcx_getReferenceGasPrice"]
+    assert apis["sui_getProtocolConfig"].name == "bfc_getProtocolConfig"
+    _, apis, _ = build_api_descriptors(_discover("suix_getReferenceGasPrice"))
+    assert list(apis) == ["suix_getReferenceGasPrice"]
+
+
+def test_bfc_address():
+    """Addresses accept and produce the BFC form."""
+    addy = SuiAddress("0x" + "0" * 63 + "2")
+    assert addy.bfc_address.startswith("BFC" + "0" * 63 + "2")
+    assert SuiAddress(addy.bfc_address).address == addy.address
+    assert try_convert_to_sui_address(addy.address) == addy.address
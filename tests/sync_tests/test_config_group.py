@@ -0,0 +1,228 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""Testing configuration key, alias and address lookups (no transactions)."""
+
+import json
+
+import pytest
+
+import pysui.sui.sui_crypto as crypto
+from pysui.abstracts.client_keypair import SignatureScheme
+from pysui.abstracts import CrefType
+from pysui.sui.sui_config import SuiConfig
+from pysui.sui.sui_pgql.config.confgroup import ProfileGroup
+from pysui.sui.sui_pgql.config.confmodel import PysuiConfigModel
+from pysui.sui.sui_pgql.config.pysui_config import PysuiConfiguration
+
+
+def _group(count: int) -> tuple[ProfileGroup, list[str]]:
+    """Group with count generated keys."""
+    group = ProfileGroup("test", "", "", [], [], [], [])
+    keys = [
+        {
+            "key_string": crypto.create_new_keypair(
+                scheme=SignatureScheme.ED25519
+            )[1].serialize(),
+            "alias": f"alias-{index}",
+        }
+        for index in range(count)
+    ]
+    return group, group.add_keys(keys=keys)
+
+
+def test_group_lookups():
+    """Address, alias and key lookups agree with the group lists."""
+    group, addies = _group(3)
+    for index, addy in enumerate(addies):
+        assert group.address_for_alias(alias=f"alias-{index}") == addy
+        assert group.alias_name_for_address(address=addy) == f"alias-{index}"
+        assert (
+            group.keypair_for_address(address=addy).serialize()
+            == group.key_list[index].private_key_base64
+        )
+    group.active_alias = "alias-1"
+    assert group.active_address == addies[1]
+    with pytest.raises(ValueError):
+        group.keypair_for_address(address="0x0")
+    with pytest.raises(ValueError):
+        group.active_address = "0x0"
+
+
+def test_group_keypair_cache():
+    """Decoded keypairs are reused until the group keys change."""
+    group, addies = _group(2)
+    first = group.keypair_for_address(address=addies[0])
+    assert group.keypair_for_address(address=addies[0]) is first
+    mnem, addy, pkey, palias = ProfileGroup.new_keypair_parts(
+        alias="added", alias_list=group.alias_list
+    )
+    group.add_keypair_and_parts(new_address=addy, new_alias=palias, new_key=pkey)
+    assert group.address_for_alias(alias="added") == addy
+    assert group.keypair_for_address(address=addies[0]) is not first
+    # Removal from the lists is honored
+    group.address_list.pop()
+    group.key_list.pop()
+    group.alias_list.pop()
+    with pytest.raises(ValueError):
+        group.keypair_for_address(address=addy)
+
+
+def test_group_alias_rename():
+    """Renamed aliases resolve under the new name only."""
+    group, addies = _group(1)
+    addy = group.replace_alias_name(from_alias="alias-0", to_alias="renamed")
+    assert addy == addies[0]
+    assert group.address_for_alias(alias="renamed") == addies[0]
+    with pytest.raises(ValueError):
+        group.address_for_alias(alias="alias-0")
+
+
+def test_group_bulk_keypairs(tmp_path):
+    """Bulk keys are added as a block and streamed to a loadable keystore."""
+    group, _ = _group(1)
+    keystore = tmp_path / "sui.keystore"
+    pairs = crypto.create_new_keypairs(
+        4, SignatureScheme.SECP256R1, chunk_size=2, use_processes=False
+    )
+    assert crypto.write_keystore(str(keystore), pairs) == 4
+    addies = group.add_keypairs(
+        keypairs=[x[1] for x in pairs], alias_prefix="bulk", make_active=True
+    )
+    assert group.active_address == addies[0]
+    assert group.address_for_alias(alias="bulk-3") == addies[3]
+    rows = crypto.load_keys_and_addresses(str(keystore))
+    assert [list(row[3])[0] for row in rows] == addies
+    # Nothing is added when any key collides
+    with pytest.raises(ValueError):
+        group.add_keypairs(keypairs=[crypto.create_new_keypair()[1], pairs[0][1]])
+    assert len(group.address_list) == 5
+    # Mnemonic derived keys follow account index paths
+    mnem = pairs[0][0]
+    derived = crypto.create_new_keypairs(3, mnemonic=mnem, chunk_size=2)
+    _, keypair, _ = crypto.recover_key_and_address(
+        SignatureScheme.ED25519, mnem, "m/44'/784'/2'/0'/0'"
+    )
+    assert derived[2][1].serialize() == keypair.serialize()
+
+
+def test_legacy_cref_lookups():
+    """Legacy configuration cross reference lookups follow matrix changes."""
+    keys = [
+        crypto.create_new_keypair(scheme=SignatureScheme.ED25519)[1].serialize()
+        for _ in range(3)
+    ]
+    config = SuiConfig.user_config(rpc_url="http://127.0.0.1:9000", prv_keys=keys)
+    for index, addy in enumerate(config.addresses):
+        alias = config.aliases[index]
+        assert config.kp4add(addy).serialize() == keys[index]
+        assert config.addr4al(alias).address == addy
+        assert config.al4addr(addy) == alias
+        assert config.pk4al(alias) == keys[index]
+    old_alias = config.aliases[1]
+    config._replace_alias_key(
+        config._cref_result_for(old_alias, CrefType.ALIAS, CrefType.INDEX),
+        "renamed",
+    )
+    assert config.addr4al("renamed").address == config.addresses[1]
+    assert config._cref_result_for(old_alias, CrefType.ALIAS, CrefType.INDEX) is None
+    popped = config.addresses[-1]
+    config._cref_matrix.pop()
+    with pytest.raises(ValueError):
+        config.kp4add(popped)
+    assert config._cref_result_for(keys[2], CrefType.KPAIR, CrefType.INDEX) is None
+
+
+def test_lazy_keystore(tmp_path):
+    """Lazy keystore loads match eager loads and reuse the derived address index."""
+    keys = [
+        crypto.create_new_keypair(scheme=scheme)[1].serialize()
+        for scheme in [SignatureScheme.ED25519, SignatureScheme.SECP256K1]
+    ]
+    keystore = tmp_path / "sui.keystore"
+    keystore.write_text(json.dumps(keys), encoding="utf8")
+    eager = crypto.load_keys_and_addresses(str(keystore))
+    derived = crypto.lazy_keys_and_addresses(str(keystore))
+    assert (tmp_path / "sui.keystore.pysui_index").exists()
+    indexed = crypto.lazy_keys_and_addresses(str(keystore))
+    for erow, irow in zip(eager, indexed):
+        assert list(irow[CrefType.PKEY]) == list(erow[CrefType.PKEY])
+        assert list(irow[CrefType.ADDY]) == list(erow[CrefType.ADDY])
+        # Keypair is only decoded on use
+        assert dict.__getitem__(irow[CrefType.KPAIR], next(iter(irow[CrefType.KPAIR]))) is None
+        assert (
+            next(iter(irow[CrefType.KPAIR].values())).serialize()
+            == next(iter(erow[CrefType.KPAIR].values())).serialize()
+        )
+    assert [list(row[CrefType.ADDY]) for row in derived] == [
+        list(row[CrefType.ADDY]) for row in eager
+    ]
+    # An unwritable index does not fail the load
+    unindexed = crypto.lazy_keys_and_addresses(
+        str(keystore), index_file=str(tmp_path / "missing" / "index")
+    )
+    assert [list(row[CrefType.ADDY]) for row in unindexed] == [
+        list(row[CrefType.ADDY]) for row in eager
+    ]
+
+
+def test_lazy_user_config():
+    """Background derivation is awaited on first lookup."""
+    keys = [
+        crypto.create_new_keypair(scheme=SignatureScheme.ED25519)[1].serialize()
+        for _ in range(3)
+    ]
+    config = SuiConfig.user_config(
+        rpc_url="http://127.0.0.1:9000", prv_keys=keys, lazy_keys=True
+    )
+    assert config.active_address.address == config.addresses[0]
+    assert config.kp4add(config.addresses[2]).serialize() == keys[2]
+    assert len(config.aliases) == 3
+
+
+def test_config_batched_writes(tmp_path):
+    """Writes are deferred in a batch, skipped when unchanged and load equals from_json."""
+    config = PysuiConfiguration(from_cfg_path=str(tmp_path), group_name="user")
+    config_file = tmp_path / "PysuiConfig.json"
+    assert config.model.to_config_dict() == config.model.to_dict()
+    config.new_keypairs(
+        count=2, alias_prefix="bulk", make_active=True, use_processes=False
+    )
+    written = config_file.stat().st_mtime_ns
+    config._write_model()
+    assert config_file.stat().st_mtime_ns == written
+    written = config_file.read_text(encoding="utf8")
+    with config.batch_updates():
+        config.rename_alias(existing_alias="bulk-1", new_alias="renamed")
+        config.make_active(alias="renamed", persist=True)
+        assert config_file.read_text(encoding="utf8") == written
+    content = config_file.read_text(encoding="utf8")
+    assert "renamed" in content
+    assert not list(tmp_path.glob("*.tmp"))
+    assert PysuiConfigModel.from_config_dict(
+        json.loads(content)
+    ) == PysuiConfigModel.from_json(content)
+
+
+def test_new_keypairs_keystore(tmp_path):
+    """New keystrings are appended after the group accepts them."""
+    config = PysuiConfiguration(from_cfg_path=str(tmp_path), group_name="user")
+    keystore = tmp_path / "sui.keystore"
+    existing = crypto.create_new_keypair()[1].serialize()
+    keystore.write_text(json.dumps([existing]), encoding="utf8")
+    config.new_keypairs(
+        count=2, alias_prefix="bulk", keystore_file=str(keystore), use_processes=False
+    )
+    keystrings = json.loads(keystore.read_text(encoding="utf8"))
+    assert len(keystrings) == 3 and keystrings[0] == existing
+    # Rejected aliases leave the keystore untouched
+    with pytest.raises(ValueError):
+        config.new_keypairs(
+            count=1,
+            alias_prefix="bulk",
+            keystore_file=str(keystore),
+            use_processes=False,
+        )
+    assert json.loads(keystore.read_text(encoding="utf8")) == keystrings
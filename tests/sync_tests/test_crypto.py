@@ -13,16 +13,23 @@
 
 """Testing crypto capabilities (no transactions)."""
 
+import base64
+
 import pytest
 from pysui import SuiAddress
 from pysui.abstracts.client_keypair import SignatureScheme
 import pysui.abstracts.client_config as acfg
+from pysui.sui.sui_types import bcs
 from pysui.sui.sui_crypto import (
+    MultiSig,
+    IntentScope,
     create_new_address,
     create_new_keypair,
     emphemeral_keys_and_addresses,
     keypair_from_keystring,
     recover_key_and_address,
+    sign_batch,
+    verify_batch,
 )
 
 
@@ -73,6 +80,19 @@ def test_signing():
     assert res.value == sktr
 
 
+@pytest.mark.parametrize(
+    "scheme",
+    [SignatureScheme.ED25519, SignatureScheme.SECP256K1, SignatureScheme.SECP256R1],
+)
+def test_signing_bytes(scheme):
+    """Signing raw bytes matches signing the base64 form."""
+    _, kp = create_new_keypair(scheme)
+    tx_bytes = bytes(range(256)) * 4
+    sig = kp.new_sign_secure(tx_bytes)
+    assert sig.value == kp.new_sign_secure(base64.b64encode(tx_bytes).decode()).value
+    assert base64.b64decode(sig.value) == kp.sign_secure_bytes(memoryview(tx_bytes))
+
+
 def test_recover_same():
     """Test key recovery."""
     # Get a unique key
@@ -103,3 +123,76 @@ def test_bad_keypair_create():
     with pytest.raises(ValueError) as exc_info:
         phrase, kp = create_new_keypair(SignatureScheme.ED25519, "16")
         assert str(exc_info) == "Word count must be one of integer {12, 15, 18, 21, 24}"
+
+
+@pytest.mark.parametrize("use_processes", [False, True])
+def test_sign_batch(use_processes):
+    """Batch signatures are in order and match single signing."""
+    keys = [keypair_from_keystring(kstr) for kstr in KEYSTRING_LIST[:3]]
+    msig = MultiSig(keys, [1, 1, 1], 2)
+    txs = [base64.b64encode(bytes([idx]) * 64).decode() for idx in range(7)]
+    single = sign_batch(keys[0], txs, chunk_size=2, use_processes=use_processes)
+    assert single == [keys[0].new_sign_secure(tx).value for tx in txs]
+    # Sender and MultiSig sponsor, from raw bytes
+    multi = sign_batch(
+        [keys[1], (msig, msig.public_keys[:2])],
+        [base64.b64decode(tx) for tx in txs],
+        chunk_size=3,
+        use_processes=use_processes,
+    )
+    assert len(multi) == len(txs)
+    for tx, sigs in zip(txs, multi):
+        assert sigs == [
+            keys[1].new_sign_secure(tx).value,
+            msig.sign(tx, msig.public_keys[:2]).value,
+        ]
+
+
+def test_verify_batch():
+    """Public key verification of single key and MultiSig signatures."""
+    keys = [keypair_from_keystring(kstr) for kstr in KEYSTRING_LIST[:3]]
+    msg = base64.b64encode(b"challenge").decode()
+    other = base64.b64encode(b"other").decode()
+    items = []
+    for index, kp in enumerate(keys):
+        sig = kp.sign_personal_message(msg)
+        items.extend(
+            [
+                (msg, sig, ADDRESS_OUT_LIST[index]),
+                (other, sig),
+                (msg, sig, ADDRESS_OUT_LIST[index + 1]),
+            ]
+        )
+    items.append((msg, "not a signature"))
+    assert verify_batch(items, chunk_size=2) == [True, False, False] * 3 + [False]
+    msig = MultiSig(keys, [1, 1, 1], 2)
+    tx_bytes = bytes(range(100))
+    sig = msig.sign(tx_bytes, msig.public_keys[1:]).value
+    assert verify_batch(
+        [(tx_bytes, sig, msig.address), (tx_bytes[1:], sig)],
+        intent=IntentScope.TransactionData,
+    ) == [True, False]
+
+
+def test_multisig_signature_assembly():
+    """Precomputed MultiSig parts assemble the canonical BCS MultiSignature."""
+    keys = [keypair_from_keystring(kstr) for kstr in KEYSTRING_LIST]
+    msig = MultiSig(keys, [1, 2, 1, 1, 1], 3)
+    tx_bytes = bytes(range(64))
+    for signers in ([1, 3], [0, 2, 4], [4, 1]):
+        pub_keys = [msig.public_keys[index] for index in signers]
+        expected = bcs.MultiSignature(
+            SignatureScheme.MULTISIG,
+            [
+                bcs.MsCompressedSig(list(keys[index].sign_secure_bytes(tx_bytes)[:65]))
+                for index in signers
+            ],
+            bcs.MsBitmap(sum(1 << index for index in signers)),
+            msig._new_publickey(),
+            msig.threshold,
+        )
+        sig = msig.sign(tx_bytes, pub_keys)
+        assert base64.b64decode(sig.value) == expected.serialize()
+        assert msig.sign(tx_bytes, pub_keys).value == sig.value
+    with pytest.raises(ValueError):
+        msig.validate_signers([msig.public_keys[0], msig.public_keys[2]])
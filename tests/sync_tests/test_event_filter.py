@@ -0,0 +1,126 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""Testing local event filter evaluation (no network)."""
+
+import pytest
+
+from pysui.sui.sui_txresults.complex_tx import Event
+from pysui.sui.sui_types.address import SuiAddress
+from pysui.sui.sui_types.scalars import SuiInteger
+import pysui.sui.sui_pgql.pgql_types as pgql_type
+from pysui.sui.sui_types.event_filter import (
+    AndFilter,
+    AnyFilter,
+    EventRouter,
+    MoveEventFieldQuery,
+    MoveEventModuleQuery,
+    MoveEventTypeQuery,
+    MoveModuleEventQuery,
+    SenderEventQuery,
+    TimeRangeEventQuery,
+)
+
+_ALICE = "0x" + "a1" * 32
+_BOB = "0x" + "b2" * 32
+
+
+def _event(sender: str, etype: str, module: str = "pool", amount: int = 1) -> Event:
+    return Event(
+        bcs="",
+        package_id="0x2",
+        parsed_json={"amount": amount, "inner": {"ok": True}},
+        sender=sender,
+        transaction_module=module,
+        event_type=etype,
+        event_id={"txDigest": "D1", "eventSeq": "0"},
+        timestamp_ms="1000",
+    )
+
+
+def test_router_matches():
+    """Indexed, scanned and combined routes match as the node would."""
+    router = EventRouter()
+    seen: dict[str, list] = {}
+
+    def _to(name):
+        return lambda event: seen.setdefault(name, []).append(event)
+
+    router.add_route(SenderEventQuery(SuiAddress(_ALICE)), _to("alice"))
+    router.add_route(
+        MoveEventTypeQuery("0x2::coin::Minted<0x2::sui::SUI>"), _to("mint")
+    )
+    router.add_route(MoveEventModuleQuery("coin", "0x2"), _to("coin_mod"))
+    router.add_route(MoveModuleEventQuery("dex", "0x2"), _to("dex_emit"))
+    router.add_route(
+        AndFilter(
+            lhs_filter=SenderEventQuery(SuiAddress(_BOB)),
+            rhs_filter=MoveEventFieldQuery({"path": "/amount", "value": 5}),
+        ),
+        _to("bob_five"),
+    )
+    router.add_route(
+        AnyFilter(
+            filters=[
+                SenderEventQuery(SuiAddress(_BOB)),
+                MoveEventTypeQuery("0x2::coin::Burned"),
+            ]
+        ),
+        _to("bob_or_burn"),
+    )
+    router.add_route(
+        TimeRangeEventQuery(SuiInteger(0), SuiInteger(2000)), _to("early")
+    )
+    router.add_route({"eventType": "0x2::coin"}, _to("gql_coin"))
+    router.add_route(
+        {"sender": _BOB, "emittingModule": "0x2::dex"}, _to("gql_bob_dex")
+    )
+    assert len(router) == 9
+
+    long_coin = "0x" + "0" * 63 + "2::coin"
+    mint = _event(_ALICE, long_coin + "::Minted<0x2::sui::SUI>")
+    assert router.dispatch(mint) == 5
+    assert set(seen) == {"alice", "mint", "coin_mod", "early", "gql_coin"}
+
+    seen.clear()
+    burn = _event(_BOB, "0x2::coin::Burned", module="dex", amount=5)
+    router.dispatch(burn)
+    assert set(seen) == {
+        "coin_mod",
+        "dex_emit",
+        "bob_five",
+        "bob_or_burn",
+        "early",
+        "gql_coin",
+        "gql_bob_dex",
+    }
+    assert seen["bob_or_burn"] == [burn]
+
+
+def test_router_remove_and_gql_events():
+    """Removed routes stop matching, GraphQL events route by sender and module."""
+    router = EventRouter()
+    hits: list[int] = []
+    sender_id = router.add_route({"sender": _ALICE}, lambda _: hits.append(0))
+    scan_id = router.add_route(
+        MoveEventFieldQuery({"path": "/inner/ok", "value": True}),
+        lambda _: hits.append(1),
+    )
+    router.add_route({"emittingModule": "0x2::pool"}, lambda _: hits.append(2))
+    gql_event = pgql_type.EventGQL(
+        "0x2",
+        "pool",
+        "2024-10-08T00:00:00.000Z",
+        '{"inner": {"ok": true}}',
+        {"address": _ALICE},
+    )
+    assert router.dispatch(gql_event) == 3
+    assert hits == [0, 1, 2]
+    router.remove_route(sender_id)
+    router.remove_route(scan_id)
+    assert len(router.matches(gql_event)) == 1
+    assert router.subscription_handler(_event(_BOB, "0x2::x::Y"), 1, 1)
+    with pytest.raises(ValueError):
+        router.add_route({"bogus": 1}, print)
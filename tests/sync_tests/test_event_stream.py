@@ -0,0 +1,150 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""Testing GraphQL EventStream against an in memory event source."""
+
+import asyncio
+import datetime
+
+import pytest
+
+from pysui import SuiRpcResult
+import pysui.sui.sui_pgql.pgql_types as pgql_type
+from pysui.sui.sui_pgql.pgql_event_stream import (
+    EventStream,
+    FileCursorStore,
+    StreamCheckpoint,
+)
+
+
+class _Source:
+    """Pages events like the GraphQL service, cursors are event indexes."""
+
+    def __init__(self, count: int):
+        self.events = []
+        self.failures = 0
+        self.failure = "HTTPX error: ConnectError"
+        self.queries = 0
+        self.append(count)
+
+    def append(self, count: int):
+        stamp = datetime.datetime.now(datetime.timezone.utc).isoformat()
+        for _ in range(count):
+            self.events.append(
+                pgql_type.EventGQL("0x2", str(len(self.events)), stamp, "{}", None)
+            )
+
+    async def execute_query_node(self, *, with_node):
+        self.queries += 1
+        if self.failures:
+            self.failures -= 1
+            return SuiRpcResult(False, self.failure, None)
+        start = int(with_node.next_page.endCursor) + 1 if with_node.next_page else 0
+        page = self.events[start : start + with_node.page_size]
+        end = str(start + len(page) - 1) if page else None
+        more = start + len(page) < len(self.events)
+        return SuiRpcResult(
+            True, None, pgql_type.EventsGQL(page, pgql_type.PagingCursor(more, end))
+        )
+
+    async def subscribe_query_node(self, *, with_node):
+        """Announces two batches of new events."""
+        for _ in range(2):
+            await asyncio.sleep(0.05)
+            self.append(2)
+            yield SuiRpcResult(True, None, None)
+        await asyncio.Event().wait()
+
+
+def test_stream_resumes_from_checkpoint(tmp_path):
+    """A failed handler and query outage neither repeat nor skip events."""
+    source = _Source(7)
+    store = FileCursorStore(str(tmp_path / "stream.json"))
+    seen: list[int] = []
+
+    def failing(event):
+        if event.module_name == "4":
+            raise RuntimeError("handler failure")
+        seen.append(int(event.module_name))
+
+    stream = EventStream(
+        source, handler=failing, event_filter={}, store=store, page_size=3
+    )
+    with pytest.raises(RuntimeError):
+        asyncio.run(stream.run())
+    assert store.load() == StreamCheckpoint("2", 1)
+
+    async def resume():
+        def collect(event):
+            seen.append(int(event.module_name))
+            if len(seen) == 7:
+                # Outage while caught up, then new events
+                source.failures = 2
+                source.append(5)
+            return len(seen) < 12
+
+        stream = EventStream(
+            source,
+            handler=collect,
+            event_filter={},
+            store=store,
+            page_size=3,
+            poll_interval=0.01,
+            retry_delay=0.01,
+        )
+        await stream.run()
+        return stream
+
+    stream = asyncio.run(resume())
+    assert seen == list(range(12))
+    assert stream.metrics.delivered == 8
+    assert stream.metrics.errors == 2
+    assert not stream.metrics.backfilling
+    assert stream.metrics.max_lag >= stream.metrics.lag > 0
+    assert store.load() == stream.checkpoint == StreamCheckpoint("9", 2)
+
+
+def test_stream_raises_query_errors():
+    """Query errors stop the stream instead of being retried."""
+    source = _Source(3)
+    source.failures = 1
+    source.failure = "TransportQueryError"
+    stream = EventStream(
+        source, handler=print, event_filter={}, page_size=3, retry_delay=0.01
+    )
+    with pytest.raises(ValueError, match="TransportQueryError"):
+        asyncio.run(asyncio.wait_for(stream.run(), 5))
+    assert source.queries == 1
+    assert stream.checkpoint == StreamCheckpoint()
+
+
+def test_stream_wakes_on_subscription():
+    """Subscription messages trigger queries well before the poll interval."""
+    source = _Source(1)
+    seen: list[int] = []
+
+    def collect(event):
+        seen.append(int(event.module_name))
+        return len(seen) < 5
+
+    stream = EventStream(
+        source,
+        handler=collect,
+        event_filter={},
+        page_size=3,
+        poll_interval=30.0,
+        wake_on=object(),
+    )
+    asyncio.run(asyncio.wait_for(stream.run(), 5))
+    assert seen == list(range(5))
+    assert stream.checkpoint == StreamCheckpoint("2", 2)
+
+
+def test_stream_requires_one_filter():
+    """Exactly one of event_filter or tx_filter."""
+    with pytest.raises(ValueError):
+        EventStream(None, handler=print)
+    with pytest.raises(ValueError):
+        EventStream(None, handler=print, event_filter={}, tx_filter={})
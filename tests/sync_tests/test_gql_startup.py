@@ -0,0 +1,66 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""Testing GraphQL client startup against a local GraphQL http server."""
+
+import time
+import types
+
+from pysui.sui.sui_pgql.pgql_clients import SuiGQLClient
+from pysui.sui.sui_pgql.pgql_configs import SuiConfigGQL
+from tests.test_utils import GQLNodeHandler, local_node
+
+_DELAY: float = 0.3
+
+
+class _Handler(GQLNodeHandler):
+    """Answers GraphQL posts after a fixed delay, counting queries by kind."""
+
+    queries: list[str] = []
+
+    def answer(self, body: dict) -> dict:
+        query = body["query"]
+        self.queries.append(
+            "introspection"
+            if "__schema" in query
+            else "protocol" if "protocolConfig" in query else "service"
+        )
+        time.sleep(_DELAY)
+        return super().answer(body)
+
+
+def test_concurrent_lazy_startup():
+    """Startup steps overlap and the protocol configuration loads on first use."""
+    with local_node(_Handler) as url:
+        config = types.SimpleNamespace(url=url, active_profile="localnet")
+        client = SuiGQLClient(pysui_config=config, lazy_protocol=True)
+        timings = client.startup_timings
+        assert sorted(_Handler.queries) == ["introspection", "service"]
+        assert "protocol_config" not in timings
+        # Introspection and service configuration overlap
+        assert timings["total"] < 2 * _DELAY
+        assert client.base_schema_version == "2024.10"
+        assert client.current_gas_price() == 750
+        assert client.rpc_config().serviceConfig.maxPageSize == 50
+        assert client.rpc_config().protocolConfig is None
+
+        constraints = client.protocol().transaction_constraints
+        assert constraints.protocol_version == 63
+        assert constraints.max_pure_argument_size == 16384
+        assert client.protocol() is client.rpc_config().protocolConfig
+        assert _Handler.queries.count("protocol") == 1
+        assert client.startup_timings["protocol_config"] >= _DELAY
+
+        _Handler.queries.clear()
+        client = SuiGQLClient(pysui_config=config)
+        assert sorted(_Handler.queries) == ["introspection", "protocol", "service"]
+        assert client.startup_timings["total"] < 2 * _DELAY
+        assert client.protocol().transaction_constraints.receive_objects
+
+
+def test_config_positional_order():
+    """protocolConfig keeps its place ahead of checkpoints."""
+    config = SuiConfigGQL("4c78adac", None, "protocol", "checkpoints")
+    assert (config.protocolConfig, config.checkpoints) == ("protocol", "checkpoints")
@@ -0,0 +1,120 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""Testing GraphQL subscriptions against a local graphql-transport-ws server."""
+
+import asyncio
+import json
+
+from gql.dsl import DSLSchema
+from graphql import build_schema, print_ast
+from websockets.server import serve
+
+from pysui.sui.sui_pgql.pgql_clients import _subscribe_document
+import pysui.sui.sui_pgql.pgql_query as qn
+import pysui.sui.sui_pgql.pgql_types as pgql_type
+
+_SDL = """
+scalar JSON
+scalar SuiAddress
+type Query { chainIdentifier: String! }
+type MovePackage { address: SuiAddress! }
+type MoveModule { package: MovePackage! name: String! }
+type Address { address: SuiAddress! }
+type MoveValue { json: JSON! }
+type Event {
+  sendingModule: MoveModule
+  sender: Address
+  timestamp: String
+  contents: MoveValue!
+}
+input SubscriptionEventFilter { eventType: String sender: SuiAddress }
+type Subscription { events(filter: SubscriptionEventFilter): Event! }
+"""
+
+
+def _event(index: int) -> dict:
+    return {
+        "events": {
+            "sendingModule": {"package": {"package_id": "0x2"}, "module_name": "m"},
+            "sender": {"address": "0x1"},
+            "timestamp": "2024-10-08T00:00:00.000Z",
+            "contents": {"json": {"index": index}},
+        }
+    }
+
+
+class _Node:
+    """Sends two events then drops the first connection, completes the second."""
+
+    def __init__(self):
+        self.connections = 0
+
+    async def handler(self, websocket):
+        self.connections += 1
+        async for raw in websocket:
+            msg = json.loads(raw)
+            if msg["type"] == "connection_init":
+                await websocket.send(json.dumps({"type": "connection_ack"}))
+            elif msg["type"] == "subscribe":
+                first = self.connections == 1
+                for index in (0, 1) if first else (2,):
+                    await websocket.send(
+                        json.dumps(
+                            {"type": "next", "id": msg["id"], "payload": {"data": _event(index)}}
+                        )
+                    )
+                if first:
+                    await websocket.close()
+                    return
+                await websocket.send(json.dumps({"type": "complete", "id": msg["id"]}))
+
+
+def test_subscribe_events_document():
+    """SubscribeEvents builds a subscription, schemas without one are rejected."""
+    schema = DSLSchema(build_schema(_SDL))
+    doc = qn.SubscribeEvents(event_filter={"sender": "0x1"}).as_document_node(schema)
+    text = print_ast(doc)
+    assert text.startswith("fragment EventStandard")
+    assert 'subscription {\n  events(filter: {sender: "0x1"})' in text
+    no_subs = DSLSchema(build_schema("type Query { chainIdentifier: String! }"))
+    try:
+        qn.SubscribeEvents().as_document_node(no_subs)
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+
+
+def test_subscription_reconnects():
+    """Messages are decoded and the subscription is resent after connection loss."""
+    node = _Node()
+    schema = DSLSchema(build_schema(_SDL))
+    qnode = qn.SubscribeEvents()
+
+    async def run():
+        async with serve(
+            node.handler, "127.0.0.1", 0, subprotocols=["graphql-transport-ws"]
+        ) as server:
+            port = server.sockets[0].getsockname()[1]
+            return [
+                result
+                async for result in _subscribe_document(
+                    f"ws://127.0.0.1:{port}",
+                    qnode.as_document_node(schema),
+                    None,
+                    qnode.encode_fn(),
+                    reconnect=True,
+                    retry_delay=0.01,
+                    max_retry_delay=0.01,
+                )
+            ]
+
+    results = asyncio.run(asyncio.wait_for(run(), 10))
+    assert node.connections == 2
+    assert all(result.is_ok() for result in results)
+    events = [result.result_data for result in results]
+    assert all(isinstance(event, pgql_type.EventGQL) for event in events)
+    assert [json.loads(event.json)["index"] for event in events] == [0, 1, 2]
+    assert events[0].module_name == "m"
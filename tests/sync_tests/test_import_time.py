@@ -0,0 +1,67 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""Import time regression budget (see tools/bench_import.py)."""
+
+import subprocess
+import sys
+
+# Generous for slow CI, eager imports cost ~500ms
+_PYSUI_BUDGET_MS: float = 150.0
+
+_HEAVY_PACKAGES: list[str] = [
+    "httpx",
+    "h2",
+    "websockets",
+    "gql",
+    "graphql",
+    "dataclasses_json",
+    "canoser",
+    "yaml",
+    "pysui_fastcrypto",
+]
+
+
+def _fresh(code: str) -> str:
+    """Run code in a fresh interpreter, return its stdout."""
+    return subprocess.run(
+        [sys.executable, "-W", "ignore", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+
+
+def test_import_pysui_is_light():
+    """import pysui loads no heavy dependencies and stays within budget."""
+    loaded = _fresh(
+        "import sys, pysui\n"
+        f"print(','.join(p for p in {_HEAVY_PACKAGES!r} if p in sys.modules))"
+    ).strip()
+    assert loaded == ""
+    best = min(
+        float(
+            _fresh(
+                "import time\n"
+                "start = time.perf_counter()\n"
+                "import pysui\n"
+                "print((time.perf_counter() - start) * 1000)"
+            )
+        )
+        for _ in range(3)
+    )
+    assert best < _PYSUI_BUDGET_MS
+
+
+def test_lazy_names_resolve():
+    """Convenience names load on first access."""
+    out = _fresh(
+        "import sys, pysui\n"
+        "assert 'pysui.sui.sui_clients.sync_client' not in sys.modules\n"
+        "from pysui import SyncClient, SuiConfig, AsyncGqlClient\n"
+        "from pysui.sui.sui_txn import SyncTransaction\n"
+        "print(SyncClient.__module__, SyncTransaction.__name__)"
+    )
+    assert out.split() == ["pysui.sui.sui_clients.sync_client", "SuiTransaction"]
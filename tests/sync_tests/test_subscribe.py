@@ -0,0 +1,331 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""Testing subscriptions against a local websocket node (no Sui network)."""
+
+import asyncio
+import json
+import time
+import types
+
+import pytest
+
+from websockets.server import serve
+
+from pysui import SuiConfig
+from pysui.sui.sui_builders.subscription_builders import SubscribeEvent
+from pysui.sui.sui_clients.subscribe import (
+    CallbackSink,
+    EventData,
+    HandlerPool,
+    JsonlSink,
+    OverflowPolicy,
+    RingBufferSink,
+    SuiClient,
+)
+from pysui.sui.sui_types.address import SuiAddress
+from pysui.sui.sui_types.event_filter import SenderEventQuery
+
+
+def _event(subscription: int, seq: int) -> str:
+    """Event notification for subscription."""
+    return json.dumps(
+        {
+            "jsonrpc": "2.0",
+            "method": "suix_subscribeEvent",
+            "params": {
+                "subscription": subscription,
+                "result": {
+                    "bcs": "",
+                    "packageId": "0x2",
+                    "parsedJson": "{}",
+                    "sender": "0x1",
+                    "transactionModule": "coin",
+                    "type": "0x2::coin::Event",
+                    "id": {"txDigest": "", "eventSeq": str(seq)},
+                },
+            },
+        }
+    )
+
+
+class _Node:
+    """Websocket node that emits events per subscription and drops the first connection."""
+
+    def __init__(self, events: int, refuse: int = 0):
+        self.events = events
+        self.connections = 0
+        self.subscribes: list[int] = []
+        self.next_id = 100
+        # Refuse this many resubscribes
+        self.refuse = refuse
+
+    async def __call__(self, websock):
+        self.connections += 1
+        connection = self.connections
+        subscribed = 0
+        async for message in websock:
+            request = json.loads(message)
+            if request["method"] != "suix_subscribeEvent":
+                continue
+            if connection > 1 and self.refuse:
+                self.refuse -= 1
+                await websock.send(
+                    json.dumps(
+                        {
+                            "jsonrpc": "2.0",
+                            "error": {"code": -32000, "message": "refused"},
+                            "id": request["id"],
+                        }
+                    )
+                )
+                continue
+            self.next_id += 1
+            subscribed += 1
+            self.subscribes.append(connection)
+            await websock.send(
+                json.dumps({"jsonrpc": "2.0", "result": self.next_id, "id": request["id"]})
+            )
+            for seq in range(self.events):
+                await websock.send(_event(self.next_id, seq))
+            # Drop the first connection once all subscribed
+            if connection == 1 and subscribed == 3:
+                await websock.close()
+
+
+def _multiplexed(refuse: int = 0) -> tuple[_Node, list, dict, dict]:
+    """Run three multiplexed subscriptions over a node dropping the first connection."""
+
+    async def _run() -> tuple[_Node, list]:
+        node = _Node(2, refuse)
+        async with serve(node, "127.0.0.1", 0) as server:
+            port = server.sockets[0].getsockname()[1]
+            config = SuiConfig.user_config(
+                rpc_url="http://127.0.0.1:9000", ws_url=f"ws://127.0.0.1:{port}"
+            )
+            client = SuiClient(config, multiplex=1)
+            received: dict[str, list] = {}
+            sub_ids: dict[str, set] = {}
+
+            def _handler(sender: str):
+                def _inner(event, sub_id, _counter):
+                    sub_ids.setdefault(sender, set()).add(sub_id)
+                    events = received.setdefault(sender, [])
+                    events.append(event.params.result.event_id["eventSeq"])
+                    return len(events) if len(events) < 4 else False
+
+                return _inner
+
+            tasks = []
+            for sender in ("0x1", "0x2", "0x3"):
+                result = await client.new_event_subscription(
+                    SubscribeEvent(event_filter=SenderEventQuery(SuiAddress(sender))),
+                    _handler(sender),
+                    continue_on_close=True,
+                )
+                tasks.extend(result.result_data.values())
+            results = await asyncio.wait_for(asyncio.gather(*tasks), 10)
+        return node, results, received, sub_ids
+
+    return asyncio.run(_run())
+
+
+def test_multiplexed_subscriptions():
+    """Subscriptions share one connection, are demultiplexed and resubscribed together."""
+    node, results, received, sub_ids = _multiplexed()
+    assert all(x.is_ok() for x in results)
+    # Handlers see the resubscribed id
+    assert all(len(x) == 2 and max(x) > 103 for x in sub_ids.values())
+    # One connection, then one reconnect carrying all three resubscriptions
+    assert node.connections == 2
+    assert node.subscribes == [1, 1, 1, 2, 2, 2]
+    assert all(len(x) == 4 for x in received.values())
+
+
+def test_multiplexed_resubscribe_refused():
+    """A refused resubscribe ends that subscription with a failed result."""
+    node, results, received, _ = _multiplexed(refuse=1)
+    failed = [x for x in results if not x.is_ok()]
+    assert len(failed) == 1
+    assert "Resubscribe failed" in str(failed[0].result_data)
+    assert sorted(len(x) for x in received.values()) == [2, 4, 4]
+
+
+def test_multiplexed_cancel_during_outage():
+    """Cancelling the last subscription while reconnecting stops the connection."""
+
+    async def _run():
+        node = _Node(1)
+        async with serve(node, "127.0.0.1", 0) as server:
+            port = server.sockets[0].getsockname()[1]
+            config = SuiConfig.user_config(
+                rpc_url="http://127.0.0.1:9000", ws_url=f"ws://127.0.0.1:{port}"
+            )
+            client = SuiClient(config, multiplex=1)
+            await client.new_event_subscription(
+                SubscribeEvent(event_filter=SenderEventQuery(SuiAddress("0x1"))),
+                lambda _event, _sub_id, _counter: True,
+                continue_on_close=True,
+            )
+            connection = client._connections[0]
+            while not connection._connected.is_set():
+                await asyncio.sleep(0.01)
+        # Node stopped, the connection is reconnecting
+        while connection._connected.is_set():
+            await asyncio.sleep(0.01)
+        task = connection._task
+        results = await asyncio.wait_for(client.kill_shutdown(), 5)
+        assert results[0].result_string == "Cancelled"
+        assert connection.load == 0
+        assert task.done() and connection._task is None
+        async with serve(node, "127.0.0.1", port):
+            await asyncio.sleep(0.1)
+        assert node.connections == 1
+
+    asyncio.run(_run())
+
+
+def _pooled(events: int, pool: HandlerPool, handler, sink=None) -> tuple:
+    """Run one subscription with pool against a node emitting events."""
+
+    async def _run():
+        node = _Node(events)
+        async with serve(node, "127.0.0.1", 0) as server:
+            port = server.sockets[0].getsockname()[1]
+            config = SuiConfig.user_config(
+                rpc_url="http://127.0.0.1:9000", ws_url=f"ws://127.0.0.1:{port}"
+            )
+            client = SuiClient(config)
+            result = await client.new_event_subscription(
+                SubscribeEvent(event_filter=SenderEventQuery(SuiAddress("0x1"))),
+                handler,
+                handler_pool=pool,
+                result_sink=sink,
+            )
+            return await asyncio.wait_for(
+                asyncio.gather(*result.result_data.values()), 10
+            )
+
+    return asyncio.run(_run())[0]
+
+
+def test_handler_pool_spill():
+    """Spilled events are handled in order once the queue drains."""
+    seen: list[int] = []
+
+    async def _handler(event, _sub_id, counter):
+        await asyncio.sleep(0.001)
+        seen.append(int(event.params.result.event_id["eventSeq"]))
+        return counter + 1 if len(seen) < 50 else False
+
+    pool = HandlerPool(max_queue=4, policy=OverflowPolicy.SPILL)
+    result = _pooled(50, pool, _handler)
+    assert result.is_ok()
+    assert seen == list(range(50))
+    assert pool.metrics.spilled > 0
+    assert pool.metrics.max_queue_depth > 4
+    assert pool.metrics.handled == 50
+    assert len(result.result_data.collected) == 49
+
+
+def test_handler_pool_drop():
+    """Events beyond the queue are dropped and counted, sync handlers run on threads."""
+    pool = HandlerPool(workers=2, max_queue=4, policy=OverflowPolicy.DROP)
+
+    def _handler(_event, _sub_id, _counter):
+        # Hold the workers until every event has been received
+        while pool.metrics.received < 50:
+            time.sleep(0.001)
+        return False
+
+    result = _pooled(50, pool, _handler)
+    assert result.is_ok()
+    assert pool.metrics.received == 50
+    # At most the queue and the two in flight events were kept
+    assert pool.metrics.dropped >= 50 - 4 - 2
+    assert pool.metrics.max_queue_depth == 4
+    assert pool.metrics.max_lag >= pool.metrics.lag >= 0
+
+
+def test_handler_pool_drains_on_receiver_close():
+    """Events queued or spilled when the receiver fails are handled before it raises."""
+    seen: list[int] = []
+    pool = HandlerPool(max_queue=2, policy=OverflowPolicy.SPILL)
+    builder = types.SimpleNamespace(handle_return=lambda event: event)
+
+    async def _handler(event, _sub_id, _counter):
+        await asyncio.sleep(0.001)
+        seen.append(event["seq"])
+        return True
+
+    async def _run():
+        events = iter(range(20))
+
+        async def _receiver():
+            try:
+                return {"seq": next(events)}
+            except StopIteration:
+                raise ConnectionError("closed") from None
+
+        await pool.drive(builder, 1, _receiver, _handler, EventData("drain"))
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(_run())
+    assert seen == list(range(20))
+    assert pool.metrics.spilled > 0
+
+
+def test_handler_pool_one_drive_at_a_time():
+    """A pool driving one subscription refuses another, then drives again."""
+    pool = HandlerPool()
+    builder = types.SimpleNamespace(handle_return=lambda event: event)
+
+    async def _handler(_event, _sub_id, _counter):
+        return False
+
+    async def _run():
+        release = asyncio.Event()
+
+        async def _held():
+            await release.wait()
+            return {}
+
+        first = asyncio.create_task(
+            pool.drive(builder, 1, _held, _handler, EventData("first"))
+        )
+        await asyncio.sleep(0)
+        with pytest.raises(ValueError):
+            await pool.drive(builder, 2, _held, _handler, EventData("second"))
+        release.set()
+        await first
+        # Sequential drives, as after a reconnect, are allowed
+        await pool.drive(builder, 3, _held, _handler, EventData("third"))
+
+    asyncio.run(asyncio.wait_for(_run(), 5))
+    assert pool.metrics.handled == 2
+
+
+def test_event_data_sinks(tmp_path):
+    """Ring buffer and callback sinks use constant memory, JSONL appends lines."""
+    ring = EventData("ring", RingBufferSink(3))
+    for index in range(10):
+        ring.add_entry(index, index * 2)
+    assert ring.collected == {7: 14, 8: 16, 9: 18}
+    seen = []
+    called = EventData("callback", CallbackSink(lambda i, d: seen.append((i, d))))
+    called.add_entry(0, "a")
+    assert seen == [(0, "a")] and called.collected == {}
+    assert EventData("default").collected == {}
+
+    jsonl = tmp_path / "events.jsonl"
+
+    async def _handler(event, _sub_id, counter):
+        return event.params.result if counter < 4 else False
+
+    result = _pooled(5, HandlerPool(), _handler, JsonlSink(str(jsonl)))
+    assert result.is_ok() and result.result_data.collected == {}
+    lines = [json.loads(x) for x in jsonl.read_text(encoding="utf8").splitlines()]
+    assert [x["index"] for x in lines] == [0, 1, 2, 3]
+    assert lines[0]["data"]["packageId"] == "0x2"
@@ -0,0 +1,167 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""Testing the local node stand-in (see tools/sui_standin.py)."""
+
+import base64
+import importlib.util
+import json
+import time
+import types
+from pathlib import Path
+
+import httpx
+from graphql import build_schema
+
+from pysui.sui.sui_pgql.pgql_clients import SuiGQLClient
+import pysui.sui.sui_pgql.pgql_query as qn
+from pysui.sui.sui_utils import transaction_digest
+from tests.test_utils import GQL_NODE_SDL, GQLNodeHandler, local_node
+
+_STANDIN = Path(__file__).parents[2] / "tools" / "sui_standin.py"
+
+_SDL = (
+    GQL_NODE_SDL
+    + """
+enum ExecutionStatus { SUCCESS FAILURE }
+scalar UInt53
+type TransactionBlock { digest: String }
+type TransactionBlockEffects {
+  status: ExecutionStatus
+  lamportVersion: UInt53!
+  transactionBlock: TransactionBlock
+}
+type ExecutionResult { errors: [String!] effects: TransactionBlockEffects! }
+type Mutation {
+  executeTransactionBlock(txBytes: String!, signatures: [String!]!): ExecutionResult!
+}
+"""
+)
+
+_TX_BYTES = base64.b64encode(bytes(range(200))).decode()
+
+_BATCH = [
+    {"jsonrpc": "2.0", "id": 2, "method": "sui_getObject", "params": ["0x5"]},
+    {"jsonrpc": "2.0", "id": 3, "method": "sui_getObject", "params": ["0x6"]},
+]
+
+
+class _Node(GQLNodeHandler):
+    """A GraphQL and JSON RPC node to record from."""
+
+    schema = build_schema(_SDL)
+
+    def answer(self, body):
+        if isinstance(body, list):
+            # Out of request order
+            return [self._jsonrpc(item) for item in reversed(body)]
+        if "query" in body:
+            return super().answer(body)
+        return self._jsonrpc(body)
+
+    @staticmethod
+    def _jsonrpc(request: dict) -> dict:
+        if request["method"] == "sui_getChainIdentifier":
+            return {"jsonrpc": "2.0", "id": request["id"], "result": "4c78adac"}
+        return {"jsonrpc": "2.0", "id": request["id"], "result": request["params"]}
+
+
+def _standin_module():
+    spec = importlib.util.spec_from_file_location("sui_standin", _STANDIN)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _rpc(url: str, method: str, params: list, rid: int = 1) -> httpx.Response:
+    return httpx.post(
+        url, json={"jsonrpc": "2.0", "id": rid, "method": method, "params": params}
+    )
+
+
+def _client(url: str) -> SuiGQLClient:
+    return SuiGQLClient(
+        pysui_config=types.SimpleNamespace(url=url, active_profile="localnet")
+    )
+
+
+def test_record_then_replay(tmp_path):
+    """Recorded traffic replays without the node, transactions are simulated."""
+    standin = _standin_module()
+    with local_node(_Node) as node_url, standin.StandInServer(
+        tmp_path, record_graphql=node_url, record_jsonrpc=node_url
+    ) as recorder:
+        _client(recorder.url)
+        reply = _rpc(recorder.url, "sui_getChainIdentifier", []).json()
+        assert reply["result"] == "4c78adac"
+        batch = httpx.post(recorder.url, json=_BATCH).json()
+        assert sorted(item["id"] for item in batch) == [2, 3]
+        assert recorder.stats["recorded"] == 5
+    assert json.loads((tmp_path / "schema.json").read_text())["headers"] == {
+        "x-sui-rpc-version": "2024.10.0-abc"
+    }
+
+    with standin.StandInServer(
+        tmp_path, tx_faults=standin.Faults(latency=0.2)
+    ) as replay:
+        client = _client(replay.url)
+        assert client.base_schema_version == "2024.10"
+        assert client.current_gas_price() == 750
+        assert client.protocol().transaction_constraints.protocol_version == 63
+
+        start = time.perf_counter()
+        result = client.execute_query_node(
+            with_node=qn.ExecuteTransaction(tx_bytestr=_TX_BYTES, sig_array=["c2ln"])
+        )
+        assert time.perf_counter() - start >= 0.2
+        assert result.is_ok()
+        assert result.result_data.status == "SUCCESS"
+        assert result.result_data.digest == transaction_digest(_TX_BYTES)
+
+        reply = _rpc(replay.url, "sui_getChainIdentifier", [], rid=7).json()
+        assert (reply["id"], reply["result"]) == (7, "4c78adac")
+        assert "error" in _rpc(replay.url, "sui_getChainIdentifier", [1]).json()
+        batch = httpx.post(replay.url, json=_BATCH).json()
+        assert [(item["id"], item["result"]) for item in batch] == [
+            (2, ["0x5"]),
+            (3, ["0x6"]),
+        ]
+        executed = _rpc(replay.url, "sui_executeTransactionBlock", [_TX_BYTES, []])
+        assert executed.json()["result"]["digest"] == transaction_digest(_TX_BYTES)
+        assert replay.stats["missed"] == 1
+        assert replay.stats["executed"] == 2
+
+
+def test_error_injection(tmp_path):
+    """Injected failures surface as failed transactions, errors or 503s."""
+    standin = _standin_module()
+    with standin.StandInServer(
+        tmp_path, tx_faults=standin.Faults(error_rate=1.0)
+    ) as failing:
+        result = _rpc(failing.url, "sui_dryRunTransactionBlock", [_TX_BYTES]).json()
+        assert result["result"]["effects"]["status"]["status"] == "failure"
+    with standin.StandInServer(
+        tmp_path,
+        tx_faults=standin.Faults(error_rate=0.5, error_kind="http"),
+        seed=1,
+    ) as flaky:
+        statuses = [
+            _rpc(flaky.url, "sui_executeTransactionBlock", [_TX_BYTES, []]).status_code
+            for _ in range(20)
+        ]
+        assert {200, 503} == set(statuses)
+        assert flaky.stats["injected"] == statuses.count(503)
+
+
+def test_malformed_requests(tmp_path):
+    """Bad queries and malformed bodies are answered, not dropped."""
+    standin = _standin_module()
+    with standin.StandInServer(tmp_path) as server:
+        reply = httpx.post(server.url, json={"query": "query {"})
+        assert reply.status_code == 400
+        assert "Syntax Error" in reply.json()["errors"][0]["message"]
+        assert httpx.post(server.url, json=[1]).status_code == 400
+        assert httpx.post(server.url, content=b"not json").status_code == 400
+        assert _rpc(server.url, "sui_getChainIdentifier", []).status_code == 200
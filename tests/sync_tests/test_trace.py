@@ -0,0 +1,84 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""Testing build tracing (no transactions)."""
+
+import logging
+
+import pytest
+
+from pysui.sui.sui_trace import TraceSubsystem, set_trace, trace_scope
+from pysui.sui.sui_txn.transaction_builder import (
+    ProgrammableTransactionBuilder,
+    PureInput,
+)
+from pysui.sui.sui_types import bcs
+
+
+class _Capture(logging.Handler):
+    """Collect emitted trace records."""
+
+    def __init__(self):
+        super().__init__(logging.DEBUG)
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord):
+        self.records.append(record)
+
+
+class _CountingAddress(bcs.Address):
+    """Address that counts json conversions."""
+
+    conversions = 0
+
+    def to_json(self, *args, **kwargs):
+        _CountingAddress.conversions += 1
+        return super().to_json(*args, **kwargs)
+
+
+@pytest.fixture
+def builder_trace_off():
+    """Disable builder tracing for a test, restoring the prior level after."""
+    builder_logger = logging.getLogger(TraceSubsystem.BUILDER.value)
+    prior = builder_logger.level
+    set_trace(TraceSubsystem.BUILDER, False)
+    yield
+    builder_logger.setLevel(prior)
+
+
+def test_trace_disabled_is_lazy(builder_trace_off):
+    """Disabled tracing must not format arguments."""
+    addy = _CountingAddress.from_str("0x2")
+    PureInput.pure(addy)
+    assert _CountingAddress.conversions == 0
+
+
+def test_trace_scope():
+    """Scoped tracing emits structured records and restores level."""
+    handler = _Capture()
+    builder_logger = logging.getLogger(TraceSubsystem.BUILDER.value)
+    prior = builder_logger.level
+    with trace_scope(TraceSubsystem.BUILDER, handler=handler):
+        txb = ProgrammableTransactionBuilder()
+        txb.input_pure(PureInput.as_input(bcs.Address.from_str("0x2")))
+    events = [x.trace_event for x in handler.records]
+    assert "pure" in events
+    assert "input" in events
+    assert builder_logger.level == prior
+    assert handler not in builder_logger.handlers
+
+
+def test_trace_scope_keeps_installed_handler():
+    """A handler attached before the scope stays attached after it."""
+    handler = _Capture()
+    builder_logger = logging.getLogger(TraceSubsystem.BUILDER.value)
+    builder_logger.addHandler(handler)
+    try:
+        with trace_scope(TraceSubsystem.BUILDER, TraceSubsystem.GAS, handler=handler):
+            pass
+        assert handler in builder_logger.handlers
+        assert handler not in logging.getLogger(TraceSubsystem.GAS.value).handlers
+    finally:
+        builder_logger.removeHandler(handler)
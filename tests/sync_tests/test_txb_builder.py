@@ -0,0 +1,131 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""Testing ProgrammableTransactionBuilder (no transactions)."""
+
+import base64
+import base58
+
+from pysui.sui.sui_txn.transaction_builder import (
+    ProgrammableTransactionBuilder,
+    PureInput,
+)
+from pysui.sui.sui_types import bcs
+from pysui.sui.sui_utils import transaction_digest
+from tests.test_utils import OBJECT_DIGEST, owned_object_arg
+
+
+def test_compress_inputs():
+    """Identical pure and object inputs are reused when compressing."""
+    txb = ProgrammableTransactionBuilder(compress_inputs=True)
+    first = txb.input_pure(PureInput.as_input(100))
+    assert txb.input_pure(PureInput.as_input(100)).value == first.value
+    assert txb.input_pure(PureInput.as_input(101)).value == 1
+    oarg = txb.input_obj_from_objarg(owned_object_arg("0x10"))
+    assert oarg.value == 2
+    assert txb.input_obj_from_objarg(owned_object_arg("0x10")).value == 2
+    assert txb.input_obj_from_objarg(owned_object_arg("0x10", 2)).value == 3
+    assert len(txb.inputs) == 4
+
+
+def test_no_compress_inputs():
+    """Identical inputs are distinct when not compressing."""
+    txb = ProgrammableTransactionBuilder()
+    txb.input_pure(PureInput.as_input(100))
+    assert txb.input_pure(PureInput.as_input(100)).value == 1
+    txb.input_obj_from_objarg(owned_object_arg("0x10"))
+    assert txb.input_obj_from_objarg(owned_object_arg("0x10")).value == 3
+
+
+def test_compress_after_inputs_replaced():
+    """Replacing inputs rebuilds the duplicate index."""
+    txb = ProgrammableTransactionBuilder(compress_inputs=True)
+    txb.input_pure(PureInput.as_input(5))
+    barg = PureInput.as_input(7)
+    txb.inputs = {barg: bcs.CallArg("Pure", barg.value)}
+    assert txb.input_pure(PureInput.as_input(7)).value == 0
+    assert txb.input_pure(PureInput.as_input(5)).value == 1
+
+
+def test_incremental_serialization():
+    """Segment serialization matches full BCS serialization."""
+    txb = ProgrammableTransactionBuilder(compress_inputs=True)
+    coins = txb.split_coin(
+        owned_object_arg("0x10"), [PureInput.as_input(5), PureInput.as_input(6)]
+    )
+    txb.transfer_objects(PureInput.as_input(bcs.Address.from_str("0x1")), coins)
+    txb.move_call(
+        target=bcs.Address.from_str("0x2"),
+        arguments=[owned_object_arg("0x10"), PureInput.as_input(list(range(200)))],
+        type_arguments=[],
+        module="pay",
+        function="noop",
+    )
+    kind = txb.finish_for_inspect()
+    assert txb.kind_bytes() == kind.serialize()
+    assert txb.kind_size() == len(kind.serialize())
+    sender = bcs.Address.from_str("0x3")
+    gas = bcs.GasData(
+        [bcs.ObjectReference(sender, 1, bcs.Digest.from_str(OBJECT_DIGEST))],
+        sender,
+        1000,
+        5000000,
+    )
+    txdata = bcs.TransactionData(
+        "V1",
+        bcs.TransactionDataV1(kind, sender, gas, bcs.TransactionExpiration("None")),
+    )
+    assert txb.transaction_data_bytes(sender=sender, gas_data=gas) == txdata.serialize()
+    assert txb.transaction_data_size() == len(txdata.serialize())
+    # Replaced commands are re-serialized on demand
+    txb.commands = txb.commands[:1]
+    assert txb.kind_bytes() == txb.finish_for_inspect().serialize()
+
+
+def test_transaction_digest():
+    """Local digest is base58 of 32 bytes, same for bytes and base64 forms."""
+    txb = ProgrammableTransactionBuilder()
+    txb.transfer_objects(
+        PureInput.as_input(bcs.Address.from_str("0x1")), [owned_object_arg("0x10")]
+    )
+    sender = bcs.Address.from_str("0x3")
+    gas = bcs.GasData(
+        [bcs.ObjectReference(sender, 1, bcs.Digest.from_str(OBJECT_DIGEST))],
+        sender,
+        1000,
+        5000000,
+    )
+    txdata = bcs.TransactionData(
+        "V1",
+        bcs.TransactionDataV1(
+            txb.finish_for_inspect(), sender, gas, bcs.TransactionExpiration("None")
+        ),
+    )
+    tx_bytes = txdata.serialize()
+    digest = transaction_digest(tx_bytes)
+    assert len(base58.b58decode(digest)) == 32
+    assert digest == transaction_digest(base64.b64encode(tx_bytes).decode())
+    assert digest == txdata.digest()
+    assert base64.b64encode(tx_bytes).decode() == _DIGEST_VECTOR[0]
+
+
+# The TransactionData built in test_transaction_digest and its digest, Blake2b-256
+# of the "TransactionData::" type name salt followed by the BCS bytes (the Sui
+# Signable encoding)
+_DIGEST_VECTOR: tuple[str, str] = (
+    "AAACACAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAQEAAAAAAAAAAAAAAAAAAAAAAAAAAAAA"
+    "AAAAAAAAAAAAABABAAAAAAAAACCjKRDiO3SaZ4ja8pEJlVZa5GYT1egJZXjSyrpxMK0n+wEBAQEBAAEA"
+    "AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA"
+    "AAAAAAADAQAAAAAAAAAgoykQ4jt0mmeI2vKRCZVWWuRmE9XoCWV40sq6cTCtJ/sAAAAAAAAAAAAAAAAA"
+    "AAAAAAAAAAAAAAAAAAAAAAAAA+gDAAAAAAAAQEtMAAAAAAAA",
+    "ENTcVThrTRFrp6FLg1NoVjEKid3SB68zdy8B8uvg4H4g",
+)
+
+
+def test_transaction_digest_vector():
+    """Known TransactionData bytes give their known digest."""
+    tx_bytes, expected = _DIGEST_VECTOR
+    assert transaction_digest(tx_bytes) == expected
+    assert transaction_digest(base64.b64decode(tx_bytes)) == expected
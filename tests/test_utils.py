@@ -13,6 +13,14 @@
 
 """Simplify routines for test usage."""
 
+import contextlib
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Iterator
+
+from graphql import build_schema, graphql_sync
+
 from pysui.abstracts.client_keypair import KeyPair, SignatureScheme
 from pysui.sui.sui_config import SuiConfig
 from pysui.sui.sui_crypto import MultiSig
@@ -20,9 +28,11 @@ from pysui.sui.sui_txn import sync_transaction
 from pysui.sui.sui_txresults.complex_tx import TxResponse
 from pysui.sui.sui_txresults.single_tx import SuiCoinObject
 from pysui.sui.sui_types.address import SuiAddress
+from pysui.sui.sui_types import bcs
 from pysui.sui.sui_clients.sync_client import SuiClient
 
 STANDARD_BUDGET: str = "5500000"
+OBJECT_DIGEST: str = "ByumsdYUAQWJfwYgowsme7hm5vE8d2mXik3rGaNC9R4W"
 
 
 def first_addy_keypair_for(
@@ -107,3 +117,122 @@ def publish_and_result(txb: sync_transaction) -> tuple[str, str]:
     else:
         raise ValueError(f"Error encoundered {tx_result.result_string}")
     return (package_id, upgrade_cap_id)
+
+
+def owned_object_arg(addy: str, version: int = 1) -> bcs.ObjectArg:
+    """Owned object argument for builder tests."""
+    return bcs.ObjectArg(
+        "ImmOrOwnedObject",
+        bcs.ObjectReference(
+            bcs.Address.from_str(addy), version, bcs.Digest.from_str(OBJECT_DIGEST)
+        ),
+    )
+
+
+# A local GraphQL node answering the client startup queries
+GQL_NODE_SDL: str = """
+type Epoch { referenceGasPrice: String }
+type Checkpoint { sequenceNumber: Int! timestamp: String! epoch: Epoch }
+type CheckpointConnection { nodes: [Checkpoint!]! }
+type ServiceConfig {
+  enabledFeatures: [String!]!
+  maxQueryDepth: Int!
+  maxQueryNodes: Int!
+  maxOutputNodes: Int!
+  maxDbQueryCost: Int!
+  defaultPageSize: Int!
+  maxPageSize: Int!
+  mutationTimeoutMs: Int
+  requestTimeoutMs: Int!
+  maxQueryPayloadSize: Int!
+  maxTypeArgumentDepth: Int!
+  maxTypeNodes: Int!
+  maxMoveValueDepth: Int!
+  maxTransactionPayloadSize: Int
+  maxTransactionIds: Int
+  maxScanLimit: Int
+}
+type KeyValue { key: String! value: String }
+type FeatureFlag { key: String! value: Boolean! }
+type ProtocolConfigs {
+  protocolVersion: Int!
+  configs: [KeyValue!]!
+  featureFlags: [FeatureFlag!]!
+}
+type Query {
+  chainIdentifier: String!
+  checkpoints(last: Int): CheckpointConnection!
+  serviceConfig: ServiceConfig!
+  protocolConfig: ProtocolConfigs!
+}
+"""
+
+GQL_NODE_ROOT: dict = {
+    "chainIdentifier": "4c78adac",
+    "checkpoints": {
+        "nodes": [
+            {
+                "sequenceNumber": 9,
+                "timestamp": "t",
+                "epoch": {"referenceGasPrice": "750"},
+            }
+        ]
+    },
+    "serviceConfig": {
+        "enabledFeatures": ["coins"],
+        "maxQueryDepth": 20,
+        "maxQueryNodes": 300,
+        "maxOutputNodes": 100000,
+        "maxDbQueryCost": 20000,
+        "defaultPageSize": 20,
+        "maxPageSize": 50,
+        "mutationTimeoutMs": 74000,
+        "requestTimeoutMs": 40000,
+        "maxQueryPayloadSize": 5000,
+        "maxTypeArgumentDepth": 16,
+        "maxTypeNodes": 256,
+        "maxMoveValueDepth": 128,
+    },
+    "protocolConfig": {
+        "protocolVersion": 63,
+        "configs": [{"key": "max_pure_argument_size", "value": "16384"}],
+        "featureFlags": [{"key": "receive_objects", "value": True}],
+    },
+}
+
+
+class GQLNodeHandler(BaseHTTPRequestHandler):
+    """Answers JSON posts, GraphQL queries execute on schema with root."""
+
+    schema = build_schema(GQL_NODE_SDL)
+    root: dict = GQL_NODE_ROOT
+
+    def answer(self, body: Any) -> Any:
+        """Return the response body for a request body."""
+        result = graphql_sync(self.schema, body["query"], root_value=self.root)
+        return {"data": result.data}
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        payload = json.dumps(self.answer(body)).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.send_header("x-sui-rpc-version", "2024.10.0-abc")
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@contextlib.contextmanager
+def local_node(handler: type[BaseHTTPRequestHandler]) -> Iterator[str]:
+    """Serve handler on a free local port for the context, yields the url."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
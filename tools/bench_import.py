@@ -0,0 +1,99 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""Import time benchmark.
+
+Imports each target in fresh interpreters with `-X importtime` and reports the
+cumulative import time of the target and the heavy third party packages it
+loaded, e.g.:
+
+    python tools/bench_import.py
+    python tools/bench_import.py -r 20 --json pysui pysui.sui.sui_types.bcs
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+DEFAULT_TARGETS: list[str] = [
+    "pysui",
+    "pysui.sui.sui_types.address",
+    "pysui.sui.sui_types.bcs",
+    "pysui.sui.sui_pgql.pgql_clients",
+]
+
+HEAVY_PACKAGES: list[str] = [
+    "httpx",
+    "h2",
+    "websockets",
+    "gql",
+    "graphql",
+    "dataclasses_json",
+    "canoser",
+    "yaml",
+    "pysui_fastcrypto",
+]
+
+
+def import_profile(target: str) -> tuple[int, list[str]]:
+    """Import target in a fresh interpreter.
+
+    :param target: Module to import
+    :type target: str
+    :return: Cumulative import microseconds and the heavy packages loaded
+    :rtype: tuple[int, list[str]]
+    """
+    result = subprocess.run(
+        [sys.executable, "-W", "ignore", "-X", "importtime", "-c", f"import {target}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    cumulative = 0
+    loaded: set[str] = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumul, name = line.split("|")
+        name = name.strip()
+        if name in HEAVY_PACKAGES:
+            loaded.add(name)
+        if name == target:
+            cumulative = int(cumul)
+    return cumulative, sorted(loaded)
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="pysui import time benchmark")
+    parser.add_argument("targets", nargs="*", default=DEFAULT_TARGETS)
+    parser.add_argument("-r", "--repeat", type=int, default=10)
+    parser.add_argument("--json", action="store_true", help="Emit JSON results")
+    args = parser.parse_args()
+    results: dict[str, dict] = {}
+    for target in args.targets:
+        runs = []
+        for _ in range(args.repeat):
+            micros, loaded = import_profile(target)
+            runs.append(micros)
+        results[target] = {
+            "min_ms": min(runs) / 1000,
+            "median_ms": statistics.median(runs) / 1000,
+            "heavy_packages": loaded,
+        }
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    for target, res in results.items():
+        print(
+            f"{target:40} min {res['min_ms']:8.1f}ms  median {res['median_ms']:8.1f}ms"
+            f"  loads {', '.join(res['heavy_packages']) or '-'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,359 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""Hot path microbenchmarks.
+
+Runs the serialization, transaction building, argument resolution, type parsing
+and GraphQL result decoding hot paths against synthetic fixtures (see
+tools/bench_fixtures), no network is used. The fixtures are hand built in the
+shape of GraphQL query results, they are not recorded from a node. Each run can
+be appended as one JSON line to a results file and a later run compared with
+its last line. Timings only compare on the same machine, so record the baseline
+where the comparison runs (the results file is not kept in the tree), e.g.
+before and after a change:
+
+    python tools/bench_micro.py
+    python tools/bench_micro.py -k pure --repeat 10
+    python tools/bench_micro.py --record tools/bench_results.jsonl
+    python tools/bench_micro.py --compare tools/bench_results.jsonl --threshold 15
+
+Comparison exits with status 1 when any case's minimum is slower than the
+baseline's by more than the threshold percent.
+"""
+
+import argparse
+import copy
+import datetime
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import timeit
+from pathlib import Path
+from typing import Any, Callable, NamedTuple, Optional
+
+PROJECT_DIR: Path = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_DIR))
+
+FIXTURES: Path = Path(__file__).parent / "bench_fixtures"
+
+_OWNER: str = "0x" + "a1" * 32
+_PACKAGE: str = "0x" + "0" * 62 + "ee"
+
+
+class Case(NamedTuple):
+    """A benchmark case.
+
+    setup builds the case once and returns (prepare, run), prepare builds the
+    fresh input one run call consumes (None when run takes no input).
+    """
+
+    name: str
+    setup: Callable[[], tuple[Optional[Callable[[], Any]], Callable[..., Any]]]
+
+
+def _fixture(name: str) -> dict:
+    """Load a synthetic fixture."""
+    return json.loads((FIXTURES / f"{name}.json").read_text(encoding="utf8"))
+
+
+def _object_args() -> list:
+    """Owned coin and shared object args from the synthetic objects fixture."""
+    from pysui.sui.sui_pgql import pgql_txn_argb as argb
+    import pysui.sui.sui_pgql.pgql_types as pgql_type
+
+    objects = pgql_type.ObjectReadsGQL.from_query(_fixture("objects")).data
+    summary = pgql_type.MoveFunctionGQL.from_query(
+        _fixture("move_function")
+    ).arg_summary()
+    args = argb.build_args(
+        None, [objects[1], objects[0], 1, 1, _OWNER, b"\x01", [1], "a"], summary
+    )
+    return args[:2]
+
+
+def _ptb(builder):
+    """Build a representative split, move call and transfer transaction."""
+    from pysui.sui.sui_types import bcs
+    from pysui.sui.sui_txn.transaction_builder import PureInput
+
+    shared, coin = _object_args()
+    amounts = [PureInput.as_input(amount) for amount in range(1000, 1010)]
+    recipient = PureInput.as_input(bcs.Address.from_str(_OWNER))
+    target = bcs.Address.from_str(_PACKAGE)
+    coin_type = bcs.TypeTag.type_tag_from("0x2::sui::SUI")
+
+    def build():
+        ptb = builder()
+        splits = ptb.split_coin(coin, amounts)
+        for index, split in enumerate(splits):
+            ptb.move_call(
+                target=target,
+                arguments=[
+                    shared,
+                    split,
+                    PureInput.as_input(index),
+                    PureInput.as_input(True),
+                ],
+                type_arguments=[coin_type],
+                module="pool",
+                function="deposit",
+            )
+        ptb.transfer_objects(recipient, [coin])
+        return ptb
+
+    return build
+
+
+def _bcs_serialize():
+    from pysui.sui.sui_txn.transaction_builder import ProgrammableTransactionBuilder
+    from pysui.sui.sui_types import bcs
+
+    ptb = _ptb(ProgrammableTransactionBuilder)()
+    payment = [
+        bcs.ObjectReference(
+            bcs.Address.from_str(_OWNER), 100 + index, bcs.Digest(list(bytes(32)))
+        )
+        for index in range(10)
+    ]
+    txdata = bcs.TransactionData(
+        "V1",
+        bcs.TransactionDataV1(
+            ptb.finish_for_inspect(),
+            bcs.Address.from_str(_OWNER),
+            bcs.GasData(payment, bcs.Address.from_str(_OWNER), 750, 50_000_000),
+            bcs.TransactionExpiration("None"),
+        ),
+    )
+    return None, txdata.serialize
+
+
+def _ptb_build():
+    from pysui.sui.sui_txn.transaction_builder import ProgrammableTransactionBuilder
+
+    build = _ptb(ProgrammableTransactionBuilder)
+    return None, lambda: build().finish_for_inspect()
+
+
+def _build_args():
+    from pysui.sui.sui_pgql import pgql_txn_argb as argb
+    import pysui.sui.sui_pgql.pgql_types as pgql_type
+
+    objects = pgql_type.ObjectReadsGQL.from_query(_fixture("objects")).data
+    summary = pgql_type.MoveFunctionGQL.from_query(
+        _fixture("move_function")
+    ).arg_summary()
+    args = [
+        objects[1],
+        objects[0],
+        1000,
+        2**100,
+        _OWNER,
+        b"\x01" * 256,
+        list(range(64)),
+        "a string argument",
+    ]
+    return None, lambda: argb.build_args(None, args, summary)
+
+
+def _type_tag_from():
+    from pysui.sui.sui_types import bcs
+
+    types = [
+        "u64",
+        "vector<u8>",
+        "0x2::sui::SUI",
+        "0x2::coin::Coin<0x2::sui::SUI>",
+        "vector<0x2::coin::Coin<0x2::sui::SUI>>",
+        "0x2::table::Table<0x2::object::ID,0x2::coin::Coin<0x2::sui::SUI>>",
+        f"{_PACKAGE}::pool::Pool<0x2::sui::SUI,{_PACKAGE}::usdc::USDC>",
+    ]
+    return None, lambda: [bcs.TypeTag.type_tag_from(vtype) for vtype in types]
+
+
+def _pure(values: list) -> Callable[[], tuple[None, Callable[[], Any]]]:
+    def setup():
+        from pysui.sui.sui_txn.transaction_builder import PureInput
+
+        return None, lambda: PureInput.pure(values)
+
+    return setup
+
+
+def _pure_addresses():
+    from pysui.sui.sui_types import bcs
+
+    return _pure([bcs.Address.from_str(_OWNER) for _ in range(1000)])()
+
+
+def _decoder(fixture: str, decode: str):
+    def setup():
+        import pysui.sui.sui_pgql.pgql_types as pgql_type
+
+        fixture_data = _fixture(fixture)
+        # from_query consumes its input
+        return (
+            lambda: copy.deepcopy(fixture_data),
+            getattr(pgql_type, decode).from_query,
+        )
+
+    return setup
+
+
+CASES: list[Case] = [
+    Case("bcs.TransactionData.serialize", _bcs_serialize),
+    Case("ptb.build_finish", _ptb_build),
+    Case("pgql_txn_argb.build_args", _build_args),
+    Case("bcs.TypeTag.type_tag_from", _type_tag_from),
+    Case("PureInput.pure[u64*10000]", _pure(list(range(10_000)))),
+    Case("PureInput.pure[bytes*100000]", lambda: _pure(bytes(100_000))()),
+    Case("PureInput.pure[str*1000]", _pure(["pysui"] * 1000)),
+    Case("PureInput.pure[address*1000]", _pure_addresses),
+    Case("ObjectReadsGQL.from_query[50]", _decoder("objects", "ObjectReadsGQL")),
+    Case("EventsGQL.from_query[50]", _decoder("events", "EventsGQL")),
+]
+
+
+def _time(case: Case, repeat: int, min_time: float) -> dict:
+    """Time a case, returns per call microsecond statistics."""
+    prepare, run = case.setup()
+    start = timeit.default_timer()
+    if prepare is None:
+        run()
+    else:
+        run(prepare())
+    number = max(1, int(min_time / max(timeit.default_timer() - start, 1e-7)))
+    samples = []
+    for _ in range(repeat):
+        if prepare is None:
+            samples.append(timeit.timeit(run, number=number) / number)
+            continue
+        # Inputs are prepared outside of the timed region
+        inputs = [prepare() for _ in range(number)]
+        start = timeit.default_timer()
+        for item in inputs:
+            run(item)
+        samples.append((timeit.default_timer() - start) / number)
+    return {
+        "min_us": round(min(samples) * 1e6, 3),
+        "median_us": round(statistics.median(samples) * 1e6, 3),
+        "loops": number,
+        "repeat": repeat,
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=PROJECT_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_cases(
+    selector: Optional[str] = None, *, repeat: int = 5, min_time: float = 0.2
+) -> dict:
+    """Run the (selected) cases.
+
+    :param selector: Substring a case name must contain, defaults to None (all)
+    :type selector: Optional[str], optional
+    :param repeat: Timing samples per case, defaults to 5
+    :type repeat: int, optional
+    :param min_time: Approximate seconds per sample, defaults to 0.2
+    :type min_time: float, optional
+    :return: A results record
+    :rtype: dict
+    """
+    from pysui.version import __version__
+
+    return {
+        "pysui": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(
+            timespec="seconds"
+        ),
+        "commit": _git_commit(),
+        "results": {
+            case.name: _time(case, repeat, min_time)
+            for case in CASES
+            if not selector or selector in case.name
+        },
+    }
+
+
+def compare(record: dict, baseline: dict, threshold: float) -> list[str]:
+    """Return the cases of record slower than baseline by over threshold percent.
+
+    :param record: The current results record
+    :type record: dict
+    :param baseline: The baseline results record
+    :type baseline: dict
+    :param threshold: Allowed slow down in percent
+    :type threshold: float
+    :return: The regressed case names
+    :rtype: list[str]
+    """
+    regressed = []
+    for name, result in record["results"].items():
+        base = baseline["results"].get(name)
+        if base and result["min_us"] > base["min_us"] * (1 + threshold / 100):
+            regressed.append(name)
+    return regressed
+
+
+def main():
+    """Run the benchmarks."""
+    parser = argparse.ArgumentParser(description="pysui hot path microbenchmarks")
+    parser.add_argument("-k", dest="selector", help="Run cases containing this")
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.2)
+    parser.add_argument("--json", action="store_true", help="Emit the JSON record")
+    parser.add_argument("--record", type=Path, help="Append the record to a file")
+    parser.add_argument(
+        "--compare", type=Path, help="Compare with the last record in a file"
+    )
+    parser.add_argument("--threshold", type=float, default=10.0)
+    args = parser.parse_args()
+
+    baseline = None
+    if args.compare:
+        lines = args.compare.read_text(encoding="utf8").splitlines()
+        baseline = json.loads([line for line in lines if line.strip()][-1])
+    record = run_cases(args.selector, repeat=args.repeat, min_time=args.min_time)
+    if args.record:
+        with args.record.open("a", encoding="utf8") as results:
+            results.write(json.dumps(record) + "\n")
+    if args.json:
+        print(json.dumps(record, indent=2))
+    else:
+        for name, res in record["results"].items():
+            delta = ""
+            if baseline and name in baseline["results"]:
+                base = baseline["results"][name]["min_us"]
+                delta = f"  {(res['min_us'] - base) / base * 100:+6.1f}%"
+            print(
+                f"{name:36} min {res['min_us']:12.2f}us"
+                f"  median {res['median_us']:12.2f}us{delta}"
+            )
+    if baseline:
+        regressed = compare(record, baseline, args.threshold)
+        if regressed:
+            print(
+                f"Regressed over {args.threshold}% against {baseline.get('pysui')}"
+                f" ({baseline.get('commit')}): {', '.join(regressed)}",
+                file=sys.stderr,
+            )
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
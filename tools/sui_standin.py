@@ -0,0 +1,588 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""Local stand-in for a Sui GraphQL and JSON RPC node.
+
+Serves clients from recorded fixtures so transaction pipelines can be load
+tested without a fullnode:
+
+- GraphQL introspection is answered from the recorded schema and every GraphQL
+  response carries the recorded `x-sui-rpc-version` header
+- Other GraphQL queries and JSON RPC calls replay the last recorded response of
+  the identical request
+- GraphQL `executeTransactionBlock` and `dryRunTransactionBlock` and JSON RPC
+  `sui_executeTransactionBlock` and `sui_dryRunTransactionBlock` are simulated,
+  the transaction digest is computed from the transaction bytes
+- Configurable latency, jitter and error injection for transactions and queries
+- Recorder mode proxies GraphQL and/or JSON RPC requests to a real node and
+  captures the schema and responses into the fixtures directory
+
+A fixtures directory holds `schema.json` (the introspection result and headers)
+and `responses.jsonl` (one recorded request and response per line), e.g.:
+
+    python tools/sui_standin.py fixtures --record-graphql https://sui-testnet.mystenlabs.com/graphql
+    python tools/sui_standin.py fixtures --port 9000 --latency 0.05 --error-rate 0.01
+
+Point the client at the stand-in url, GraphQL and JSON RPC share it.
+"""
+
+import argparse
+import collections
+import copy
+import dataclasses
+import hashlib
+import itertools
+import json
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Optional, Union
+
+import httpx
+from graphql import (
+    FieldNode,
+    GraphQLSyntaxError,
+    OperationDefinitionNode,
+    build_client_schema,
+    graphql_sync,
+    parse,
+    print_ast,
+)
+
+PROJECT_DIR: Path = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_DIR))
+
+from pysui.sui.sui_utils import transaction_digest
+
+SCHEMA_FILE: str = "schema.json"
+RESPONSES_FILE: str = "responses.jsonl"
+RPC_VERSION_HEADER: str = "x-sui-rpc-version"
+
+_GQL_EXECUTE: str = "executeTransactionBlock"
+_GQL_DRY_RUN: str = "dryRunTransactionBlock"
+_RPC_EXECUTE: str = "sui_executeTransactionBlock"
+_RPC_DRY_RUN: str = "sui_dryRunTransactionBlock"
+
+_ERROR_KINDS: tuple[str, ...] = ("failure", "error", "http")
+_INJECTED: str = "Injected error"
+
+
+@dataclasses.dataclass
+class Faults:
+    """Latency and error injection for a class of requests.
+
+    error_kind is one of:
+
+    - failure: The transaction fails (effects status FAILURE or the dry run error),
+      queries answer as for error
+    - error: A GraphQL errors or JSON RPC error response
+    - http: A 503 HTTP response
+    """
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    error_kind: str = "failure"
+
+    def __post_init__(self):
+        """Validate the error kind."""
+        if self.error_kind not in _ERROR_KINDS:
+            raise ValueError(f"error_kind must be one of {_ERROR_KINDS}")
+
+
+def _graphql_key(query: str, variables: Optional[dict]) -> str:
+    """Key a GraphQL request by its normalized document and variables."""
+    return hashlib.sha256(
+        (print_ast(parse(query)) + json.dumps(variables or {}, sort_keys=True)).encode()
+    ).hexdigest()
+
+
+def _jsonrpc_key(method: str, params: Optional[list]) -> str:
+    """Key a JSON RPC request by its method and parameters."""
+    return hashlib.sha256(
+        (method + json.dumps(params or [], sort_keys=True)).encode()
+    ).hexdigest()
+
+
+def _root_fields(query: str) -> list[str]:
+    """The names of the fields at the root of the document's operations."""
+    return [
+        selection.name.value
+        for definition in parse(query).definitions
+        if isinstance(definition, OperationDefinitionNode)
+        for selection in definition.selection_set.selections
+        if isinstance(selection, FieldNode)
+    ]
+
+
+class _Reply:
+    """A response to send."""
+
+    def __init__(
+        self, body: Any, status: int = 200, headers: Optional[dict] = None
+    ) -> None:
+        self.body = body
+        self.status = status
+        self.headers = headers or {}
+
+
+class StandInServer:
+    """Threaded stand-in server.
+
+    Usable as a context manager, the server runs on a background thread between
+    `start` and `stop`.
+    """
+
+    def __init__(
+        self,
+        fixtures: Union[str, Path],
+        *,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        tx_faults: Optional[Faults] = None,
+        query_faults: Optional[Faults] = None,
+        record_graphql: Optional[str] = None,
+        record_jsonrpc: Optional[str] = None,
+        seed: Optional[int] = None,
+    ) -> None:
+        """Stand-in server initializer.
+
+        :param fixtures: The fixtures directory, created when recording
+        :type fixtures: Union[str, Path]
+        :param host: Bind address, defaults to "127.0.0.1"
+        :type host: str, optional
+        :param port: Bind port, defaults to 0 (any free port)
+        :type port: int, optional
+        :param tx_faults: Execute and dry run faults, defaults to None (none)
+        :type tx_faults: Optional[Faults], optional
+        :param query_faults: Replayed query faults, defaults to None (none)
+        :type query_faults: Optional[Faults], optional
+        :param record_graphql: Record GraphQL traffic proxied to this url,
+            defaults to None (replay)
+        :type record_graphql: Optional[str], optional
+        :param record_jsonrpc: Record JSON RPC traffic proxied to this url,
+            defaults to None (replay)
+        :type record_jsonrpc: Optional[str], optional
+        :param seed: Error injection random seed, defaults to None
+        :type seed: Optional[int], optional
+        """
+        self.fixtures = Path(fixtures)
+        self.tx_faults = tx_faults or Faults()
+        self.query_faults = query_faults or Faults()
+        self.record_graphql = record_graphql
+        self.record_jsonrpc = record_jsonrpc
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._stats: collections.Counter = collections.Counter()
+        self._lamport = itertools.count(1)
+        self._headers: dict[str, str] = {}
+        self._schema = None
+        self._responses: dict[str, dict] = {}
+        self._templates: dict[str, dict] = {}
+        if record_graphql or record_jsonrpc:
+            self.fixtures.mkdir(parents=True, exist_ok=True)
+            self._upstream = httpx.Client(timeout=60.0)
+        self._load()
+        self._server = ThreadingHTTPServer((host, port), _Handler)
+        self._server.daemon_threads = True
+        self._server.standin = self
+        self._thread: Optional[threading.Thread] = None
+
+    def _load(self) -> None:
+        """Load the recorded schema and responses."""
+        schema_path = self.fixtures / SCHEMA_FILE
+        if schema_path.exists():
+            recorded = json.loads(schema_path.read_text(encoding="utf8"))
+            self._headers = recorded.get("headers", {})
+            self._schema = build_client_schema(recorded["introspection"])
+        responses_path = self.fixtures / RESPONSES_FILE
+        if responses_path.exists():
+            for line in responses_path.read_text(encoding="utf8").splitlines():
+                if line.strip():
+                    self._add_recording(json.loads(line))
+
+    def _add_recording(self, recording: dict) -> None:
+        """Index a recording, the last of an identical request wins."""
+        self._responses[recording["key"]] = recording["response"]
+        operation = recording.get("method") or next(
+            iter(recording.get("fields") or []), None
+        )
+        if operation in (_GQL_DRY_RUN, _RPC_EXECUTE, _RPC_DRY_RUN):
+            self._templates[operation] = recording["response"]
+
+    @property
+    def url(self) -> str:
+        """Return the stand-in's url."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Return request counts by outcome."""
+        with self._lock:
+            return dict(self._stats)
+
+    def start(self) -> "StandInServer":
+        """Serve on a background thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and release the socket."""
+        self._server.shutdown()
+        self._server.server_close()
+        if self.record_graphql or self.record_jsonrpc:
+            self._upstream.close()
+
+    def __enter__(self) -> "StandInServer":
+        return self.start()
+
+    def __exit__(self, *_args) -> None:
+        self.stop()
+
+    def _count(self, *outcomes: str) -> None:
+        with self._lock:
+            self._stats.update(outcomes)
+
+    def _inject(self, faults: Faults) -> Optional[str]:
+        """Sleep for the faults latency, return the error kind if one is injected."""
+        with self._lock:
+            delay = faults.latency + self._random.uniform(0, faults.jitter)
+            fail = self._random.random() < faults.error_rate
+        if delay:
+            time.sleep(delay)
+        if fail:
+            self._count("injected")
+            return faults.error_kind
+        return None
+
+    # Recording
+
+    def _record(self, recording: dict) -> None:
+        """Append a recording to the fixtures."""
+        with self._lock:
+            with (self.fixtures / RESPONSES_FILE).open("a", encoding="utf8") as out:
+                out.write(json.dumps(recording) + "\n")
+            self._add_recording(recording)
+            self._stats["recorded"] += 1
+
+    def _proxy(self, url: str, raw: bytes, headers: dict) -> httpx.Response:
+        """Forward a request upstream, raises ValueError on non JSON replies."""
+        response = self._upstream.post(
+            url,
+            content=raw,
+            headers={
+                key: value
+                for key, value in headers.items()
+                if key.lower() not in ("host", "content-length", "connection")
+            },
+        )
+        if "json" not in response.headers.get("content-type", ""):
+            raise ValueError(f"Upstream replied {response.status_code}")
+        return response
+
+    def _record_graphql(self, request: dict, raw: bytes, headers: dict) -> _Reply:
+        response = self._proxy(self.record_graphql, raw, headers)
+        reply_headers = {}
+        if RPC_VERSION_HEADER in response.headers:
+            reply_headers[RPC_VERSION_HEADER] = response.headers[RPC_VERSION_HEADER]
+            self._headers = reply_headers
+        body = response.json()
+        if response.status_code == 200 and not body.get("errors"):
+            fields = _root_fields(request["query"])
+            if fields and all(field.startswith("__") for field in fields):
+                (self.fixtures / SCHEMA_FILE).write_text(
+                    json.dumps(
+                        {"headers": self._headers, "introspection": body["data"]}
+                    ),
+                    encoding="utf8",
+                )
+                self._schema = build_client_schema(body["data"])
+            else:
+                self._record(
+                    {
+                        "kind": "graphql",
+                        "key": _graphql_key(request["query"], request.get("variables")),
+                        "fields": fields,
+                        "query": request["query"],
+                        "variables": request.get("variables"),
+                        "response": body,
+                    }
+                )
+        return _Reply(body, response.status_code, reply_headers)
+
+    def _record_jsonrpc(self, request: Any, raw: bytes, headers: dict) -> _Reply:
+        """Proxy a JSON RPC request or batch once, recording each result."""
+        response = self._proxy(self.record_jsonrpc, raw, headers)
+        body = response.json()
+        if response.status_code == 200:
+            if isinstance(request, list) and isinstance(body, list):
+                # Batch responses may be in any order
+                by_id = {item.get("id"): item for item in body}
+                pairs = [(item, by_id.get(item.get("id"))) for item in request]
+            else:
+                pairs = [(request, body)]
+            for item, result in pairs:
+                if isinstance(result, dict) and "error" not in result:
+                    self._record(
+                        {
+                            "kind": "jsonrpc",
+                            "key": _jsonrpc_key(item["method"], item.get("params")),
+                            "method": item["method"],
+                            "params": item.get("params"),
+                            "response": {
+                                k: v for k, v in result.items() if k != "id"
+                            },
+                        }
+                    )
+        return _Reply(body, response.status_code)
+
+    # GraphQL
+
+    def graphql(self, request: dict, raw: bytes, headers: dict) -> _Reply:
+        """Answer a GraphQL request."""
+        self._count("graphql")
+        if self.record_graphql:
+            return self._record_graphql(request, raw, headers)
+        query = request["query"]
+        variables = request.get("variables")
+        try:
+            fields = _root_fields(query)
+        except GraphQLSyntaxError as exc:
+            self._count("invalid")
+            return _Reply({"data": None, "errors": [exc.formatted]}, 400, self._headers)
+        if fields and all(field.startswith("__") for field in fields):
+            self._count("introspection")
+            return self._execute_graphql(query, variables, None)
+        if _GQL_EXECUTE in fields or _GQL_DRY_RUN in fields:
+            return self._simulate_graphql(query, variables, fields)
+        injected = self._inject(self.query_faults)
+        if injected:
+            return self._graphql_error(injected)
+        recorded = self._responses.get(_graphql_key(query, variables))
+        if recorded is None:
+            self._count("missed")
+            return self._reply(
+                {"data": None, "errors": [{"message": "No recorded response"}]}
+            )
+        self._count("replayed")
+        return self._reply(recorded)
+
+    def _reply(self, body: Any, status: int = 200) -> _Reply:
+        return _Reply(body, status, self._headers)
+
+    def _graphql_error(self, kind: str) -> _Reply:
+        if kind == "http":
+            return _Reply(None, 503)
+        return self._reply({"data": None, "errors": [{"message": _INJECTED}]})
+
+    def _execute_graphql(
+        self, query: str, variables: Optional[dict], root_value: Any
+    ) -> _Reply:
+        """Execute the document on the recorded schema."""
+        if self._schema is None:
+            return self._reply({"data": None, "errors": [{"message": "No schema"}]})
+        result = graphql_sync(
+            self._schema, query, root_value=root_value, variable_values=variables
+        )
+        body: dict = {"data": result.data}
+        if result.errors:
+            body["errors"] = [error.formatted for error in result.errors]
+        return self._reply(body)
+
+    def _simulate_graphql(
+        self, query: str, variables: Optional[dict], fields: list[str]
+    ) -> _Reply:
+        injected = self._inject(self.tx_faults)
+        if injected in ("error", "http"):
+            return self._graphql_error(injected)
+        failure = _INJECTED if injected else None
+
+        def execute(_info, txBytes: str, **_kwargs) -> dict:
+            self._count("executed")
+            return {
+                "errors": [failure] if failure else None,
+                "effects": {
+                    "status": "FAILURE" if failure else "SUCCESS",
+                    "lamportVersion": next(self._lamport),
+                    "transactionBlock": {"digest": transaction_digest(txBytes)},
+                },
+            }
+
+        def dry_run(_info, **_kwargs) -> dict:
+            self._count("dry_run")
+            return {"error": failure, "results": [], "transaction": None}
+
+        if _GQL_DRY_RUN in fields and _GQL_DRY_RUN in self._templates:
+            # The recorded dry run stands in for any transaction
+            self._count("dry_run")
+            body = copy.deepcopy(self._templates[_GQL_DRY_RUN])
+            if failure:
+                for result in body["data"].values():
+                    result["error"] = failure
+            return self._reply(body)
+        return self._execute_graphql(
+            query, variables, {_GQL_EXECUTE: execute, _GQL_DRY_RUN: dry_run}
+        )
+
+    # JSON RPC
+
+    def jsonrpc_batch(self, requests: list, raw: bytes, headers: dict) -> _Reply:
+        """Answer a JSON RPC batch, recorder mode proxies the batch once."""
+        if self.record_jsonrpc:
+            self._count(*["jsonrpc"] * len(requests))
+            return self._record_jsonrpc(requests, raw, headers)
+        replies = [self.jsonrpc(item, raw, headers) for item in requests]
+        failed = next((reply for reply in replies if reply.status != 200), None)
+        return failed or _Reply([reply.body for reply in replies])
+
+    def jsonrpc(self, request: dict, raw: bytes, headers: dict) -> _Reply:
+        """Answer a JSON RPC request."""
+        self._count("jsonrpc")
+        if self.record_jsonrpc:
+            return self._record_jsonrpc(request, raw, headers)
+        method = request.get("method")
+        params = request.get("params")
+        simulated = method in (_RPC_EXECUTE, _RPC_DRY_RUN)
+        injected = self._inject(self.tx_faults if simulated else self.query_faults)
+        if injected == "http":
+            return _Reply(None, 503)
+        if injected == "error" or (injected and not simulated):
+            return self._jsonrpc_reply(
+                request, {"error": {"code": -32000, "message": _INJECTED}}
+            )
+        if simulated:
+            return self._jsonrpc_reply(
+                request, {"result": self._simulate_jsonrpc(method, params, injected)}
+            )
+        recorded = self._responses.get(_jsonrpc_key(method, params))
+        if recorded is None:
+            self._count("missed")
+            return self._jsonrpc_reply(
+                request,
+                {"error": {"code": -32601, "message": "No recorded response"}},
+            )
+        self._count("replayed")
+        return self._jsonrpc_reply(request, recorded)
+
+    @staticmethod
+    def _jsonrpc_reply(request: dict, response: dict) -> _Reply:
+        return _Reply({"jsonrpc": "2.0", "id": request.get("id"), **response})
+
+    def _simulate_jsonrpc(
+        self, method: str, params: list, injected: Optional[str]
+    ) -> dict:
+        """Recorded or minimal execute and dry run results for the transaction."""
+        self._count("executed" if method == _RPC_EXECUTE else "dry_run")
+        digest = transaction_digest(params[0])
+        template = self._templates.get(method)
+        if template:
+            result = copy.deepcopy(template.get("result") or {})
+        else:
+            result = {"effects": {}, "events": [], "objectChanges": []}
+            if method == _RPC_EXECUTE:
+                result["confirmedLocalExecution"] = True
+        if method == _RPC_EXECUTE:
+            result["digest"] = digest
+        effects = result.setdefault("effects", {})
+        effects["transactionDigest"] = digest
+        effects["status"] = (
+            {"status": "failure", "error": _INJECTED}
+            if injected
+            else {"status": "success"}
+        )
+        return result
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Dispatches posts to the stand-in by protocol."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        standin: StandInServer = self.server.standin
+        raw = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        headers = dict(self.headers.items())
+        try:
+            reply = self._dispatch(standin, json.loads(raw), raw, headers)
+        except (
+            UnicodeDecodeError,
+            json.JSONDecodeError,
+            AttributeError,
+            KeyError,
+            TypeError,
+        ) as exc:
+            # Malformed request
+            reply = _Reply({"error": f"{exc.__class__.__name__}: {exc}"}, 400)
+        except (ValueError, httpx.HTTPError) as exc:
+            reply = _Reply({"error": str(exc)}, 502)
+        payload = b"" if reply.body is None else json.dumps(reply.body).encode()
+        self.send_response(reply.status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for key, value in reply.headers.items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    @staticmethod
+    def _dispatch(
+        standin: StandInServer, request: Any, raw: bytes, headers: dict
+    ) -> _Reply:
+        if isinstance(request, list):
+            return standin.jsonrpc_batch(request, raw, headers)
+        if "query" in request:
+            return standin.graphql(request, raw, headers)
+        return standin.jsonrpc(request, raw, headers)
+
+    def log_message(self, *args):
+        pass
+
+
+def main():
+    """Run the stand-in until interrupted."""
+    parser = argparse.ArgumentParser(description="Sui GraphQL and JSON RPC stand-in")
+    parser.add_argument("fixtures", type=Path, help="Fixtures directory")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9000)
+    parser.add_argument("--latency", type=float, default=0.0, help="Tx seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Tx seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Tx 0..1")
+    parser.add_argument("--error-kind", choices=_ERROR_KINDS, default="failure")
+    parser.add_argument("--query-latency", type=float, default=0.0)
+    parser.add_argument("--query-error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--record-graphql", metavar="URL")
+    parser.add_argument("--record-jsonrpc", metavar="URL")
+    args = parser.parse_args()
+    server = StandInServer(
+        args.fixtures,
+        host=args.host,
+        port=args.port,
+        tx_faults=Faults(args.latency, args.jitter, args.error_rate, args.error_kind),
+        query_faults=Faults(
+            args.query_latency, error_rate=args.query_error_rate, error_kind="error"
+        ),
+        record_graphql=args.record_graphql,
+        record_jsonrpc=args.record_jsonrpc,
+        seed=args.seed,
+    ).start()
+    print(f"Serving {args.fixtures} on {server.url}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+        print(json.dumps(server.stats))
+
+
+if __name__ == "__main__":
+    main()